@@ -3,13 +3,18 @@
 #
 
 import logging
+import tempfile
+import uuid
+from contextlib import ExitStack
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import awswrangler as wr
 import boto3
 import botocore
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from airbyte_cdk.destinations import Destination
 from awswrangler import _data_types
 from botocore.credentials import AssumeRoleCredentialFetcher, CredentialResolver, DeferredRefreshableCredentials, JSONFileCache
@@ -92,6 +97,99 @@ class AssumeRoleProvider(object):
         return role_session
 
 
+class ParquetPartFiles:
+    """
+    Streams the flushes of a table as row groups into one Parquet file per partition.
+
+    Files are written to local temporary files and uploaded to S3 once closed,
+    after which they still have to be registered in the Glue catalog, see `AwsHandler.commit_parquet_part_files`.
+    """
+
+    def __init__(
+        self,
+        session: boto3.Session,
+        path: str,
+        mode: str,
+        dtype: Dict[str, str],
+        partition_cols: List[str],
+        compression: Optional[str],
+    ) -> None:
+        self.path = path
+        self.mode = mode
+        self.compression = compression
+        # columns are sanitized the same way awswrangler does when writing to a glue table
+        self.dtype = {wr.catalog.sanitize_column_name(col): typ for col, typ in dtype.items()}
+        self.partition_cols = [wr.catalog.sanitize_column_name(col) for col in partition_cols]
+        self.columns_types: Dict[str, str] = {}
+        self.partitions_types: Dict[str, str] = {}
+        self.partitions_values: Dict[str, List[str]] = {}
+        self.paths: List[str] = []
+        self.size_bytes = 0
+
+        self._session = session
+        self._file_name = f"{uuid.uuid4().hex}.parquet"
+        self._files = ExitStack()
+        self._writers: Dict[str, pq.ParquetWriter] = {}
+        self._local_files: Dict[str, Any] = {}
+
+    def write(self, df: pd.DataFrame) -> None:
+        # data is casted like wr.s3.to_parquet does, with the _cast_pandas_column override above
+        df = _data_types.cast_pandas_with_athena_types(df=wr.catalog.sanitize_dataframe_columns_names(df=df), dtype=self.dtype)
+        if not self.columns_types:
+            self.columns_types, self.partitions_types = wr.catalog.extract_athena_types(
+                df=df, index=False, partition_cols=self.partition_cols, dtype=self.dtype
+            )
+
+        if not self.partition_cols:
+            self._write_partition(self.path, [], df)
+            return
+
+        for values, partition in df.groupby(self.partition_cols, sort=False):
+            values = [str(value) for value in (values if isinstance(values, tuple) else (values,))]
+            prefix = self.path + "".join(f"{col}={value}/" for col, value in zip(self.partition_cols, values))
+            self._write_partition(prefix, values, partition.drop(columns=self.partition_cols))
+
+    def _write_partition(self, prefix: str, values: List[str], df: pd.DataFrame) -> None:
+        writer = self._writers.get(prefix)
+        if writer is None:
+            schema = _data_types.pyarrow_schema_from_pandas(df=df, index=False, dtype=self.dtype)
+            file = self._files.enter_context(tempfile.TemporaryFile())
+            # same options as awswrangler uses for its parquet files
+            writer = pq.ParquetWriter(
+                where=file,
+                schema=schema,
+                compression="NONE" if self.compression is None else self.compression,
+                coerce_timestamps="ms",
+                flavor="spark",
+                version="1.0",
+                use_dictionary=True,
+                write_statistics=True,
+            )
+            self._writers[prefix] = writer
+            self._local_files[prefix + self._file_name] = file
+            self.paths.append(prefix + self._file_name)
+            if values:
+                self.partitions_values[prefix] = values
+
+        table = pa.Table.from_pandas(df=df, schema=writer.schema, preserve_index=False, safe=True)
+        writer.write_table(table)
+        self.size_bytes += table.nbytes
+
+    def close(self) -> List[str]:
+        """
+        Close all files, upload them and return their paths.
+        """
+        with self._files:
+            for writer in self._writers.values():
+                writer.close()
+            for path, file in self._local_files.items():
+                file.seek(0)
+                wr.s3.upload(local_file=file, path=path, use_threads=False, boto3_session=self._session)
+        self._writers = {}
+        self._local_files = {}
+        return self.paths
+
+
 class AwsHandler:
     def __init__(self, connector_config: ConnectorConfig, destination: Destination) -> None:
         self._config: ConnectorConfig = connector_config
@@ -273,6 +371,62 @@ class AwsHandler:
             partition_cols,
         )
 
+    def open_parquet_part_files(
+        self, database: str, table: str, dtype: Dict[str, str], partition_cols: List[str], mode: str
+    ) -> ParquetPartFiles:
+        if mode == "append":
+            # when appending, data is casted to the types of the existing table like awswrangler does
+            catalog_types = wr.catalog.get_table_types(database=database, table=table, boto3_session=self._session)
+            if catalog_types:
+                dtype = {**dtype, **catalog_types}
+
+        return ParquetPartFiles(
+            self._session,
+            self._get_s3_path(database, table),
+            mode,
+            dtype,
+            partition_cols,
+            self._get_compression_type(self._config.compression_codec),
+        )
+
+    def commit_parquet_part_files(self, part_files: ParquetPartFiles, database: str, table: str) -> None:
+        """
+        Close the part files and register them in the Glue catalog, replacing the data of the table in overwrite mode.
+        """
+        paths = part_files.close()
+        if not paths:
+            return
+
+        self._create_database_if_not_exists(database)
+
+        if part_files.mode == "overwrite":
+            stale_paths = [path for path in wr.s3.list_objects(part_files.path, boto3_session=self._session) if path not in paths]
+            if stale_paths:
+                logger.info(f"Deleting {len(stale_paths)} objects overwritten in {part_files.path}")
+                wr.s3.delete_objects(path=stale_paths, boto3_session=self._session)
+
+        wr.catalog.create_parquet_table(
+            database=database,
+            table=table,
+            path=part_files.path,
+            columns_types=part_files.columns_types,
+            table_type=self._table_type,
+            partitions_types=part_files.partitions_types,
+            compression=part_files.compression,
+            mode=part_files.mode,
+            catalog_versioning=True,
+            boto3_session=self._session,
+        )
+        if part_files.partitions_values:
+            wr.catalog.add_parquet_partitions(
+                database=database,
+                table=table,
+                partitions_values=part_files.partitions_values,
+                compression=part_files.compression,
+                boto3_session=self._session,
+                columns_types=part_files.columns_types,
+            )
+
     def upsert(self, df: pd.DataFrame, database: str, table: str, dtype: Dict[str, str], partition_cols: list):
         path = self._get_s3_path(database, table)
         return self._write(
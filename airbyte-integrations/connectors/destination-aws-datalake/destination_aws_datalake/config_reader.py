@@ -4,6 +4,8 @@
 
 import enum
 
+from .constants import DEFAULT_BUFFER_MEMORY_BUDGET_MB
+
 
 class CredentialsType(enum.Enum):
     IAM_ROLE = "IAM Role"
@@ -92,6 +94,7 @@ class ConnectorConfig:
         table_name: str = None,
         format: dict = {},
         partitioning: str = None,
+        buffer_memory_budget_mb: int = DEFAULT_BUFFER_MEMORY_BUDGET_MB,
     ):
         self.aws_account_id = aws_account_id
         self.credentials = credentials
@@ -108,6 +111,9 @@ class ConnectorConfig:
 
         self.format_type = OutputFormat.from_string(format.get("format_type", OutputFormat.PARQUET.value))
         self.compression_codec = CompressionCodec.from_config(format.get("compression_codec", CompressionCodec.UNCOMPRESSED.value))
+        self.part_file_size_mb = format.get("part_file_size_mb", 0)
+
+        self.buffer_memory_budget_mb = buffer_memory_budget_mb
 
         self.partitioning = PartitionOptions.from_string(partitioning)
 
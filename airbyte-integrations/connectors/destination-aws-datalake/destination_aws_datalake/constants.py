@@ -5,6 +5,9 @@
 EMPTY_VALUES = ["", " ", "#N/A", "#N/A N/A", "#NA", "<NA>", "N/A", "NA", "NULL", "none", "None", "NaN", "n/a", "nan", "null", "[]", "{}"]
 BOOLEAN_VALUES = ["true", "1", "1.0", "t", "y", "yes"]
 
+# Records of all streams are buffered in memory up to this estimated size before the largest buffer is flushed
+DEFAULT_BUFFER_MEMORY_BUDGET_MB = 256
+
 PANDAS_TYPE_MAPPING = {
     "string": "string",
     "integer": "Int64",
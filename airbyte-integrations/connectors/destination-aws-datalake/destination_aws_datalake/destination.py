@@ -5,7 +5,7 @@
 import logging
 import random
 import string
-from typing import Any, Dict, Iterable, Mapping
+from typing import Any, Dict, Iterable, List, Mapping
 
 import pandas as pd
 from airbyte_cdk.destinations import Destination
@@ -18,15 +18,22 @@ from .stream_writer import StreamWriter
 
 logger = logging.getLogger("airbyte")
 
-# Flush records every 25000 records to limit memory consumption
-RECORD_FLUSH_INTERVAL = 25000
-
 
 class DestinationAwsDatalake(Destination):
     def _flush_streams(self, streams: Dict[str, StreamWriter]) -> None:
         for stream in streams:
             streams[stream].flush()
 
+    @staticmethod
+    def _release_states(streams: Dict[str, StreamWriter], pending_states: Dict[str, List[AirbyteMessage]]) -> Iterable[AirbyteMessage]:
+        """
+        Yield the state messages held back for the streams whose records are all registered in the catalog.
+        """
+        for stream, states in pending_states.items():
+            if states and streams[stream].is_persisted:
+                yield from states
+                states.clear()
+
     @staticmethod
     def _get_random_string(length: int) -> str:
         return "".join(random.choice(string.ascii_letters) for i in range(length))
@@ -63,6 +70,14 @@ class DestinationAwsDatalake(Destination):
             for s in configured_catalog.streams
         }
 
+        # Records are flushed from the stream with the largest buffer whenever the buffers exceed the memory budget
+        memory_budget_bytes = connector_config.buffer_memory_budget_mb * 1024 * 1024
+        buffered_bytes = 0
+
+        # Streams writing part files only register records in the catalog when a part file is closed,
+        # their state messages are held back until then
+        pending_states: Dict[str, List[AirbyteMessage]] = {stream: [] for stream in streams}
+
         for message in input_messages:
             if message.type == Type.STATE and message.state.type == AirbyteStateType.STREAM:
                 state_stream = message.state.stream
@@ -78,8 +93,14 @@ class DestinationAwsDatalake(Destination):
                 # Flush records when state is received
                 else:
                     stream = state_stream.stream_descriptor.name
-                    if stream in streams:
+                    if stream in streams and streams[stream].streams_part_files:
+                        if not streams[stream].is_persisted:
+                            logger.debug(f"Got state message from source: holding it until the part files of {stream} are closed")
+                            pending_states[stream].append(message)
+                            continue
+                    elif stream in streams:
                         logger.info(f"Got state message from source: flushing records for {stream}")
+                        buffered_bytes -= streams[stream].buffer_size_bytes
                         streams[stream].flush(partial=True)
                     else:
                         logger.warning(f"Trying to flush stream {stream} that is not in the configured catalog")
@@ -89,19 +110,22 @@ class DestinationAwsDatalake(Destination):
             elif message.type == Type.RECORD:
                 data = message.record.data
                 stream = message.record.stream
-                streams[stream].append_message(data)
+                buffered_bytes += streams[stream].append_message(data)
 
-                # Flush records every RECORD_FLUSH_INTERVAL records to limit memory consumption
-                # Records will either get flushed when a state message is received or when hitting the RECORD_FLUSH_INTERVAL
-                if len(streams[stream]._messages) > RECORD_FLUSH_INTERVAL:
-                    logger.debug(f"Reached size limit: flushing records for {stream}")
-                    streams[stream].flush(partial=True)
+                # Records will either get flushed when a state message is received or when the buffers exceed the memory budget
+                if buffered_bytes >= memory_budget_bytes:
+                    largest = max(streams.values(), key=lambda writer: writer.buffer_size_bytes)
+                    logger.debug(f"Reached memory budget: flushing {largest.buffer_size_bytes} bytes of records for {largest._table}")
+                    buffered_bytes -= largest.buffer_size_bytes
+                    largest.flush(partial=True)
+                    yield from self._release_states(streams, pending_states)
 
             else:
                 logger.info(f"Unhandled message type {message.type}: {message}")
 
         # Flush all or remaining records
         self._flush_streams(streams)
+        yield from self._release_states(streams, pending_states)
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
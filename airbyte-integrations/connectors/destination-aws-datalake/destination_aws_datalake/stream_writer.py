@@ -4,15 +4,17 @@
 
 import json
 import logging
+import sys
 from datetime import date, datetime
 from decimal import Decimal, getcontext
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from airbyte_cdk.models import ConfiguredAirbyteStream, DestinationSyncMode
 
-from .aws import AwsHandler
-from .config_reader import ConnectorConfig, PartitionOptions
+from .aws import AwsHandler, ParquetPartFiles
+from .config_reader import ConnectorConfig, OutputFormat, PartitionOptions
 from .constants import EMPTY_VALUES, GLUE_TYPE_MAPPING_DECIMAL, GLUE_TYPE_MAPPING_DOUBLE, PANDAS_TYPE_MAPPING
 
 # By default we set glue decimal type to decimal(28,25)
@@ -20,6 +22,9 @@ from .constants import EMPTY_VALUES, GLUE_TYPE_MAPPING_DECIMAL, GLUE_TYPE_MAPPIN
 getcontext().prec = 25
 logger = logging.getLogger("airbyte")
 
+# The size of every record would be costly to measure, only one record out of this many is measured
+RECORD_SIZE_SAMPLING_INTERVAL = 100
+
 
 class DictEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -36,6 +41,88 @@ class DictEncoder(json.JSONEncoder):
         return super(DictEncoder, self).default(obj)
 
 
+def _estimate_size(value: Any) -> int:
+    """
+    Rough estimate of the memory used by a value parsed from JSON.
+    """
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(key) + _estimate_size(val) for key, val in value.items())
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(_estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _to_none(value: Any) -> None:
+    return None
+
+
+def _to_string(value: Any) -> Optional[str]:
+    return str(value) if value else None
+
+
+def _to_numeric(value: Any) -> Any:
+    """
+    Scalar equivalent of `pd.to_numeric(value, errors="coerce")` that skips pandas for the common cases.
+    """
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        if "_" not in value:
+            try:
+                return int(value)
+            except ValueError:
+                pass
+            try:
+                return float(value)
+            except ValueError:
+                pass
+        return np.nan
+    if value is None:
+        return np.nan
+    return pd.to_numeric(value, errors="coerce")
+
+
+def _to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value)) if value else Decimal("0")
+
+
+def _to_utc_timestamp(value: Any) -> Any:
+    """
+    Scalar equivalent of `pd.to_datetime(value, errors="coerce", utc=True)` that skips the overhead of `pd.to_datetime`.
+    """
+    if value is None:
+        return None
+    try:
+        timestamp = pd.Timestamp(value)
+    except (TypeError, ValueError, OverflowError):
+        return pd.NaT
+    if timestamp is pd.NaT:
+        return timestamp
+    return timestamp.tz_localize("UTC") if timestamp.tzinfo is None else timestamp.tz_convert("UTC")
+
+
+def _to_string_column(values: List[Any]) -> pd.Series:
+    return pd.Series([str(value) if value else None for value in values], dtype=object)
+
+
+def _to_numeric_column(values: List[Any]) -> pd.Series:
+    return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+
+
+def _to_boolean_column(values: List[Any]) -> pd.Series:
+    return pd.Series([bool(value) for value in values], dtype=bool)
+
+
+def _to_utc_timestamp_column(values: List[Any]) -> pd.Series:
+    # booleans are not dates, but the cache of pd.to_datetime would parse them like the integers they compare equal to
+    values = [None if isinstance(value, bool) else value for value in values]
+    return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce", utc=True, format="mixed")
+
+
 class StreamWriter:
     def __init__(self, aws_handler: AwsHandler, config: ConnectorConfig, configured_stream: ConfiguredAirbyteStream) -> None:
         self._aws_handler: AwsHandler = aws_handler
@@ -50,6 +137,24 @@ class StreamWriter:
 
         self._messages = []
         self._partial_flush_count = 0
+        self._buffer_size_bytes = 0
+        self._sampled_records = 0
+        self._sampled_bytes = 0
+
+        self._part_files: Optional[ParquetPartFiles] = None
+        self._part_file_size_bytes = self._config.part_file_size_mb * 1024 * 1024
+        if self._part_file_size_bytes and self._config.lakeformation_governed_tables:
+            logger.warning(
+                f"Part files are not supported for governed tables, writing one file per flush to {self._database}:{self._table}"
+            )
+
+        # The casts only depend on the schema, so they are compiled once instead of walking the schema for every record
+        self._value_casters: Dict[str, Callable[[Any], Any]] = {
+            key: self._compile_value_caster(schema_entry) for key, schema_entry in self._schema.items()
+        }
+        self._column_casters: Dict[str, Callable[[List[Any]], pd.Series]] = {
+            key: self._compile_column_caster(schema_entry) for key, schema_entry in self._schema.items()
+        }
 
         logger.info(f"Creating StreamWriter for {self._database}:{self._table}")
 
@@ -98,81 +203,104 @@ class StreamWriter:
 
         return fields
 
-    def _drop_additional_top_level_properties(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def _compile_value_caster(self, schema_entry: Dict[str, Any]) -> Callable[[Any], Any]:
         """
-        Helper that removes any unexpected top-level properties from the record.
-        Since the json schema is used to build the table and cast types correctly,
-        we need to remove any unexpected properties that can't be casted accurately.
+        Build the function casting a single value of the given schema entry, nested values included.
+        Casting fixes obvious type violations that may cause issues when casting data to pyarrow types. Such as:
+        - Objects having empty strings or " " or "-" as value instead of null or {}
+        - Arrays having empty strings or " " or "-" as value instead of null or []
         """
-        schema_keys = self._schema.keys()
-        records_keys = record.keys()
-        difference = list(set(records_keys).difference(set(schema_keys)))
-
-        for key in difference:
-            del record[key]
-
-        return record
-
-    def _json_schema_cast_value(self, value, schema_entry) -> Any:
-        typ = schema_entry.get("type")
-        typ = self._get_json_schema_type(typ)
-        props = schema_entry.get("properties")
-        items = schema_entry.get("items")
+        typ = self._get_json_schema_type(schema_entry.get("type"))
 
         if typ == "string":
-            format = schema_entry.get("format")
-            if format == "date-time":
-                return pd.to_datetime(value, errors="coerce", utc=True)
-
-            return str(value) if value and value != "" else None
+            if schema_entry.get("format") == "date-time":
+                return _to_utc_timestamp
+            return _to_string
 
         elif typ == "integer":
-            return pd.to_numeric(value, errors="coerce")
+            return _to_numeric
 
         elif typ == "number":
-            if self._config.glue_catalog_float_as_decimal:
-                return Decimal(str(value)) if value else Decimal("0")
-            return pd.to_numeric(value, errors="coerce")
+            return _to_decimal if self._config.glue_catalog_float_as_decimal else _to_numeric
 
         elif typ == "boolean":
-            return bool(value)
+            return bool
 
         elif typ == "null":
-            return None
+            return _to_none
 
         elif typ == "object":
-            if value in EMPTY_VALUES:
-                return None
+            props = schema_entry.get("properties")
+            prop_casters = {key: self._compile_value_caster(val) for key, val in props.items()} if props else {}
 
-            if isinstance(value, dict) and props:
-                for key, val in value.items():
-                    if key in props:
-                        value[key] = self._json_schema_cast_value(val, props[key])
+            def cast_object(value: Any) -> Any:
+                if value in EMPTY_VALUES:
+                    return None
+
+                if isinstance(value, dict) and prop_casters:
+                    for key, val in value.items():
+                        if key in prop_casters:
+                            value[key] = prop_casters[key](val)
                 return value
 
-        elif typ == "array" and items:
-            if value in EMPTY_VALUES:
-                return None
+            return cast_object
 
-            if isinstance(value, list):
-                return [self._json_schema_cast_value(item, items) for item in value]
+        elif typ == "array" and isinstance(schema_entry.get("items"), dict) and schema_entry["items"]:
+            cast_item = self._compile_value_caster(schema_entry["items"])
 
-        return value
+            def cast_array(value: Any) -> Any:
+                if value in EMPTY_VALUES:
+                    return None
+
+                if isinstance(value, list):
+                    return [cast_item(item) for item in value]
+                return value
+
+            return cast_array
+
+        return _identity
+
+    def _compile_column_caster(self, schema_entry: Dict[str, Any]) -> Callable[[List[Any]], pd.Series]:
+        """
+        Build the function casting all values of a top-level column at once, using vectorized pandas operations
+        where the type allows it. Values end up the same as when cast one by one with `_compile_value_caster`.
+        """
+        typ = self._get_json_schema_type(schema_entry.get("type"))
+
+        if typ == "string":
+            if schema_entry.get("format") == "date-time":
+                return _to_utc_timestamp_column
+            return _to_string_column
+
+        elif typ == "integer" or (typ == "number" and not self._config.glue_catalog_float_as_decimal):
+            return _to_numeric_column
+
+        elif typ == "boolean":
+            return _to_boolean_column
+
+        cast_value = self._compile_value_caster(schema_entry)
+        return lambda values: pd.Series([cast_value(value) for value in values], dtype=object)
+
+    def _json_schema_cast_value(self, value, schema_entry) -> Any:
+        return self._compile_value_caster(schema_entry)(value)
 
     def _json_schema_cast(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Helper that fixes obvious type violations in a record's top level keys that may
-        cause issues when casting data to pyarrow types. Such as:
-        - Objects having empty strings or " " or "-" as value instead of null or {}
-        - Arrays having empty strings or " " or "-" as value instead of null or []
+        Helper that casts the top level keys of a single record, see `_compile_value_caster`.
         """
-        for key, schema_type in self._schema.items():
-            typ = self._schema[key].get("type")
-            typ = self._get_json_schema_type(typ)
-            record[key] = self._json_schema_cast_value(record.get(key), schema_type)
+        for key, cast in self._value_casters.items():
+            record[key] = cast(record.get(key))
 
         return record
 
+    def _to_dataframe(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Build a DataFrame with the schema's columns from raw records, casting one whole column at a time.
+        Properties that are not part of the schema are dropped since they can't be casted accurately.
+        """
+        columns = {key: cast([record.get(key) for record in records]) for key, cast in self._column_casters.items()}
+        return pd.DataFrame(columns)
+
     def _get_non_null_json_schema_types(self, typ: Union[str, List[str]]) -> Union[str, List[str]]:
         if isinstance(typ, list):
             return list(filter(lambda x: x != "null", typ))
@@ -367,10 +495,42 @@ class StreamWriter:
     def _cursor_fields(self) -> Optional[List[str]]:
         return self._configured_stream.cursor_field
 
-    def append_message(self, message: Dict[str, Any]):
-        clean_message = self._drop_additional_top_level_properties(message)
-        clean_message = self._json_schema_cast(clean_message)
-        self._messages.append(clean_message)
+    @property
+    def streams_part_files(self) -> bool:
+        return (
+            self._part_file_size_bytes > 0
+            and self._config.format_type == OutputFormat.PARQUET
+            and not self._config.lakeformation_governed_tables
+            and self._sync_mode in [DestinationSyncMode.overwrite, DestinationSyncMode.append]
+        )
+
+    @property
+    def buffer_size_bytes(self) -> int:
+        """
+        Estimated memory used by the records buffered since the last flush.
+        """
+        return self._buffer_size_bytes
+
+    @property
+    def is_persisted(self) -> bool:
+        """
+        Whether all records appended so far are written to S3 and registered in the catalog.
+        """
+        return not self._messages and self._part_files is None
+
+    def append_message(self, message: Dict[str, Any]) -> int:
+        """
+        Buffer a record and return its estimated size in memory.
+        """
+        if len(self._messages) % RECORD_SIZE_SAMPLING_INTERVAL == 0:
+            self._sampled_records += 1
+            self._sampled_bytes += _estimate_size(message)
+        size = self._sampled_bytes // self._sampled_records
+        self._buffer_size_bytes += size
+
+        # records are casted column by column when flushing
+        self._messages.append(message)
+        return size
 
     def reset(self):
         logger.info(f"Deleting table {self._database}:{self._table}")
@@ -382,12 +542,14 @@ class StreamWriter:
     def flush(self, partial: bool = False):
         logger.debug(f"Flushing {len(self._messages)} messages to table {self._database}:{self._table}")
 
-        df = pd.DataFrame(self._messages)
+        df = self._to_dataframe(self._messages)
         # best effort to convert pandas types
         df = df.astype(self._get_pandas_dtypes_from_json_schema(df), errors="ignore")
 
         if len(df) < 1:
             logger.info(f"No messages to write to {self._database}:{self._table}")
+            if not partial:
+                self._commit_part_files()
             return
 
         partition_fields = {}
@@ -412,7 +574,14 @@ class StreamWriter:
             if col in df.columns:
                 df[col] = df[col].apply(lambda x: json.dumps(x, cls=DictEncoder))
 
-        if self._sync_mode == DestinationSyncMode.overwrite and self._partial_flush_count < 1:
+        if self.streams_part_files:
+            if self._part_files is None:
+                mode = "overwrite" if self._sync_mode == DestinationSyncMode.overwrite and self._partial_flush_count < 1 else "append"
+                self._part_files = self._aws_handler.open_parquet_part_files(self._database, self._table, dtype, partition_fields, mode)
+            logger.debug(f"Streaming {len(df)} records to part files of {self._database}:{self._table}")
+            self._part_files.write(df)
+
+        elif self._sync_mode == DestinationSyncMode.overwrite and self._partial_flush_count < 1:
             logger.debug(f"Overwriting {len(df)} records to {self._database}:{self._table}")
             self._aws_handler.write(
                 df,
@@ -439,5 +608,17 @@ class StreamWriter:
         if partial:
             self._partial_flush_count += 1
 
+        if self._part_files is not None and (not partial or self._part_files.size_bytes >= self._part_file_size_bytes):
+            self._commit_part_files()
+
         del df
         self._messages.clear()
+        self._buffer_size_bytes = 0
+
+    def _commit_part_files(self) -> None:
+        if self._part_files is None:
+            return
+
+        logger.info(f"Closing part files of {self._database}:{self._table} ({self._part_files.size_bytes} bytes)")
+        self._aws_handler.commit_parquet_part_files(self._part_files, self._database, self._table)
+        self._part_files = None
@@ -2,12 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
 from typing import Any, Mapping
+from unittest.mock import patch
 
+import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from destination_aws_datalake import DestinationAwsDatalake
-from destination_aws_datalake.aws import AwsHandler
+from destination_aws_datalake.aws import AwsHandler, ParquetPartFiles
 from destination_aws_datalake.config_reader import CompressionCodec, ConnectorConfig
 
 
@@ -53,3 +57,26 @@ def test_get_path_prefix(config_prefix: Mapping[str, Any]):
     tbl = "append_stream"
     db = conf.lakeformation_database_name
     assert aws_handler._get_s3_path(db, tbl) == "s3://datalake-bucket/prefix/test/append_stream/"
+
+
+def test_parquet_part_files_are_uploaded_once_closed():
+    uploaded = {}
+
+    def upload(local_file, path, **kwargs):
+        uploaded[path] = pq.read_table(io.BytesIO(local_file.read())).to_pydict()
+
+    part_files = ParquetPartFiles(None, "s3://bucket/table/", "append", {"id": "bigint"}, ["day"], "snappy")
+    with patch("awswrangler.s3.upload", side_effect=upload) as upload_mock:
+        part_files.write(pd.DataFrame({"id": [1, 2], "day": ["2024-01-01", "2024-01-02"]}))
+        part_files.write(pd.DataFrame({"id": [3], "day": ["2024-01-01"]}))
+        upload_mock.assert_not_called()
+        paths = part_files.close()
+
+    assert [path.rsplit("/", 1)[0] for path in paths] == ["s3://bucket/table/day=2024-01-01", "s3://bucket/table/day=2024-01-02"]
+    assert [uploaded[path] for path in paths] == [{"id": [1, 3]}, {"id": [2]}]
+    assert part_files.columns_types == {"id": "bigint"}
+    assert part_files.partitions_types == {"day": "string"}
+    assert part_files.partitions_values == {
+        "s3://bucket/table/day=2024-01-01/": ["2024-01-01"],
+        "s3://bucket/table/day=2024-01-02/": ["2024-01-02"],
+    }
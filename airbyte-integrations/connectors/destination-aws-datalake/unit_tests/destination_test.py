@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+from typing import Any, Mapping
+from unittest.mock import MagicMock, patch
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStream,
+    AirbyteStreamState,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    StreamDescriptor,
+    SyncMode,
+    Type,
+)
+from destination_aws_datalake import DestinationAwsDatalake
+
+
+@pytest.fixture(name="config")
+def config() -> Mapping[str, Any]:
+    with open("unit_tests/fixtures/config.json", "r") as f:
+        return json.loads(f.read())
+
+
+def get_catalog(*names: str) -> ConfiguredAirbyteCatalog:
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}, "value": {"type": "string"}}}
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=name, json_schema=schema, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for name in names
+        ]
+    )
+
+
+def record(stream: str, id: int) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, data={"id": id, "value": "x" * 100}, emitted_at=0))
+
+
+def state(stream: str, position: int) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name=stream), stream_state={"position": position}),
+        ),
+    )
+
+
+@patch("destination_aws_datalake.destination.AwsHandler")
+def test_write_flushes_largest_buffer_over_memory_budget(aws_handler_class, config: Mapping[str, Any]):
+    aws_handler = aws_handler_class.return_value
+    destination = DestinationAwsDatalake()
+
+    config = {**config, "buffer_memory_budget_mb": 1}
+    messages = [record("small", i) for i in range(10)] + [record("large", i) for i in range(10000)]
+    list(destination.write(config, get_catalog("small", "large"), messages))
+
+    # the large stream is flushed whenever the budget is exceeded, the small one only at the end
+    flushed_sizes = [len(call.args[0]) for call in aws_handler.append.call_args_list]
+    assert len(flushed_sizes) > 2
+    assert flushed_sizes[-1] + flushed_sizes[-2] < 10010
+    assert sum(flushed_sizes) == 10010
+    assert 10 in flushed_sizes
+
+
+@patch("destination_aws_datalake.destination.AwsHandler")
+def test_write_holds_states_until_part_files_are_committed(aws_handler_class, config: Mapping[str, Any]):
+    aws_handler = aws_handler_class.return_value
+    aws_handler.open_parquet_part_files.return_value = MagicMock(size_bytes=0)
+    destination = DestinationAwsDatalake()
+
+    config = {**config, "format": {**config["format"], "part_file_size_mb": 1}}
+    messages = [record("stream", 1), state("stream", 1), record("stream", 2), state("stream", 2)]
+    output = destination.write(config, get_catalog("stream"), messages)
+
+    assert list(output) == [messages[1], messages[3]]
+    aws_handler.commit_parquet_part_files.assert_called_once()
@@ -6,9 +6,11 @@ import json
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, Mapping
+from unittest.mock import MagicMock
 
 import numpy as np
 import pandas as pd
+import pytest
 from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
 from destination_aws_datalake import DestinationAwsDatalake
 from destination_aws_datalake.aws import AwsHandler
@@ -729,6 +731,60 @@ def test_json_schema_cast_bad_values():
     assert pd.isna(created_time)
 
 
+def test_to_dataframe():
+    connector_config = ConnectorConfig(**get_config())
+    aws_handler = AwsHandler(connector_config, DestinationAwsDatalake())
+    writer = StreamWriter(aws_handler, connector_config, get_camelcase_configured_stream())
+
+    records = [
+        {
+            "Id": "1",
+            "domain": 12,
+            "sparse": "true",
+            "ExchangeRate": "1.33",
+            "MetaData": {"CreateTime": "2023-02-09T10:36:39-08:00"},
+            "Line": [{"Amount": "137973.66", "JournalEntryLineDetail": ""}],
+            "unknown": "dropped",
+        },
+        {"Id": "", "ExchangeRate": "hello", "CurrencyRef": " ", "airbyte_cursor": "2023-06-15T16:08:39-07:00"},
+    ]
+
+    df = writer._to_dataframe(records)
+
+    assert list(df.columns) == list(writer._schema.keys())
+    assert len(df) == 2
+    assert list(df["Id"]) == ["1", None]
+    assert list(df["domain"]) == ["12", None]
+    assert list(df["sparse"]) == [True, False]
+    assert list(df["Adjustment"]) == [False, False]
+    assert df["ExchangeRate"][0] == 1.33
+    assert np.isnan(df["ExchangeRate"][1])
+    assert df["MetaData"][0] == {"CreateTime": pd.to_datetime("2023-02-09T10:36:39-08:00", utc=True)}
+    assert df["MetaData"][1] is None
+    assert df["Line"][0] == [{"Amount": 137973.66, "JournalEntryLineDetail": None}]
+    assert df["CurrencyRef"][1] is None
+    assert list(df["airbyte_cursor"]) == [None, "2023-06-15T16:08:39-07:00"]
+
+
+def test_to_dataframe_matches_json_schema_cast():
+    writer = get_writer(get_config())
+    records = [
+        {"string_col": "test", "int_col": 1, "datetime_col": "2021-01-01T00:00:00Z", "date_col": "2021-01-01"},
+        {"string_col": "", "int_col": "2", "datetime_col": "2021-01-01T10:00:00+02:00", "date_col": None},
+        {"int_col": "x", "datetime_col": "hello"},
+        {"string_col": 3, "datetime_col": False},
+    ]
+
+    df = writer._to_dataframe([dict(record) for record in records])
+    expected = pd.DataFrame([writer._json_schema_cast(dict(record)) for record in records])
+
+    for col in expected.columns:
+        assert (
+            df[col].astype(object).where(df[col].notna(), None).tolist()
+            == expected[col].astype(object).where(expected[col].notna(), None).tolist()
+        )
+
+
 def test_json_dict_encoder():
     dt = "2023-08-01T23:32:11Z"
     dt = pd.to_datetime(dt, utc=True)
@@ -755,3 +811,76 @@ def test_json_dict_encoder():
         json.dumps(input, cls=DictEncoder)
         == '{"boolean": false, "integer": 1, "float": 2.0, "decimal": "13.232", "datetime": "2023-08-01T23:32:11Z", "date": "2023-08-01", "timestamp": "2023-08-01T23:32:11Z", "nested": {"boolean": false, "datetime": "2023-08-01T23:32:11Z", "very_nested": {"boolean": false, "datetime": "2023-08-01T23:32:11Z"}}}'
     )
+
+
+def test_append_message_buffer_size():
+    writer = get_writer(get_config())
+    writer._aws_handler = MagicMock()
+
+    size = writer.append_message({"string_col": "test", "int_col": 1})
+    assert size > 0
+    writer.append_message({"string_col": "test", "int_col": 2})
+    assert writer.buffer_size_bytes == 2 * size
+
+    writer.flush(partial=True)
+    assert writer.buffer_size_bytes == 0
+    assert writer.is_persisted
+    writer._aws_handler.append.assert_called_once()
+
+
+def test_flush_part_files():
+    config = get_config()
+    config["format"]["part_file_size_mb"] = 1
+    writer = get_writer(config)
+    writer._aws_handler = MagicMock()
+    part_files = writer._aws_handler.open_parquet_part_files.return_value
+    part_files.size_bytes = 0
+    assert writer.streams_part_files
+
+    writer.append_message({"string_col": "test", "int_col": 1, "datetime_col": "2022-01-01T00:00:00Z"})
+    writer.flush(partial=True)
+    writer.append_message({"string_col": "test", "int_col": 2, "datetime_col": "2022-01-01T00:00:00Z"})
+    writer.flush(partial=True)
+
+    # part files stay open until they reach the configured size
+    writer._aws_handler.open_parquet_part_files.assert_called_once()
+    assert writer._aws_handler.open_parquet_part_files.call_args.args[-1] == "append"
+    assert part_files.write.call_count == 2
+    writer._aws_handler.commit_parquet_part_files.assert_not_called()
+    writer._aws_handler.append.assert_not_called()
+    assert not writer.is_persisted
+
+    part_files.size_bytes = 1024 * 1024
+    writer.append_message({"string_col": "test", "int_col": 3, "datetime_col": "2022-01-01T00:00:00Z"})
+    writer.flush(partial=True)
+    writer._aws_handler.commit_parquet_part_files.assert_called_once_with(part_files, "test", "append_stream")
+    assert writer.is_persisted
+
+    # the final flush closes the remaining part files even without new records
+    part_files.size_bytes = 0
+    writer.append_message({"string_col": "test", "int_col": 4, "datetime_col": "2022-01-01T00:00:00Z"})
+    writer.flush(partial=True)
+    writer.flush()
+    assert writer._aws_handler.commit_parquet_part_files.call_count == 2
+    assert writer.is_persisted
+
+
+def test_part_files_not_used_for_governed_tables():
+    config = get_config()
+    config["format"]["part_file_size_mb"] = 1
+    config["lakeformation_governed_tables"] = True
+    assert not get_writer(config).streams_part_files
+
+
+@pytest.mark.parametrize(
+    "sync_mode, streams_part_files",
+    [(DestinationSyncMode.overwrite, True), (DestinationSyncMode.append, True), (DestinationSyncMode.append_dedup, False)],
+)
+def test_part_files_only_used_for_overwrite_and_append(sync_mode, streams_part_files):
+    config = get_config()
+    config["format"]["part_file_size_mb"] = 1
+    configured_stream = get_configured_stream()
+    configured_stream.destination_sync_mode = sync_mode
+    connector_config = ConnectorConfig(**config)
+    writer = StreamWriter(AwsHandler(connector_config, DestinationAwsDatalake()), connector_config, configured_stream)
+    assert writer.streams_part_files is streams_part_files
@@ -0,0 +1,72 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+from typing import Any, List, Sequence
+
+import pyarrow as pa
+
+
+class ArrowRecordBuffer:
+    """
+    Accumulates rows for a single stream as a list of `pyarrow.RecordBatch` objects.
+
+    Rows are staged column-by-column in plain Python lists and sealed into an immutable record batch
+    every `batch_rows` rows, so the Python-side staging area never grows beyond one batch. The buffer
+    keeps an estimate of its size in bytes so the caller can flush it as soon as a threshold is reached.
+    """
+
+    def __init__(self, schema: pa.Schema, batch_rows: int):
+        if batch_rows <= 0:
+            raise ValueError(f"batch_rows must be a positive integer, got {batch_rows}")
+        self.schema = schema
+        self.batch_rows = batch_rows
+        self._batches: List[pa.RecordBatch] = []
+        self._sealed_bytes = 0
+        self._sealed_rows = 0
+        self._reset_columns()
+
+    def _reset_columns(self) -> None:
+        self._columns: List[List[Any]] = [[] for _ in self.schema.names]
+        self._pending_rows = 0
+        self._pending_bytes = 0
+
+    @property
+    def num_rows(self) -> int:
+        return self._sealed_rows + self._pending_rows
+
+    @property
+    def num_bytes(self) -> int:
+        """Estimated size of the buffered data: exact for sealed batches, payload size for pending rows."""
+        return self._sealed_bytes + self._pending_bytes
+
+    def append(self, row: Sequence[Any], size_hint: int = 0) -> None:
+        """
+        Add one row to the buffer. `row` must follow the field order of the schema and `size_hint` is the
+        approximate payload size of the row in bytes, used for flush decisions until the row is sealed.
+        """
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        self._pending_rows += 1
+        self._pending_bytes += size_hint
+        if self._pending_rows >= self.batch_rows:
+            self._seal()
+
+    def _seal(self) -> None:
+        if not self._pending_rows:
+            return
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(self._columns, self.schema)],
+            schema=self.schema,
+        )
+        self._batches.append(batch)
+        self._sealed_rows += batch.num_rows
+        self._sealed_bytes += batch.nbytes
+        self._reset_columns()
+
+    def drain(self) -> pa.Table:
+        """Return everything buffered so far as a table (zero-copy over the sealed batches) and empty the buffer."""
+        self._seal()
+        table = pa.Table.from_batches(self._batches, schema=self.schema)
+        self._batches = []
+        self._sealed_rows = 0
+        self._sealed_bytes = 0
+        return table
@@ -5,9 +5,8 @@ import json
 import os
 import re
 import uuid
-from collections import defaultdict
 from logging import getLogger
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Dict, Iterable, Mapping, Optional
 
 import duckdb
 import pyarrow as pa
@@ -16,11 +15,29 @@ import logging
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
 
+from .buffer import ArrowRecordBuffer
+from .typed_table import TypedTable
 
 logger = getLogger("airbyte")
 
 CONFIG_MOTHERDUCK_API_KEY = "motherduck_api_key"
 CONFIG_DEFAULT_SCHEMA = "main"
+CONFIG_TYPED_TABLES = "typed_tables"
+
+# Number of rows sealed into a single Arrow record batch.
+RECORD_BATCH_ROWS = 10_000
+# A stream is flushed to DuckDB once it buffers this many rows, even without a STATE message.
+MAX_BUFFER_ROWS = 500_000
+# All streams are flushed to DuckDB once the buffers hold this many bytes in total.
+MAX_BUFFER_BYTES = 256 * 1024 * 1024
+
+RAW_TABLE_SCHEMA = pa.schema(
+    [
+        pa.field("_airbyte_ab_id", pa.string()),
+        pa.field("_airbyte_emitted_at", pa.string()),
+        pa.field("_airbyte_data", pa.string()),
+    ]
+)
 
 
 def validated_sql_name(sql_name: Any) -> str:
@@ -91,35 +108,46 @@ class DestinationDuckdb(Destination):
 
         con.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
 
-        for configured_stream in configured_catalog.streams:
-            name = configured_stream.stream.name
-            table_name = f"_airbyte_raw_{name}"
-            if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
-                # delete the tables
-                logger.info(f"Dropping tables for overwrite: {table_name}")
-                query = f"DROP TABLE IF EXISTS {schema_name}.{table_name}"
-                con.execute(query)
-            # create the table if needed
-            query = f"""
-            CREATE TABLE IF NOT EXISTS {schema_name}.{table_name} (
-                _airbyte_ab_id TEXT PRIMARY KEY,
-                _airbyte_emitted_at DATETIME,
-                _airbyte_data JSON
-            )
-            """
+        typed_tables: Dict[str, TypedTable] = {}
+        if config.get(CONFIG_TYPED_TABLES, False):
+            for configured_stream in configured_catalog.streams:
+                name = configured_stream.stream.name
+                typed_table = TypedTable(schema_name, name, configured_stream.stream.json_schema)
+                if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
+                    logger.info(f"Dropping tables for overwrite: {typed_table.qualified_name}")
+                    con.execute(f"DROP TABLE IF EXISTS {typed_table.qualified_name}")
+                con.execute(typed_table.create_table_query())
+                # an existing table may predate properties recently added to the stream schema
+                for query in typed_table.add_columns_queries():
+                    con.execute(query)
+                typed_tables[name] = typed_table
+        else:
+            for configured_stream in configured_catalog.streams:
+                name = configured_stream.stream.name
+                table_name = f"_airbyte_raw_{name}"
+                if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
+                    # delete the tables
+                    logger.info(f"Dropping tables for overwrite: {table_name}")
+                    query = f"DROP TABLE IF EXISTS {schema_name}.{table_name}"
+                    con.execute(query)
+                # create the table if needed
+                query = f"""
+                CREATE TABLE IF NOT EXISTS {schema_name}.{table_name} (
+                    _airbyte_ab_id TEXT PRIMARY KEY,
+                    _airbyte_emitted_at DATETIME,
+                    _airbyte_data JSON
+                )
+                """
 
-            con.execute(query)
+                con.execute(query)
 
-        buffer = defaultdict(lambda: defaultdict(list))
+        buffers: Dict[str, ArrowRecordBuffer] = {}
 
         for message in input_messages:
             if message.type == Type.STATE:
                 # flush the buffer
-                for stream_name in buffer.keys():
-                    logger.info(f"flushing buffer for state: {message}")
-                    DestinationDuckdb._safe_write(con=con, buffer=buffer, schema_name=schema_name, stream_name=stream_name)
-
-                buffer = defaultdict(lambda: defaultdict(list))
+                logger.info(f"flushing buffer for state: {message}")
+                DestinationDuckdb._flush_buffers(con=con, buffers=buffers, schema_name=schema_name, typed_tables=typed_tables)
 
                 yield message
             elif message.type == Type.RECORD:
@@ -128,24 +156,72 @@ class DestinationDuckdb(Destination):
                 if stream_name not in streams:
                     logger.debug(f"Stream {stream_name} was not present in configured streams, skipping")
                     continue
+                typed_table = typed_tables.get(stream_name)
+                if stream_name not in buffers:
+                    arrow_schema = typed_table.arrow_schema if typed_table else RAW_TABLE_SCHEMA
+                    buffers[stream_name] = ArrowRecordBuffer(arrow_schema, batch_rows=RECORD_BATCH_ROWS)
+                buffer = buffers[stream_name]
                 # add to buffer
-                buffer[stream_name]["_airbyte_ab_id"].append(str(uuid.uuid4()))
-                buffer[stream_name]["_airbyte_emitted_at"].append(datetime.datetime.now().isoformat())
-                buffer[stream_name]["_airbyte_data"].append(json.dumps(data))
+                if typed_table:
+                    row, size = typed_table.to_row(data)
+                    buffer.append(row, size_hint=size)
+                else:
+                    json_data = json.dumps(data)
+                    buffer.append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json_data), size_hint=len(json_data))
+
+                if buffer.num_rows >= MAX_BUFFER_ROWS:
+                    logger.info(f"flushing buffer for stream {stream_name}: {buffer.num_rows} rows buffered")
+                    DestinationDuckdb._write_buffer(
+                        con=con, buffer=buffer, schema_name=schema_name, stream_name=stream_name, typed_table=typed_table
+                    )
+                elif sum(b.num_bytes for b in buffers.values()) >= MAX_BUFFER_BYTES:
+                    logger.info(f"flushing all buffers: buffer size exceeded {MAX_BUFFER_BYTES} bytes")
+                    DestinationDuckdb._flush_buffers(con=con, buffers=buffers, schema_name=schema_name, typed_tables=typed_tables)
 
             else:
                 logger.info(f"Message type {message.type} not supported, skipping")
 
         # flush any remaining messages
-        for stream_name in buffer.keys():
-            DestinationDuckdb._safe_write(con=con, buffer=buffer, schema_name=schema_name, stream_name=stream_name)
+        DestinationDuckdb._flush_buffers(con=con, buffers=buffers, schema_name=schema_name, typed_tables=typed_tables)
+
+    @staticmethod
+    def _flush_buffers(
+        *, con: duckdb.DuckDBPyConnection, buffers: Dict[str, ArrowRecordBuffer], schema_name: str, typed_tables: Dict[str, TypedTable]
+    ):
+        for stream_name, buffer in buffers.items():
+            if buffer.num_rows:
+                DestinationDuckdb._write_buffer(
+                    con=con, buffer=buffer, schema_name=schema_name, stream_name=stream_name, typed_table=typed_tables.get(stream_name)
+                )
 
     @staticmethod
-    def _safe_write(*, con: duckdb.DuckDBPyConnection, buffer: Dict[str, Dict[str, List[Any]]], schema_name: str, stream_name: str):
+    def _write_buffer(
+        *,
+        con: duckdb.DuckDBPyConnection,
+        buffer: ArrowRecordBuffer,
+        schema_name: str,
+        stream_name: str,
+        typed_table: Optional[TypedTable],
+    ):
+        if typed_table:
+            DestinationDuckdb._write_typed(con=con, pa_table=buffer.drain(), typed_table=typed_table)
+        else:
+            DestinationDuckdb._safe_write(con=con, pa_table=buffer.drain(), schema_name=schema_name, stream_name=stream_name)
+
+    @staticmethod
+    def _write_typed(*, con: duckdb.DuckDBPyConnection, pa_table: pa.Table, typed_table: TypedTable):
+        # DuckDB will automatically find and SELECT from the `pa_table`
+        # argument of this method.
+        con.sql(typed_table.insert_query("pa_table"))
+
+    @staticmethod
+    def _safe_write(*, con: duckdb.DuckDBPyConnection, pa_table: pa.Table, schema_name: str, stream_name: str):
         table_name = f"_airbyte_raw_{stream_name}"
         try:
-            pa_table = pa.Table.from_pydict(buffer[stream_name])
-        except:
+            # DuckDB will automatically find and SELECT from the `pa_table`
+            # argument of this method.
+            con.sql(f"INSERT INTO {schema_name}.{table_name} SELECT * FROM pa_table")
+        except duckdb.Error:
             logger.exception(
                 f"Writing with pyarrow view failed, falling back to writing with executemany. Expect some performance degradation."
             )
@@ -154,14 +230,10 @@ class DestinationDuckdb(Destination):
                 (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
             VALUES (?,?,?)
             """
-            entries_to_write = buffer[stream_name]
+            entries_to_write = pa_table.to_pydict()
             con.executemany(
                 query, zip(entries_to_write["_airbyte_ab_id"], entries_to_write["_airbyte_emitted_at"], entries_to_write["_airbyte_data"])
             )
-        else:
-            # DuckDB will automatically find and SELECT from the `pa_table`
-            # local variable defined above.
-            con.sql(f"INSERT INTO {schema_name}.{table_name} SELECT * FROM pa_table")
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -0,0 +1,228 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import datetime
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+import pyarrow as pa
+
+AB_ID_COLUMN = "_airbyte_ab_id"
+EMITTED_AT_COLUMN = "_airbyte_emitted_at"
+ADDITIONAL_PROPERTIES_COLUMN = "_airbyte_additional_properties"
+METADATA_COLUMNS = (AB_ID_COLUMN, EMITTED_AT_COLUMN, ADDITIONAL_PROPERTIES_COLUMN)
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+class _Mismatch(Exception):
+    """Raised by a column converter when a value does not fit the column type."""
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a column or table name for DuckDB, escaping embedded double quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    """Quote a string literal for DuckDB, escaping embedded single quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _convert_string(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    raise _Mismatch()
+
+
+def _convert_integer(value: Any) -> Any:
+    if isinstance(value, int) and not isinstance(value, bool) and INT64_MIN <= value <= INT64_MAX:
+        return value
+    if isinstance(value, float) and value.is_integer() and INT64_MIN <= value <= INT64_MAX:
+        return int(value)
+    raise _Mismatch()
+
+
+def _convert_number(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    raise _Mismatch()
+
+
+def _convert_boolean(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    raise _Mismatch()
+
+
+def _convert_json(value: Any) -> Any:
+    return json.dumps(value)
+
+
+@dataclass(frozen=True)
+class ColumnType:
+    """
+    How a JSON schema type is stored: `arrow_type` is the type of the staged Arrow column, `duckdb_type` the type
+    of the final column. When they differ (e.g. ISO date strings), the value is cast by DuckDB on insert.
+    """
+
+    duckdb_type: str
+    arrow_type: pa.DataType
+    convert: Callable[[Any], Any]
+    cast_on_insert: bool = False
+
+
+STRING = ColumnType("VARCHAR", pa.string(), _convert_string)
+INTEGER = ColumnType("BIGINT", pa.int64(), _convert_integer)
+NUMBER = ColumnType("DOUBLE", pa.float64(), _convert_number)
+BOOLEAN = ColumnType("BOOLEAN", pa.bool_(), _convert_boolean)
+DATE = ColumnType("DATE", pa.string(), _convert_string, cast_on_insert=True)
+TIMESTAMP_WITH_TIMEZONE = ColumnType("TIMESTAMPTZ", pa.string(), _convert_string, cast_on_insert=True)
+TIMESTAMP_WITHOUT_TIMEZONE = ColumnType("TIMESTAMP", pa.string(), _convert_string, cast_on_insert=True)
+JSON = ColumnType("JSON", pa.string(), _convert_json)
+
+
+def column_type_from_json_schema(property_schema: Mapping[str, Any]) -> ColumnType:
+    """Map the JSON schema of a single property to the DuckDB column type used to store it."""
+    json_type = property_schema.get("type")
+    if isinstance(json_type, list):
+        non_null_types = [t for t in json_type if t != "null"]
+        json_type = non_null_types[0] if len(non_null_types) == 1 else None
+
+    if json_type == "string":
+        string_format = property_schema.get("format")
+        if string_format == "date":
+            return DATE
+        if string_format == "date-time":
+            if property_schema.get("airbyte_type") == "timestamp_without_timezone":
+                return TIMESTAMP_WITHOUT_TIMEZONE
+            return TIMESTAMP_WITH_TIMEZONE
+        return STRING
+    if json_type == "integer" or (json_type == "number" and property_schema.get("airbyte_type") == "integer"):
+        return INTEGER
+    if json_type == "number":
+        return NUMBER
+    if json_type == "boolean":
+        return BOOLEAN
+    # objects, arrays, unions and untyped properties are kept as JSON
+    return JSON
+
+
+class TypedTable:
+    """
+    Typed destination table derived from a stream's JSON schema.
+
+    Each top-level property becomes a column. Values that do not match their column type, and fields missing from
+    the schema, are written to the `_airbyte_additional_properties` JSON column so no data is lost.
+    """
+
+    def __init__(self, schema_name: str, table_name: str, json_schema: Mapping[str, Any]):
+        self.schema_name = schema_name
+        self.table_name = table_name
+        self.columns: Dict[str, ColumnType] = {}
+
+        seen = {name.lower() for name in METADATA_COLUMNS}
+        for name, property_schema in (json_schema.get("properties") or {}).items():
+            # DuckDB identifiers are case-insensitive, colliding properties go to the overflow column
+            if name.lower() in seen:
+                continue
+            seen.add(name.lower())
+            self.columns[name] = column_type_from_json_schema(property_schema or {})
+
+        self._converters: List[Tuple[str, Callable[[Any], Any]]] = [(name, ct.convert) for name, ct in self.columns.items()]
+        self.arrow_schema = pa.schema(
+            [
+                pa.field(AB_ID_COLUMN, pa.string()),
+                pa.field(EMITTED_AT_COLUMN, pa.timestamp("us")),
+                *[pa.field(name, ct.arrow_type) for name, ct in self.columns.items()],
+                pa.field(ADDITIONAL_PROPERTIES_COLUMN, pa.string()),
+            ]
+        )
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.schema_name}.{quote_identifier(self.table_name)}"
+
+    def create_table_query(self) -> str:
+        column_definitions = ",\n".join(
+            [
+                f"{AB_ID_COLUMN} TEXT PRIMARY KEY",
+                f"{EMITTED_AT_COLUMN} TIMESTAMP",
+                *[f"{quote_identifier(name)} {ct.duckdb_type}" for name, ct in self.columns.items()],
+                f"{ADDITIONAL_PROPERTIES_COLUMN} JSON",
+            ]
+        )
+        return f"CREATE TABLE IF NOT EXISTS {self.qualified_name} (\n{column_definitions}\n)"
+
+    def add_columns_queries(self) -> List[str]:
+        """Queries adding columns that appeared in the schema since an existing table was created."""
+        return [
+            f"ALTER TABLE {self.qualified_name} ADD COLUMN IF NOT EXISTS {quote_identifier(name)} {ct.duckdb_type}"
+            for name, ct in self.columns.items()
+        ]
+
+    def insert_query(self, arrow_table_name: str) -> str:
+        """
+        Query inserting the staged Arrow table `arrow_table_name`. Columns staged as strings are cast by DuckDB, and
+        values that fail to cast are moved to the additional properties column instead of being dropped.
+        """
+        names = [field.name for field in self.arrow_schema]
+        select_list = []
+        failed_casts = []
+        for name in names:
+            column_type = self.columns.get(name)
+            if column_type is not None and column_type.cast_on_insert:
+                cast = f"TRY_CAST({quote_identifier(name)} AS {column_type.duckdb_type})"
+                select_list.append(cast)
+                failed_casts.append(
+                    f"CASE WHEN {quote_identifier(name)} IS NOT NULL AND {cast} IS NULL "
+                    f"THEN json_object({quote_literal(name)}, {quote_identifier(name)}) ELSE '{{}}' END"
+                )
+            elif name == ADDITIONAL_PROPERTIES_COLUMN and failed_casts:
+                additional_properties = f"COALESCE({ADDITIONAL_PROPERTIES_COLUMN}, '{{}}')"
+                for failed_cast in failed_casts:
+                    additional_properties = f"json_merge_patch({additional_properties}, {failed_cast})"
+                select_list.append(f"NULLIF(CAST({additional_properties} AS VARCHAR), '{{}}')")
+            else:
+                select_list.append(quote_identifier(name))
+        return (
+            f"INSERT INTO {self.qualified_name} ({', '.join(quote_identifier(n) for n in names)}) "
+            f"SELECT {', '.join(select_list)} FROM {arrow_table_name}"
+        )
+
+    def to_row(self, data: Mapping[str, Any]) -> Tuple[List[Any], int]:
+        """
+        Convert a record to a row following `arrow_schema`, returning it along with an approximate size in bytes.
+        """
+        row: List[Any] = [str(uuid.uuid4()), datetime.datetime.now()]
+        size = 0
+        overflow = None
+        for name, convert in self._converters:
+            value = data.get(name)
+            if value is not None:
+                try:
+                    value = convert(value)
+                    size += len(value) if isinstance(value, str) else 8
+                except _Mismatch:
+                    if overflow is None:
+                        overflow = {}
+                    overflow[name] = value
+                    value = None
+            row.append(value)
+
+        unknown_fields = data.keys() - self.columns.keys()
+        if unknown_fields:
+            if overflow is None:
+                overflow = {}
+            for name in unknown_fields:
+                overflow[name] = data[name]
+
+        if overflow:
+            overflow_json = json.dumps(overflow)
+            size += len(overflow_json)
+            row.append(overflow_json)
+        else:
+            row.append(None)
+        return row, size
@@ -1,13 +1,27 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 from __future__ import annotations
 
+import json
 import os
 import tempfile
 from unittest.mock import Mock, patch
+import duckdb
 import pytest
-from destination_duckdb.destination import CONFIG_DEFAULT_SCHEMA, DestinationDuckdb, validated_sql_name
+from destination_duckdb import destination as destination_module
+from destination_duckdb.buffer import ArrowRecordBuffer
+from destination_duckdb.destination import CONFIG_DEFAULT_SCHEMA, RAW_TABLE_SCHEMA, DestinationDuckdb, validated_sql_name
 
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Status, Type
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    Status,
+    SyncMode,
+    Type,
+)
 
 
 def test_validated_sql_name() -> None:
@@ -49,3 +63,83 @@ def test_write(mock_connect, mock_makedirs) -> None:
     result = list(destination.write(config, catalog, messages))
     assert len(result) == 1
     assert result[0].type == Type.STATE
+
+
+def test_arrow_record_buffer_seals_batches() -> None:
+    buffer = ArrowRecordBuffer(RAW_TABLE_SCHEMA, batch_rows=2)
+    for i in range(5):
+        buffer.append((str(i), "2024-01-01T00:00:00", f'{{"i": {i}}}'), size_hint=8)
+    assert buffer.num_rows == 5
+    assert len(buffer._batches) == 2
+    assert buffer.num_bytes > 0
+
+    table = buffer.drain()
+    assert table.num_rows == 5
+    assert table.column("_airbyte_ab_id").to_pylist() == ["0", "1", "2", "3", "4"]
+    assert buffer.num_rows == 0
+    assert buffer.num_bytes == 0
+
+
+def test_write_flushes_when_row_threshold_is_reached(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(destination_module, "RECORD_BATCH_ROWS", 2)
+    monkeypatch.setattr(destination_module, "MAX_BUFFER_ROWS", 3)
+    monkeypatch.setattr(DestinationDuckdb, "_get_destination_path", staticmethod(lambda path: path))
+    path = str(tmp_path / "test.duckdb")
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="users", json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+        ]
+    )
+    messages = [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": i}, emitted_at=0)) for i in range(7)
+    ]
+
+    with patch.object(DestinationDuckdb, "_safe_write", wraps=DestinationDuckdb._safe_write) as safe_write:
+        list(DestinationDuckdb().write({"destination_path": path}, catalog, messages))
+
+    assert [call.kwargs["pa_table"].num_rows for call in safe_write.call_args_list] == [3, 3, 1]
+    con = duckdb.connect(database=path, read_only=False)
+    assert con.execute("SELECT count(*) FROM main._airbyte_raw_users").fetchone()[0] == 7
+
+
+def test_write_typed_tables(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(DestinationDuckdb, "_get_destination_path", staticmethod(lambda path: path))
+    path = str(tmp_path / "test.duckdb")
+    json_schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": ["null", "string"]},
+            "score": {"type": "number"},
+            "created_at": {"type": "string", "format": "date-time"},
+            "address": {"type": "object"},
+        },
+    }
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="users", json_schema=json_schema, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+        ]
+    )
+    records = [
+        {"id": 1, "name": "alice", "score": 1.5, "created_at": "2024-01-01T00:00:00+00:00", "address": {"city": "Paris"}},
+        {"id": 2, "name": None, "score": 2, "created_at": "not a date", "nickname": "bob"},
+    ]
+    messages = [AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data=data, emitted_at=0)) for data in records]
+
+    list(DestinationDuckdb().write({"destination_path": path, "typed_tables": True}, catalog, messages))
+
+    con = duckdb.connect(database=path, read_only=False)
+    rows = con.execute(
+        "SELECT id, name, score, created_at IS NOT NULL, address->>'city', _airbyte_additional_properties FROM main.users ORDER BY id"
+    ).fetchall()
+    assert rows[0] == (1, "alice", 1.5, True, "Paris", None)
+    assert rows[1][:5] == (2, None, 2.0, False, None)
+    assert json.loads(rows[1][5]) == {"nickname": "bob", "created_at": "not a date"}
@@ -1,7 +1,10 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
+import json
+
 import pytest
 from destination_duckdb.destination import DestinationDuckdb, validated_sql_name
+from destination_duckdb.typed_table import TypedTable, column_type_from_json_schema
 
 
 def test_read_invalid_path():
@@ -32,3 +35,41 @@ def test_validated_sql_name(input, expected):
             validated_sql_name(input)
     else:
         assert validated_sql_name(input) == expected
+
+
+@pytest.mark.parametrize(
+    "property_schema, expected",
+    [
+        ({"type": "string"}, "VARCHAR"),
+        ({"type": ["null", "string"], "format": "date"}, "DATE"),
+        ({"type": "string", "format": "date-time"}, "TIMESTAMPTZ"),
+        ({"type": "string", "format": "date-time", "airbyte_type": "timestamp_without_timezone"}, "TIMESTAMP"),
+        ({"type": ["null", "integer"]}, "BIGINT"),
+        ({"type": "number", "airbyte_type": "integer"}, "BIGINT"),
+        ({"type": "number"}, "DOUBLE"),
+        ({"type": "boolean"}, "BOOLEAN"),
+        ({"type": "object"}, "JSON"),
+        ({"type": "array", "items": {"type": "string"}}, "JSON"),
+        ({"type": ["string", "integer"]}, "JSON"),
+        ({}, "JSON"),
+    ],
+)
+def test_column_type_from_json_schema(property_schema, expected):
+    assert column_type_from_json_schema(property_schema).duckdb_type == expected
+
+
+def test_typed_table_to_row_keeps_unknown_and_mismatched_fields():
+    table = TypedTable(
+        "main",
+        "users",
+        {"properties": {"id": {"type": "integer"}, "name": {"type": "string"}, "tags": {"type": "array"}, "ID": {"type": "string"}}},
+    )
+    assert list(table.columns) == ["id", "name", "tags"]
+
+    row, size = table.to_row({"id": "not-a-number", "name": "alice", "tags": ["a"], "ID": "x", "extra": 1})
+    assert row[2:5] == [None, "alice", '["a"]']
+    assert json.loads(row[5]) == {"id": "not-a-number", "ID": "x", "extra": 1}
+    assert size > 0
+
+    row, _ = table.to_row({"id": 1})
+    assert row[2:] == [1, None, None, None]
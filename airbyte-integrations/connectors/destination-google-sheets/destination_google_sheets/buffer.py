@@ -6,20 +6,25 @@
 from typing import Any, Mapping
 
 from airbyte_cdk import AirbyteLogger
-from airbyte_cdk.models import AirbyteStream
+from airbyte_cdk.models import AirbyteStream, DestinationSyncMode
 
 
 class WriteBufferMixin:
 
     # Default instance of AirbyteLogger
     logger = AirbyteLogger()
-    # intervals after which the records_buffer should be cleaned up for selected stream
+    # intervals after which the records_buffer should be cleaned up
     flush_interval = 500  # records count
-    flush_interval_size_in_kb = 10 ^ 8  # memory allocation ~ 97656 Kb or 95 Mb
+    flush_interval_size_in_kb = 1024  # size of the buffered values, Google recommends requests of 2 Mb at most
 
     def __init__(self):
         # Buffer for input records
         self.records_buffer = {}
+        # Size of the values buffered for each stream, in bytes
+        self.records_buffer_size = {}
+        # Totals across all streams, kept up to date to avoid summing the buffers for every record
+        self.buffered_records_count = 0
+        self.buffered_size = 0
         # Placeholder for streams metadata
         self.stream_info = {}
 
@@ -40,10 +45,14 @@ class WriteBufferMixin:
         """
         stream = configured_stream.stream
         self.records_buffer[stream.name] = []
+        self.records_buffer_size[stream.name] = 0
         self.stream_info[stream.name] = {
             "headers": sorted(list(stream.json_schema.get("properties").keys())),
             "is_set": False,
+            "primary_key": None,
         }
+        if configured_stream.destination_sync_mode == DestinationSyncMode.append_dedup and configured_stream.primary_key:
+            self.stream_info[stream.name]["primary_key"] = configured_stream.primary_key[0][0]
 
     def add_to_buffer(self, stream_name: str, record: Mapping):
         """
@@ -57,12 +66,21 @@ class WriteBufferMixin:
         norm_record = self._normalize_record(stream_name, record)
         norm_values = list(map(str, norm_record.values()))
         self.records_buffer[stream_name].append(norm_values)
+        # each value is sent as a JSON string, quotes and separator included
+        size = sum(len(value) + 3 for value in norm_values)
+        self.records_buffer_size[stream_name] += size
+        self.buffered_records_count += 1
+        self.buffered_size += size
 
     def clear_buffer(self, stream_name: str):
         """
         Cleans up the `records_buffer` values, belonging to input stream.
         """
-        self.records_buffer[stream_name].clear()
+        self.buffered_records_count -= len(self.records_buffer[stream_name])
+        self.buffered_size -= self.records_buffer_size[stream_name]
+        # a new list is used, the previous one may still be referenced by a request
+        self.records_buffer[stream_name] = []
+        self.records_buffer_size[stream_name] = 0
 
     def _normalize_record(self, stream_name: str, record: Mapping) -> Mapping[str, Any]:
         """
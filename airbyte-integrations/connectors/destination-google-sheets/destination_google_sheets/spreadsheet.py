@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import List, Mapping
+import re
+from typing import Any, List, Mapping, Tuple
 
 from pygsheets import Spreadsheet, Worksheet
 from pygsheets.client import Client as pygsheets_client
@@ -49,6 +50,75 @@ class GoogleSheets:
         if headers_list:
             stream.update_row(1, headers_list)
 
+    @staticmethod
+    def range_name(stream: Worksheet, cell: str) -> str:
+        """
+        Returns the A1 notation of the cell in the target worksheet, e.g. `'stream_1'!A2`.
+        """
+        title = stream.title.replace("'", "''")
+        return f"'{title}'!{cell}"
+
+    def append_values(self, stream: Worksheet, values: List[List[str]]) -> int:
+        """
+        Appends the rows after the data of the target worksheet, starting from the cell `A2`.
+        Returns: the index of the last row written.
+        """
+        response = self.client.sheet.values_append(
+            self.spreadsheet_id, values, "ROWS", range=self.range_name(stream, "A2"), insertDataOption="INSERT_ROWS"
+        )
+        # updatedRange looks like `'stream_1'!A2:C501`
+        return int(re.search(r"(\d+)$", response["updates"]["updatedRange"]).group(1))
+
+    def batch_update_values(self, data: List[Mapping[str, Any]]):
+        """
+        Writes several ranges, of one or several worksheets, with a single `values.batchUpdateByDataFilter` request.
+        Each item of `data` is a ValueRange: {"range": "'stream_1'!A2:B3", "majorDimension": "ROWS", "values": [[...], ...]}
+        The range must cover all the values, the request fails otherwise.
+        """
+        data_filters = [
+            {
+                "dataFilter": {"a1Range": value_range["range"]},
+                "majorDimension": value_range["majorDimension"],
+                "values": value_range["values"],
+            }
+            for value_range in data
+        ]
+        self.client.sheet.values_batch_update_by_data_filter(self.spreadsheet_id, data_filters)
+
+    def grow_worksheets(self, dimensions_to_add: List[Tuple[Worksheet, int, int]]):
+        """
+        Appends empty rows and columns to several worksheets with a single `batchUpdate` request.
+        `dimensions_to_add` lists the worksheets with the number of rows and columns to add to them.
+        """
+        requests = []
+        for stream, rows, cols in dimensions_to_add:
+            if rows > 0:
+                requests.append({"appendDimension": {"sheetId": stream.id, "dimension": "ROWS", "length": rows}})
+            if cols > 0:
+                requests.append({"appendDimension": {"sheetId": stream.id, "dimension": "COLUMNS", "length": cols}})
+        if requests:
+            self.client.sheet.batch_update(self.spreadsheet_id, requests)
+
+    def delete_rows(self, stream: Worksheet, rows_list: List[int]):
+        """
+        Deletes the rows, provided by `rows_list` as list of indexes, with a single `batchUpdate` request.
+        Consecutive rows are deleted as one range, from the bottom up so the indexes of the remaining ranges stay valid.
+        """
+        ranges: List[List[int]] = []
+        for row in sorted(set(rows_list)):
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+
+        requests = [
+            # the range of deleteDimension is zero-based, with an exclusive end index
+            {"deleteDimension": {"range": {"sheetId": stream.id, "dimension": "ROWS", "startIndex": start - 1, "endIndex": end}}}
+            for start, end in reversed(ranges)
+        ]
+        if requests:
+            self.client.sheet.batch_update(self.spreadsheet_id, requests)
+
     def index_cols(self, stream: Worksheet) -> Mapping[str, int]:
         """
         Helps to find the index of every colums exists in worksheet.
@@ -60,39 +130,3 @@ class GoogleSheets:
         for i, col in enumerate(header):
             col_index[col] = i + 1
         return col_index
-
-    def find_duplicates(self, stream: Worksheet, primary_key: str):
-        """
-        Finds the duplicated records inside of target worksheet.
-        Returns: List of indexes of rows to remove from target worksheet.
-            [1, 4, 5, ..., 99]
-        """
-        rows_unique_values, rows_to_delete = {}, []
-        pk_col_index = self.index_cols(stream)[primary_key]
-
-        # get all values except 0, because it's a header value
-        pk_col_values = stream.get_col(pk_col_index, include_tailing_empty=False)[1:]
-
-        for i, row_value in enumerate(pk_col_values, 2):
-            if row_value not in rows_unique_values:
-                rows_unique_values[row_value] = None
-            else:
-                rows_to_delete.append(i)
-
-        # reverse the order of the list
-        rows_to_delete.reverse()
-
-        return rows_to_delete
-
-    def remove_duplicates(self, stream: Worksheet, rows_list: list):
-        """
-        Removes duplicated rows, provided by `rows_list` as list of indexes.
-
-        We are working with delete operation in offline mode, to decrease the number of API calls.
-        1) Unlink the spreadsheet (make it for offline use)
-        2) Perform delete operation and update the actual row index
-        3) Link the spreadsheet (sync with online version) using batch_update method.
-        """
-        stream.unlink()
-        [stream.delete_rows(row, 1) for row in rows_list]
-        stream.link()
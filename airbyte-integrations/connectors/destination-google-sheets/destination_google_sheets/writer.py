@@ -3,23 +3,129 @@
 #
 
 
+import re
+from typing import Any, Dict, List, Mapping, Set, Tuple
+
 from airbyte_cdk.models import AirbyteStream
 from pygsheets import Worksheet
+from pygsheets.custom_types import ValueRenderOption
+from pygsheets.utils import format_addr
 
 from .buffer import WriteBufferMixin
 from .spreadsheet import GoogleSheets
 
+# the values written with `USER_ENTERED` which Google Sheets keeps as numbers
+NUMBER_PATTERN = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
 
 class GoogleSheetsWriter(WriteBufferMixin):
+
+    # worksheets are grown by at least this many rows at once (or their size, if smaller)
+    grow_rows_step = 10000
+
     def __init__(self, spreadsheet: GoogleSheets):
         self.spreadsheet = spreadsheet
+        # worksheet handles, opened once for every stream
+        self.worksheets: Dict[str, Worksheet] = {}
+        # grid size of the worksheets, as (rows, columns)
+        self.worksheets_size: Dict[str, Tuple[int, int]] = {}
+        # index of the next row to write, unknown until the first write for the streams appended to existing data
+        self.next_rows: Dict[str, int] = {}
+        # primary key values of the records of the deduplicated streams, in the worksheet or buffered
+        self.primary_key_indexes: Dict[str, Set[str]] = {}
         super().__init__()
 
+    def open_worksheet(self, stream_name: str) -> Worksheet:
+        """
+        Returns the worksheet belonging to the input stream, opened only once.
+        """
+        if stream_name not in self.worksheets:
+            stream: Worksheet = self.spreadsheet.open_worksheet(stream_name)
+            self.worksheets[stream_name] = stream
+            self.worksheets_size[stream_name] = (stream.rows, stream.cols)
+        return self.worksheets[stream_name]
+
     def delete_stream_entries(self, stream_name: str):
         """
         Deletes all the records belonging to the input stream.
         """
         self.spreadsheet.clean_worksheet(stream_name)
+        # records are written right after the headers
+        self.next_rows[stream_name] = 2
+        self.primary_key_indexes[stream_name] = set()
+
+    def add_to_buffer(self, stream_name: str, record: Mapping):
+        """
+        Populates input records to `records_buffer`.
+
+        For deduplicated streams, the records with a primary key that was already written or buffered are skipped,
+        so only the first record with a given primary key is kept.
+        """
+        primary_key = self.stream_info[stream_name]["primary_key"]
+        if primary_key:
+            primary_key_index = self.get_primary_key_index(stream_name)
+            value = self.primary_key_value(str(record[primary_key]) if primary_key in record else self.default_missing)
+            if value in primary_key_index:
+                return
+            primary_key_index.add(value)
+
+        super().add_to_buffer(stream_name, record)
+
+    @staticmethod
+    def primary_key_value(value: Any) -> str:
+        """
+        Returns the primary key value as Google Sheets keeps it, whether it is the value written or the unformatted value of a cell.
+        The values are written with `USER_ENTERED`, so Google Sheets keeps `007` as the number 7 or `True` as the boolean TRUE.
+        """
+        if isinstance(value, bool):
+            return str(value).upper()
+        if isinstance(value, (int, float)):
+            # Google Sheets keeps 15 significant digits
+            return format(value, ".15g")
+        value = str(value)
+        stripped_value = value.strip()
+        if stripped_value.upper() in ("TRUE", "FALSE"):
+            return stripped_value.upper()
+        if NUMBER_PATTERN.fullmatch(stripped_value):
+            return format(float(stripped_value), ".15g")
+        return value
+
+    def get_primary_key_index(self, stream_name: str) -> Set[str]:
+        """
+        Returns the primary key values of the records belonging to the input stream.
+
+        The index is built from the primary key column of the worksheet the first time it is needed,
+        removing the duplicated records already in the worksheet with a single request.
+        """
+        if stream_name in self.primary_key_indexes:
+            return self.primary_key_indexes[stream_name]
+
+        primary_key = self.stream_info[stream_name]["primary_key"]
+        stream: Worksheet = self.open_worksheet(stream_name)
+
+        primary_key_index, rows_to_remove = set(), []
+        # the primary key column is found from the headers of the worksheet, which may differ from the headers of the catalog
+        pk_col_index = self.spreadsheet.index_cols(stream).get(primary_key)
+        if pk_col_index:
+            # get all values except 0, because it's a header value
+            pk_col_values = stream.get_col(pk_col_index, include_tailing_empty=False, value_render=ValueRenderOption.UNFORMATTED_VALUE)[1:]
+            for i, row_value in enumerate(map(self.primary_key_value, pk_col_values), 2):
+                if row_value in primary_key_index:
+                    rows_to_remove.append(i)
+                else:
+                    primary_key_index.add(row_value)
+
+        if rows_to_remove:
+            self.logger.info(f"Duplicated records are found for stream: {stream_name}, resolving...")
+            self.spreadsheet.delete_rows(stream, rows_to_remove)
+            rows, cols = self.worksheets_size[stream_name]
+            self.worksheets_size[stream_name] = (rows - len(rows_to_remove), cols)
+            if stream_name in self.next_rows:
+                self.next_rows[stream_name] -= len(rows_to_remove)
+            self.logger.info(f"Finished deduplicating records for stream: {stream_name}")
+
+        self.primary_key_indexes[stream_name] = primary_key_index
+        return primary_key_index
 
     def check_headers(self, stream_name: str):
         """
@@ -34,60 +140,99 @@ class GoogleSheetsWriter(WriteBufferMixin):
         """
         Mimics `batch_write` operation using records_buffer.
 
-        1) gets data from the records_buffer, with respect to the size of the records_buffer (records count or size in Kb)
-        2) writes it to the target worksheet
-        3) cleans-up the records_buffer belonging to input stream
+        1) checks the records buffered across all streams, with respect to their count or size in Kb
+        2) writes the records of all streams to their target worksheets, with a single request
+        3) cleans-up the records_buffer
         """
-        # get the size of records_buffer for target stream in Kb
-        # TODO unit test flush triggers
-        records_buffer_size_in_kb = self.records_buffer[stream_name].__sizeof__() / 1024
-        if len(self.records_buffer[stream_name]) == self.flush_interval or records_buffer_size_in_kb > self.flush_interval_size_in_kb:
-            self.write_from_queue(stream_name)
-            self.clear_buffer(stream_name)
+        if self.buffered_records_count >= self.flush_interval or self.buffered_size / 1024 > self.flush_interval_size_in_kb:
+            self.write_whats_left()
 
     def write_from_queue(self, stream_name: str):
         """
         Writes data from records_buffer for belonging to the input stream.
+        """
+        self.write_streams([stream_name])
 
-        1) checks the headers are set
-        2) gets the values from the records_buffer
-        3) if there are records to write - writes them to the target worksheet
+    def write_streams(self, stream_names: List[str]):
         """
+        Writes data from records_buffer belonging to the input streams, with as few requests as possible.
 
-        self.check_headers(stream_name)
-        values: list = self.records_buffer[stream_name] or []
-        if values:
-            stream: Worksheet = self.spreadsheet.open_worksheet(stream_name)
-            self.logger.info(f"Writing data for stream: {stream_name}")
-            # we start from the cell of `A2` as starting range to fill the spreadsheet
-            stream.append_table(values, start="A2", dimension="ROWS")
-        else:
-            self.logger.info(f"Skipping empty stream: {stream_name}")
+        1) sets the headers that are not set yet, along with the records
+        2) grows the worksheets too small for the records, with a single request
+        3) writes the records to the rows following the data of their worksheet, with a single `values.batchUpdateByDataFilter` request
+        4) appends the records of the streams for which the end of the data is not known yet, one request per stream,
+           which is only needed once per stream
+        """
+        data: List[Mapping[str, Any]] = []
+        dimensions_to_add: List[Tuple[Worksheet, int, int]] = []
+        streams_to_append: List[str] = []
+
+        for stream_name in stream_names:
+            stream = self.open_worksheet(stream_name)
+            headers = self.stream_info[stream_name]["headers"]
+            if not self.stream_info[stream_name]["is_set"]:
+                if headers:
+                    data.append(self._value_range(stream, 1, [headers]))
+                self.stream_info[stream_name]["is_set"] = True
+
+            values: list = self.records_buffer[stream_name] or []
+            last_row = 0
+            if not values:
+                self.logger.info(f"Skipping empty stream: {stream_name}")
+            elif stream_name not in self.next_rows:
+                self.logger.info(f"Writing data for stream: {stream_name}")
+                streams_to_append.append(stream_name)
+            else:
+                self.logger.info(f"Writing data for stream: {stream_name}")
+                next_row = self.next_rows[stream_name]
+                data.append(self._value_range(stream, next_row, values))
+                self.next_rows[stream_name] = next_row + len(values)
+                last_row = next_row + len(values) - 1
+
+            rows, cols = self.worksheets_size[stream_name]
+            rows_to_add = max(last_row - rows, min(rows, self.grow_rows_step)) if last_row > rows else 0
+            cols_to_add = max(len(headers) - cols, 0)
+            if rows_to_add or cols_to_add:
+                dimensions_to_add.append((stream, rows_to_add, cols_to_add))
+                self.worksheets_size[stream_name] = (rows + rows_to_add, cols + cols_to_add)
+
+        self.spreadsheet.grow_worksheets(dimensions_to_add)
+        if data:
+            self.spreadsheet.batch_update_values(data)
+
+        for stream_name in streams_to_append:
+            values = self.records_buffer[stream_name]
+            last_row = self.spreadsheet.append_values(self.worksheets[stream_name], values)
+            self.next_rows[stream_name] = last_row + 1
+            # rows are inserted for the appended values
+            rows, cols = self.worksheets_size[stream_name]
+            self.worksheets_size[stream_name] = (max(rows + len(values), last_row), cols)
+
+    def _value_range(self, stream: Worksheet, row: int, values: List[List[str]]) -> Mapping[str, Any]:
+        last_cell = format_addr((row + len(values) - 1, max(len(value) for value in values)), output="label")
+        return {"range": self.spreadsheet.range_name(stream, f"A{row}:{last_cell}"), "majorDimension": "ROWS", "values": values}
 
     def write_whats_left(self):
         """
         Stands for writing records that are still left to be written,
         but don't match the condition for `queue_write_operation`.
         """
+        self.write_streams(list(self.records_buffer))
         for stream_name in self.records_buffer:
-            self.write_from_queue(stream_name)
             self.clear_buffer(stream_name)
 
     def deduplicate_records(self, configured_stream: AirbyteStream):
         """
         Finds and removes duplicated records for target stream, using `primary_key`.
-        Processing the worksheet happens offline and sync it afterwards to reduce API calls rate
-        If rate limits are hit while deduplicating, it will be handeled automatically, the operation continues after backoff.
+
+        Duplicated records are skipped as they arrive, using the index of the primary key values of the stream,
+        so the worksheet only has to be deduplicated when the index is built.
+        If the stream received no records, the index is built now, removing the duplicates already in the worksheet.
         """
-        primary_key: str = configured_stream.primary_key[0][0]
         stream_name: str = configured_stream.stream.name
+        if not self.stream_info[stream_name]["primary_key"]:
+            self.logger.warn(f"No primary key to deduplicate records for stream: {stream_name}")
+            return
 
-        stream: Worksheet = self.spreadsheet.open_worksheet(stream_name)
-        rows_to_remove: list = self.spreadsheet.find_duplicates(stream, primary_key)
-
-        if rows_to_remove:
-            self.logger.info(f"Duplicated records are found for stream: {stream_name}, resolving...")
-            self.spreadsheet.remove_duplicates(stream, rows_to_remove)
-            self.logger.info(f"Finished deduplicating records for stream: {stream_name}")
-        else:
-            self.logger.info(f"No duplicated records found for stream: {stream_name}")
+        self.get_primary_key_index(stream_name)
+        self.logger.info(f"Finished deduplicating records for stream: {stream_name}")
@@ -58,27 +58,6 @@ def test_index_cols():
     assert col_indexed == expected
 
 
-def test_find_duplicates():
-    input_values = [[1, "a"], [1, "a"], [2, "b"], [1, "a"], [1, "a"]]
-    expected = [6, 5, 3]  # the 4th row is the duplicate of the 1st.
-
-    test_wks = TEST_SPREADSHEET.open_worksheet(TEST_STREAM)
-    test_wks.append_table(input_values, start="A2", dimension="ROWS")
-    test = TEST_SPREADSHEET.find_duplicates(test_wks, "id")
-    assert test == expected
-
-
-def test_remove_duplicates():
-    expected = [{"id": 1, "key": "a"}, {"id": 2, "key": "b"}]
-    test_wks = TEST_SPREADSHEET.open_worksheet(TEST_STREAM)
-    # find the duplicated rows
-    rows_to_remove = TEST_SPREADSHEET.find_duplicates(test_wks, "id")
-    # remove duplicates
-    TEST_SPREADSHEET.remove_duplicates(test_wks, rows_to_remove)
-    records = test_wks.get_all_records()
-    assert records == expected
-
-
 def test_delete_test_stream():
     test_wks = TEST_SPREADSHEET.open_worksheet(TEST_STREAM)
     TEST_SPREADSHEET.spreadsheet.del_worksheet(test_wks)
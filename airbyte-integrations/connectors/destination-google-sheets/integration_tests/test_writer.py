@@ -98,7 +98,7 @@ def test_write_whats_left(expected):
     assert records == expected
 
     # clean worksheet for future tests
-    test_wks.clear()
+    TEST_WRITER.delete_stream_entries(TEST_STREAM)
 
 
 input_dup_records = [
@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from unittest.mock import MagicMock
+
+import pytest
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
+from destination_google_sheets.spreadsheet import GoogleSheets
+from destination_google_sheets.writer import GoogleSheetsWriter
+from pygsheets.custom_types import ValueRenderOption
+
+
+def configured_stream(name: str) -> ConfiguredAirbyteStream:
+    return ConfiguredAirbyteStream(
+        stream=AirbyteStream(
+            name=name,
+            json_schema={"type": "object", "properties": {"id": {"type": "integer"}, "key": {"type": "string"}}},
+            supported_sync_modes=[SyncMode.full_refresh],
+        ),
+        sync_mode=SyncMode.full_refresh,
+        destination_sync_mode=DestinationSyncMode.overwrite,
+    )
+
+
+def worksheet(title: str, rows: int = 1000, cols: int = 26) -> MagicMock:
+    wks = MagicMock(rows=rows, cols=cols, title=title, id=hash(title))
+    return wks
+
+
+@pytest.fixture(name="client")
+def client_fixture() -> MagicMock:
+    client = MagicMock()
+    worksheets = {"stream_1": worksheet("stream_1"), "stream_2": worksheet("stream_2", rows=2)}
+    client.open_by_key.return_value.worksheet_by_title.side_effect = worksheets.get
+    return client
+
+
+@pytest.fixture(name="writer")
+def writer_fixture(client: MagicMock) -> GoogleSheetsWriter:
+    writer = GoogleSheetsWriter(GoogleSheets(client, "spreadsheet_id"))
+    writer.flush_interval = 4
+    for name in ["stream_1", "stream_2"]:
+        writer.init_buffer_stream(configured_stream(name))
+    return writer
+
+
+def batch_update_data(client: MagicMock) -> list:
+    batch_update = client.sheet.values_batch_update_by_data_filter
+    return [call.args[1] for call in batch_update.call_args_list]
+
+
+def value_range(a1_range: str, values: list) -> dict:
+    return {"dataFilter": {"a1Range": a1_range}, "majorDimension": "ROWS", "values": values}
+
+
+def test_buffer_size(writer: GoogleSheetsWriter):
+    writer.add_to_buffer("stream_1", {"id": 1, "key": "value"})
+    writer.add_to_buffer("stream_2", {"id": 22})
+
+    assert writer.buffered_records_count == 2
+    assert writer.records_buffer_size == {"stream_1": 1 + 5 + 6, "stream_2": 2 + 0 + 6}
+    assert writer.buffered_size == 20
+
+    writer.clear_buffer("stream_1")
+    assert writer.buffered_records_count == 1
+    assert writer.buffered_size == 8
+
+
+def test_streams_are_written_with_a_single_request(writer: GoogleSheetsWriter, client: MagicMock):
+    for name in ["stream_1", "stream_2"]:
+        writer.delete_stream_entries(name)
+
+    for i in range(4):
+        writer.add_to_buffer("stream_1" if i % 2 else "stream_2", {"id": i})
+        writer.queue_write_operation("stream_1")
+
+    assert batch_update_data(client) == [
+        [
+            value_range("'stream_1'!A1:B1", [["id", "key"]]),
+            value_range("'stream_1'!A2:B3", [["1", ""], ["3", ""]]),
+            value_range("'stream_2'!A1:B1", [["id", "key"]]),
+            value_range("'stream_2'!A2:B3", [["0", ""], ["2", ""]]),
+        ]
+    ]
+    # stream_2 only has 2 rows, it is grown by its size rather than by the missing row
+    client.sheet.batch_update.assert_called_once_with(
+        "spreadsheet_id", [{"appendDimension": {"sheetId": hash("stream_2"), "dimension": "ROWS", "length": 2}}]
+    )
+    assert writer.buffered_records_count == 0
+
+    writer.add_to_buffer("stream_2", {"id": 4})
+    writer.write_whats_left()
+    assert batch_update_data(client)[-1] == [value_range("'stream_2'!A4:B4", [["4", ""]])]
+    # worksheets are opened once
+    assert client.open_by_key.return_value.worksheet_by_title.call_count == 2 + 2
+
+
+def test_appended_stream_finds_the_end_of_its_data_once(writer: GoogleSheetsWriter, client: MagicMock):
+    client.sheet.values_append.return_value = {"updates": {"updatedRange": "'stream_1'!A11:B12"}}
+
+    writer.add_to_buffer("stream_1", {"id": 1})
+    writer.add_to_buffer("stream_1", {"id": 2})
+    writer.write_whats_left()
+
+    client.sheet.values_append.assert_called_once_with(
+        "spreadsheet_id", [["1", ""], ["2", ""]], "ROWS", range="'stream_1'!A2", insertDataOption="INSERT_ROWS"
+    )
+
+    writer.add_to_buffer("stream_1", {"id": 3})
+    writer.write_whats_left()
+
+    client.sheet.values_append.assert_called_once()
+    assert batch_update_data(client)[-1] == [value_range("'stream_1'!A13:B13", [["3", ""]])]
+
+
+def test_duplicates_are_skipped_as_they_arrive(client: MagicMock):
+    stream_1 = client.open_by_key.return_value.worksheet_by_title("stream_1")
+    stream_1.__getitem__.return_value = ["id", "key"]
+    stream_1.get_col.return_value = ["id", 1, 2, 1, 3, 2, 2]
+    client.sheet.values_append.return_value = {"updates": {"updatedRange": "'stream_1'!A5:B6"}}
+    writer = GoogleSheetsWriter(GoogleSheets(client, "spreadsheet_id"))
+    dedup_stream = configured_stream("stream_1")
+    dedup_stream.destination_sync_mode = DestinationSyncMode.append_dedup
+    dedup_stream.primary_key = [["id"]]
+    writer.init_buffer_stream(dedup_stream)
+
+    for i in [3, 4, 4, 5]:
+        writer.add_to_buffer("stream_1", {"id": i})
+    writer.write_whats_left()
+    writer.deduplicate_records(dedup_stream)
+
+    # the primary key column is read once, and the duplicates of the worksheet are removed with a single request
+    stream_1.get_col.assert_called_once_with(1, include_tailing_empty=False, value_render=ValueRenderOption.UNFORMATTED_VALUE)
+    client.sheet.batch_update.assert_called_once_with(
+        "spreadsheet_id",
+        [
+            {"deleteDimension": {"range": {"sheetId": hash("stream_1"), "dimension": "ROWS", "startIndex": 5, "endIndex": 7}}},
+            {"deleteDimension": {"range": {"sheetId": hash("stream_1"), "dimension": "ROWS", "startIndex": 3, "endIndex": 4}}},
+        ],
+    )
+    client.sheet.values_append.assert_called_once_with(
+        "spreadsheet_id", [["4", ""], ["5", ""]], "ROWS", range="'stream_1'!A2", insertDataOption="INSERT_ROWS"
+    )
+    assert writer.get_primary_key_index("stream_1") == {"1", "2", "3", "4", "5"}
+
+
+def test_duplicates_are_found_in_the_primary_key_column_of_the_worksheet(client: MagicMock):
+    stream_1 = client.open_by_key.return_value.worksheet_by_title("stream_1")
+    # the primary key is not in the first column of the worksheet, unlike in the catalog headers
+    stream_1.__getitem__.return_value = ["key", "id"]
+    # the unformatted values of the primary key column, as Google Sheets keeps the values written
+    stream_1.get_col.return_value = ["id", 7, True, 1, 1.2345678901234567e19, "abc"]
+    writer = GoogleSheetsWriter(GoogleSheets(client, "spreadsheet_id"))
+    dedup_stream = configured_stream("stream_1")
+    dedup_stream.destination_sync_mode = DestinationSyncMode.append_dedup
+    dedup_stream.primary_key = [["id"]]
+    writer.init_buffer_stream(dedup_stream)
+
+    for value in ["007", True, 1.0, 12345678901234567890, "abc", " abc", "8"]:
+        writer.add_to_buffer("stream_1", {"id": value})
+
+    stream_1.get_col.assert_called_once_with(2, include_tailing_empty=False, value_render=ValueRenderOption.UNFORMATTED_VALUE)
+    assert writer.records_buffer["stream_1"] == [[" abc", ""], ["8", ""]]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("007", "7"), (7, "7"), ("1.0", "1"), ("True", "TRUE"), (True, "TRUE"), ("1e3", "1000"), ("abc", "abc"), ("", "")],
+)
+def test_primary_key_value(value, expected):
+    assert GoogleSheetsWriter.primary_key_value(value) == expected
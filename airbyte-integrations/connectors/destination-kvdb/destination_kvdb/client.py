@@ -2,18 +2,27 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 from typing import Any, Iterable, List, Mapping, Tuple, Union
 
 import requests
 
 
 class KvDbClient:
+    """
+    Requests are sent through one keep-alive session per calling thread, so the client can be shared by concurrent writers
+    without the sessions' connection pools being used from several threads at once.
+    """
+
     base_url = "https://kvdb.io"
     PAGE_SIZE = 1000
 
     def __init__(self, bucket_id: str, secret_key: str = None):
         self.secret_key = secret_key
         self.bucket_id = bucket_id
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
 
     def write(self, key: str, value: Mapping[str, Any]):
         return self.batch_write([(key, value)])
@@ -66,13 +75,30 @@ class KvDbClient:
     def _get_auth_headers(self) -> Mapping[str, Any]:
         return {"Authorization": f"Bearer {self.secret_key}"} if self.secret_key else {}
 
+    def close(self):
+        """Closes the connections kept alive by every session opened so far"""
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self._local = threading.local()
+
+    def _get_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"Accept": "application/json", **self._get_auth_headers()})
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
     def _request(
         self, http_method: str, endpoint: str = None, params: Mapping[str, Any] = None, json: Mapping[str, Any] = None
     ) -> requests.Response:
         url = self._get_base_url() + (endpoint or "")
-        headers = {"Accept": "application/json", **self._get_auth_headers()}
 
-        response = requests.request(method=http_method, params=params, url=url, headers=headers, json=json)
+        response = self._get_session().request(method=http_method, params=params, url=url, json=json)
 
         response.raise_for_status()
         return response
@@ -2,7 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from collections import Mapping
+import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, List, Mapping, Tuple
 
 from destination_kvdb.client import KvDbClient
 
@@ -16,31 +19,67 @@ class KvDbWriter:
     This is because unless a data source explicitly designates a primary key, we don't know what to key the record on.
     Since KvDB allows reading records with certain prefixes, we treat it more like a message queue, expecting the reader to
     read messages with a particular prefix e.g: name__ab__123, where 123 is the timestamp they last read data from.
+
+    Batches of writes and deletes are sent by a small pool of threads, each one using its own keep-alive session of the client.
+    A batch is submitted once it holds `flush_interval` records or `flush_interval_size_in_kb` of JSON data, and `flush` waits
+    for every submitted batch to be acknowledged.
     """
 
-    write_buffer = []
     flush_interval = 1000
+    flush_interval_size_in_kb = 1024
+    max_concurrent_requests = 4
 
     def __init__(self, client: KvDbClient):
         self.client = client
+        self.write_buffer: List[Tuple[str, Mapping[str, Any]]] = []
+        self.write_buffer_size = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent_requests, thread_name_prefix="kvdb-writer")
+        self._pending_requests: Deque[Future] = deque()
 
     def delete_stream_entries(self, stream_name: str):
         """Deletes all the records belonging to the input stream"""
-        keys_to_delete = []
-        for key in self.client.list_keys(prefix=f"{stream_name}__ab__"):
-            keys_to_delete.append(key)
-            if len(keys_to_delete) == self.flush_interval:
-                self.client.delete(keys_to_delete)
-                keys_to_delete.clear()
-        if len(keys_to_delete) > 0:
-            self.client.delete(keys_to_delete)
+        # Every key is listed before any is deleted: the listing is paginated by offset, deleting keys while paginating would skip some
+        keys_to_delete = list(self.client.list_keys(prefix=f"{stream_name}__ab__"))
+        for start in range(0, len(keys_to_delete), self.flush_interval):
+            self._submit(self.client.delete, keys_to_delete[start : start + self.flush_interval])
+        self._wait_for_pending_requests()
 
     def queue_write_operation(self, stream_name: str, record: Mapping, written_at: int):
         kv_pair = (f"{stream_name}__ab__{written_at}", record)
         self.write_buffer.append(kv_pair)
-        if len(self.write_buffer) == self.flush_interval:
-            self.flush()
+        self.write_buffer_size += len(kv_pair[0]) + len(json.dumps(record))
+        if len(self.write_buffer) >= self.flush_interval or self.write_buffer_size >= self.flush_interval_size_in_kb * 1024:
+            self._submit_write_buffer()
 
     def flush(self):
-        self.client.batch_write(self.write_buffer)
-        self.write_buffer.clear()
+        self._submit_write_buffer()
+        self._wait_for_pending_requests()
+
+    def close(self):
+        """Cancels the requests not sent yet, then stops the threads and closes their sessions. Buffered records are written by `flush`"""
+        for request in self._pending_requests:
+            request.cancel()
+        self._pending_requests.clear()
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    def _submit_write_buffer(self):
+        if self.write_buffer:
+            self._submit(self.client.batch_write, self.write_buffer)
+            self.write_buffer = []
+            self.write_buffer_size = 0
+
+    def _submit(self, request: Callable, *args):
+        # Keeps at most one batch waiting per thread, so buffered records don't pile up in memory when KvDB is slower than the source
+        while len(self._pending_requests) >= 2 * self.max_concurrent_requests:
+            self._pending_requests.popleft().result()
+        self._pending_requests.append(self._executor.submit(request, *args))
+
+    def _wait_for_pending_requests(self):
+        try:
+            while self._pending_requests:
+                self._pending_requests.popleft().result()
+        finally:
+            for request in self._pending_requests:
+                request.cancel()
+            self._pending_requests.clear()
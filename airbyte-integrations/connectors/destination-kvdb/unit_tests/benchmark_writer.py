@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures an overwrite sync of the writer against a local stub of the KvDB API which answers every request after a fixed latency.
+
+From the connector directory run:
+
+    python -m unit_tests.benchmark_writer --records 20000 --latency-ms 50
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from destination_kvdb.client import KvDbClient
+from destination_kvdb.writer import KvDbWriter
+
+
+class StubKvDbHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keeps connections alive between requests
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        prefix, skip, limit = query.get("prefix", [""])[0], int(query["skip"][0]), int(query["limit"][0])
+        with self.server.lock:
+            keys = sorted(key for key in self.server.store if key.startswith(prefix))
+        self._reply(keys[skip : skip + limit])
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            for operation in body["txn"]:
+                if "set" in operation:
+                    self.server.store[operation["set"]] = operation["value"]
+                else:
+                    self.server.store.pop(operation["delete"], None)
+        self._reply({})
+
+    def _reply(self, payload):
+        time.sleep(self.server.latency)
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_sync(port: int, records: int, max_concurrent_requests: int) -> float:
+    client = KvDbClient("bucket")
+    client.base_url = f"http://127.0.0.1:{port}"
+    writer = type("BenchmarkWriter", (KvDbWriter,), {"max_concurrent_requests": max_concurrent_requests})(client)
+
+    start = time.perf_counter()
+    writer.delete_stream_entries("stream")
+    for i in range(records):
+        writer.queue_write_operation("stream", {"id": i, "name": f"record {i}"}, i)
+    writer.flush()
+    writer.close()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubKvDbHandler)
+    server.daemon_threads = True
+    server.lock, server.store, server.latency = threading.Lock(), {}, args.latency_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        for max_concurrent_requests in (1, KvDbWriter.max_concurrent_requests):
+            # the first sync fills the bucket, the second one measures deleting its records before writing them again
+            run_sync(server.server_port, args.records, max_concurrent_requests)
+            elapsed = run_sync(server.server_port, args.records, max_concurrent_requests)
+            print(f"{max_concurrent_requests} concurrent request(s): overwrite sync of {args.records} records took {elapsed:.2f}s")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from destination_kvdb.client import KvDbClient
+from destination_kvdb.writer import KvDbWriter
+
+
+def test_writers_have_their_own_buffer():
+    writer, other_writer = KvDbWriter(MagicMock()), KvDbWriter(MagicMock())
+
+    writer.queue_write_operation("stream", {"id": 1}, 1)
+
+    assert writer.write_buffer == [("stream__ab__1", {"id": 1})]
+    assert other_writer.write_buffer == []
+
+
+def test_buffer_is_written_when_it_reaches_the_size_limit():
+    client = MagicMock()
+    writer = KvDbWriter(client)
+    writer.flush_interval_size_in_kb = 1
+
+    writer.queue_write_operation("stream", {"value": "a" * 600}, 1)
+    client.batch_write.assert_not_called()
+    writer.queue_write_operation("stream", {"value": "b" * 600}, 2)
+    writer.flush()
+
+    client.batch_write.assert_called_once_with([("stream__ab__1", {"value": "a" * 600}), ("stream__ab__2", {"value": "b" * 600})])
+    assert writer.write_buffer == [] and writer.write_buffer_size == 0
+
+
+def test_batches_are_written_concurrently():
+    client = MagicMock()
+    writer = KvDbWriter(client)
+    writer.flush_interval = 10
+    barrier = threading.Barrier(2, timeout=5)
+    # each of the first two batches waits for the other one, which only works when they are sent concurrently
+    client.batch_write.side_effect = lambda batch: barrier.wait() if batch[0][0] in ("stream__ab__0", "stream__ab__10") else None
+
+    for i in range(25):
+        writer.queue_write_operation("stream", {"id": i}, i)
+    writer.flush()
+
+    written = [key for call in client.batch_write.call_args_list for key, _ in call.args[0]]
+    assert sorted(written) == sorted(f"stream__ab__{i}" for i in range(25))
+    assert client.batch_write.call_count == 3
+
+
+def test_flush_raises_errors_of_failed_batches():
+    client = MagicMock()
+    client.batch_write.side_effect = RuntimeError("write failed")
+    writer = KvDbWriter(client)
+
+    writer.queue_write_operation("stream", {"id": 1}, 1)
+    with pytest.raises(RuntimeError, match="write failed"):
+        writer.flush()
+
+
+def test_delete_stream_entries_deletes_every_listed_key():
+    client = MagicMock()
+    keys = [f"stream__ab__{i}" for i in range(2500)]
+    client.list_keys.return_value = iter(keys)
+    writer = KvDbWriter(client)
+
+    writer.delete_stream_entries("stream")
+
+    client.list_keys.assert_called_once_with(prefix="stream__ab__")
+    assert sorted(call.args[0][0] for call in client.delete.call_args_list) == ["stream__ab__0", "stream__ab__1000", "stream__ab__2000"]
+    assert sorted(key for call in client.delete.call_args_list for key in call.args[0]) == sorted(keys)
+
+
+def test_client_reuses_one_session_per_thread(requests_mock):
+    requests_mock.post("https://kvdb.io/bucket", json={})
+    client = KvDbClient("bucket", "secret")
+
+    client.write("key", {"value": 1})
+    client.delete("key")
+    other_thread = threading.Thread(target=client.delete, args=("key",))
+    other_thread.start()
+    other_thread.join()
+
+    assert len(client._sessions) == 2
+    assert requests_mock.call_count == 3
+    assert requests_mock.last_request.headers["Authorization"] == "Bearer secret"
+    assert requests_mock.request_history[1].json() == {"txn": [{"delete": "key"}]}
+    client.close()
+    assert client._sessions == []
@@ -24,6 +24,10 @@ from destination_pgvector.common.catalog.catalog_providers import CatalogProvide
 from destination_pgvector.config import ConfigModel
 
 BATCH_SIZE = 150
+"""Number of chunks, collected across records, embedded with a single request."""
+
+EMBEDDING_CONCURRENCY = 2
+"""Maximum number of embedding requests in flight while the following records are split."""
 
 
 class DestinationPGVector(Destination):
@@ -44,6 +48,8 @@ class DestinationPGVector(Destination):
             catalog_provider=CatalogProvider(configured_catalog),
             temp_dir=Path(tempfile.mkdtemp()),
             temp_file_cleanup=True,
+            embedding_batch_size=BATCH_SIZE,
+            embedding_concurrency=EMBEDDING_CONCURRENCY,
         )
 
     def write(
@@ -0,0 +1,97 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""Helpers to stream JSONL batch files into Postgres with `COPY ... FROM STDIN`."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+COPY_NULL = "\\N"
+"""The representation of NULL in the COPY text format."""
+
+_COPY_ESCAPES = str.maketrans(
+    {
+        "\\": "\\\\",
+        "\t": "\\t",
+        "\n": "\\n",
+        "\r": "\\r",
+    }
+)
+
+
+def to_copy_text(value: Any) -> str:
+    """Encode a single value for the Postgres COPY text format. Lists and objects are encoded as JSON."""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return json.dumps(value).translate(_COPY_ESCAPES)
+
+
+def to_vector_copy_text(value: list[float] | None) -> str:
+    """Encode an embedding in the pgvector text format (`[1.0,2.0]`)."""
+    if value is None:
+        return COPY_NULL
+    return "[" + ",".join(repr(float(item)) for item in value) + "]"
+
+
+def iter_copy_rows(files: Iterable[Path], columns: list[str], vector_columns: set[str]) -> Iterator[str]:
+    """Yield one COPY text line per record of the given JSONL files, with the values of `columns`."""
+    encoders = [to_vector_copy_text if column in vector_columns else to_copy_text for column in columns]
+    for file_path in files:
+        opener = gzip.open if file_path.suffix == ".gz" else open
+        with opener(file_path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                yield "\t".join(encode(record.get(column)) for encode, column in zip(encoders, columns)) + "\n"
+
+
+class IteratorTextIO(io.TextIOBase):
+    """A read-only file-like object over an iterator of strings.
+
+    This lets `cursor.copy_expert()` pull rows lazily, so batch files are never fully loaded in memory.
+    """
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        if size is None or size < 0:
+            result = self._buffer + "".join(self._chunks)
+            self._buffer = ""
+            return result
+
+        while len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        result, self._buffer = self._buffer[:size], self._buffer[size:]
+        return result
+
+    def readline(self, size: int | None = -1) -> str:  # type: ignore[override]
+        while "\n" not in self._buffer:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        end = self._buffer.find("\n") + 1 or len(self._buffer)
+        if size is not None and size >= 0:
+            end = min(end, size)
+        result, self._buffer = self._buffer[:end], self._buffer[end:]
+        return result
@@ -3,19 +3,30 @@
 
 from __future__ import annotations
 
+import logging
+import time
 import uuid
+from collections import defaultdict, deque
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
 
 import dpath
 import sqlalchemy
+from airbyte import exceptions as exc
 from airbyte._processors.file.jsonl import JsonlWriter
 from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
 from airbyte_cdk.destinations.vector_db_based import embedder
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
 from airbyte_cdk.destinations.vector_db_based.document_processor import DocumentProcessor as DocumentSplitter
 from airbyte_cdk.destinations.vector_db_based.document_processor import ProcessingConfigModel as DocumentSplitterConfig
 from airbyte_cdk.models import AirbyteRecordMessage
+from destination_pgvector import pg_copy
 from destination_pgvector.common.catalog.catalog_providers import CatalogProvider
 from destination_pgvector.common.sql.sql_processor import SqlConfig, SqlProcessorBase
 from destination_pgvector.globals import CHUNK_ID_COLUMN, DOCUMENT_CONTENT_COLUMN, DOCUMENT_ID_COLUMN, EMBEDDING_COLUMN, METADATA_COLUMN
@@ -23,6 +34,8 @@ from overrides import overrides
 from pgvector.sqlalchemy import Vector
 from typing_extensions import Protocol
 
+logger = logging.getLogger("airbyte")
+
 
 class PostgresConfig(SqlConfig):
     """Configuration for the Postgres cache.
@@ -81,10 +94,32 @@ class PGVectorProcessor(SqlProcessorBase):
         catalog_provider: CatalogProvider,
         temp_dir: Path,
         temp_file_cleanup: bool = True,
+        embedding_batch_size: int = 1,
+        embedding_concurrency: int = 1,
     ) -> None:
-        """Initialize the PGVector processor."""
+        """Initialize the PGVector processor.
+
+        Chunks are collected across records and embedded together once `embedding_batch_size` chunks are pending.
+        With an `embedding_concurrency` greater than one, up to that many embedding requests are in flight while
+        the following records are split.
+        """
+        if embedding_batch_size < 1 or embedding_concurrency < 1:
+            raise exc.PyAirbyteInputError(
+                message="Embedding batch size and concurrency must be positive.",
+                context={
+                    "embedding_batch_size": embedding_batch_size,
+                    "embedding_concurrency": embedding_concurrency,
+                },
+            )
         self.splitter_config = splitter_config
         self.embedder_config = embedder_config
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_concurrency = embedding_concurrency
+        self._phase_durations: dict[str, float] = defaultdict(float)
+        self._pending_chunks: list[tuple[AirbyteRecordMessage, list[Chunk]]] = []
+        self._pending_chunk_count = 0
+        self._embedding_futures: deque[tuple[list[tuple[AirbyteRecordMessage, list[Chunk]]], Future]] = deque()
+        self._embedding_executor: ThreadPoolExecutor | None = None
         super().__init__(
             sql_config=sql_config,
             catalog_provider=catalog_provider,
@@ -109,6 +144,38 @@ class PGVectorProcessor(SqlProcessorBase):
             EMBEDDING_COLUMN: Vector(self.embedding_dimensions),
         }
 
+    def _write_files_to_new_table(
+        self,
+        files: list[Path],
+        stream_name: str,
+        batch_id: str,
+    ) -> str:
+        """Write the batch files to a new table with `COPY ... FROM STDIN`.
+
+        Rows are streamed from the JSONL files in the COPY text format, with embeddings encoded in the pgvector text
+        format, so neither pandas nor row-by-row INSERT statements are involved.
+        """
+        temp_table_name = self._create_table_for_loading(stream_name, batch_id)
+        columns = list(self._get_sql_column_definitions(stream_name).keys())
+        copy_statement = (
+            f"COPY {self._fully_qualified(temp_table_name)} "
+            f"({', '.join(self._quote_identifier(column) for column in columns)}) FROM STDIN"
+        )
+        rows = pg_copy.iter_copy_rows(files, columns=columns, vector_columns={EMBEDDING_COLUMN})
+
+        raw_connection = self.get_sql_engine().raw_connection()
+        try:
+            with raw_connection.cursor() as cursor:
+                cursor.copy_expert(copy_statement, pg_copy.IteratorTextIO(rows))
+            raw_connection.commit()
+        except Exception:
+            raw_connection.rollback()
+            raise
+        finally:
+            raw_connection.close()
+
+        return temp_table_name
+
     def _emulated_merge_temp_table_to_final_table(
         self,
         stream_name: str,
@@ -160,13 +227,88 @@ class PGVectorProcessor(SqlProcessorBase):
 
         This method is called for each record message, before the record is written to local file.
         """
-        document_chunks, id_to_delete = self.splitter.process(record_msg)
+        with self._timed("splitting"):
+            document_chunks, id_to_delete = self.splitter.process(record_msg)
 
         _ = id_to_delete  # unused
 
-        embeddings = self.embedder.embed_documents(
-            documents=document_chunks,
+        self._pending_chunks.append((record_msg, document_chunks))
+        self._pending_chunk_count += len(document_chunks)
+        if self._pending_chunk_count >= self.embedding_batch_size:
+            self._embed_pending_chunks()
+
+    def _embed_pending_chunks(self) -> None:
+        """Embed the chunks of all pending records in a single request and write them in record order."""
+        if not self._pending_chunks:
+            return
+        records_with_chunks = self._pending_chunks
+        self._pending_chunks = []
+        self._pending_chunk_count = 0
+        documents = [chunk for _, chunks in records_with_chunks for chunk in chunks]
+
+        if self.embedding_concurrency == 1:
+            with self._timed("embedding"):
+                embeddings = self.embedder.embed_documents(documents=documents)
+            self._write_embedded_records(records_with_chunks, embeddings)
+            return
+
+        if self._embedding_executor is None:
+            self._embedding_executor = ThreadPoolExecutor(
+                max_workers=self.embedding_concurrency,
+                thread_name_prefix="embedding",
+            )
+        self._embedding_futures.append(
+            (records_with_chunks, self._embedding_executor.submit(self.embedder.embed_documents, documents=documents))
         )
+        # Submitted before waiting, so that `embedding_concurrency` requests stay in flight while the following
+        # records are split, and the queued request starts as soon as the oldest one completes.
+        try:
+            while len(self._embedding_futures) > self.embedding_concurrency:
+                self._write_oldest_embedding_future()
+        except Exception:
+            self._shutdown_embedding_executor()
+            raise
+
+    def _write_oldest_embedding_future(self) -> None:
+        records_with_chunks, future = self._embedding_futures.popleft()
+        with self._timed("embedding"):
+            embeddings = future.result()
+        self._write_embedded_records(records_with_chunks, embeddings)
+
+    def _flush_embeddings(self) -> None:
+        """Embed and write all pending chunks, waiting for any in-flight embedding requests."""
+        try:
+            self._embed_pending_chunks()
+            while self._embedding_futures:
+                self._write_oldest_embedding_future()
+        finally:
+            self._shutdown_embedding_executor()
+
+    def _shutdown_embedding_executor(self) -> None:
+        """Stop the embedding workers, cancelling the requests not started yet if a request or a write failed."""
+        self._embedding_futures.clear()
+        if self._embedding_executor is not None:
+            self._embedding_executor.shutdown(cancel_futures=True)
+            self._embedding_executor = None
+
+    def _write_embedded_records(
+        self,
+        records_with_chunks: list[tuple[AirbyteRecordMessage, list[Chunk]]],
+        embeddings: list[list[float] | None],
+    ) -> None:
+        with self._timed("writing"):
+            offset = 0
+            for record_msg, document_chunks in records_with_chunks:
+                self._write_chunks(record_msg, document_chunks, embeddings[offset : offset + len(document_chunks)])
+                offset += len(document_chunks)
+
+    def _write_chunks(
+        self,
+        record_msg: AirbyteRecordMessage,
+        document_chunks: list[Chunk],
+        embeddings: list[list[float] | None],
+    ) -> None:
+        """Write the embedded chunks of a record to the local batch files."""
         for i, chunk in enumerate(document_chunks, start=0):
             new_data: dict[str, Any] = {
                 DOCUMENT_ID_COLUMN: self._create_document_id(record_msg),
@@ -209,8 +351,29 @@ class PGVectorProcessor(SqlProcessorBase):
         """
         pass
 
-    @property
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Finalize any pending writes, then report where the time of the sync was spent."""
+        self._flush_embeddings()
+        with self._timed("writing"):
+            super().write_all_stream_data(write_strategy=write_strategy)
+        self._log_phase_durations()
+
+    @contextmanager
+    def _timed(self, phase: str) -> Generator[None, None, None]:
+        """Add the wall-clock time spent in the context to the given processing phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phase_durations[phase] += time.perf_counter() - start
+
+    def _log_phase_durations(self) -> None:
+        summary = ", ".join(f"{phase}: {duration:.2f}s" for phase, duration in self._phase_durations.items())
+        logger.info(f"Time spent per processing phase: {summary}")
+
+    @cached_property
     def embedder(self) -> embedder.Embedder:
+        """The embedder, created once and reused for every record of the sync."""
         return embedder.create_from_config(
             embedding_config=self.embedder_config,  # type: ignore [arg-type]  # No common base class
             processing_config=self.splitter_config,
@@ -221,8 +384,9 @@ class PGVectorProcessor(SqlProcessorBase):
         """Return the number of dimensions for the embeddings."""
         return self.embedder.embedding_dimensions
 
-    @property
+    @cached_property
     def splitter(self) -> DocumentSplitter:
+        """The document splitter, created once and reused for every record of the sync."""
         return DocumentSplitter(
             config=self.splitter_config,
             catalog=self.catalog_provider.configured_catalog,
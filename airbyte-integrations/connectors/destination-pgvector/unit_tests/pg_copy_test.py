@@ -0,0 +1,44 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from destination_pgvector.pg_copy import IteratorTextIO, iter_copy_rows, to_copy_text, to_vector_copy_text
+
+
+class TestPgCopy(unittest.TestCase):
+    def test_to_copy_text(self):
+        self.assertEqual(to_copy_text(None), "\\N")
+        self.assertEqual(to_copy_text("a\tb\nc\\d\re"), "a\\tb\\nc\\\\d\\re")
+        self.assertEqual(to_copy_text(True), "true")
+        self.assertEqual(to_copy_text(3), "3")
+        self.assertEqual(to_copy_text({"key": "line\nbreak"}), '{"key": "line\\\\nbreak"}')
+
+    def test_to_vector_copy_text(self):
+        self.assertEqual(to_vector_copy_text(None), "\\N")
+        self.assertEqual(to_vector_copy_text([1, 0.5, -2.25]), "[1.0,0.5,-2.25]")
+
+    def test_iter_copy_rows(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "batch.jsonl.gz"
+            with gzip.open(file_path, "wt") as file:
+                file.write(json.dumps({"document_id": "1", "metadata": {"a": 1}, "embedding": [0.1, 0.2], "extra": "x"}) + "\n")
+                file.write(json.dumps({"document_id": "2", "metadata": None, "embedding": None}) + "\n")
+
+            rows = list(iter_copy_rows([file_path], columns=["document_id", "metadata", "embedding"], vector_columns={"embedding"}))
+
+        self.assertEqual(rows, ['1\t{"a": 1}\t[0.1,0.2]\n', "2\t\\N\t\\N\n"])
+
+    def test_iterator_text_io(self):
+        stream = IteratorTextIO(iter(["ab\n", "cde\n", "f"]))
+        self.assertEqual(stream.read(2), "ab")
+        self.assertEqual(stream.readline(), "\n")
+        self.assertEqual(stream.read(5), "cde\nf")
+        self.assertEqual(stream.read(5), "")
+
+        self.assertEqual(IteratorTextIO(iter(["a", "b"])).read(), "ab")
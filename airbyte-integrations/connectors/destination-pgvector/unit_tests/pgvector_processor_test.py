@@ -0,0 +1,300 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import gzip
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
+from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk
+from airbyte_cdk.models import (
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStream,
+    AirbyteStreamState,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    StreamDescriptor,
+    SyncMode,
+)
+from destination_pgvector import pgvector_processor
+from destination_pgvector.common.catalog.catalog_providers import CatalogProvider
+from destination_pgvector.config import ConfigModel
+
+
+class TestPGVectorProcessor(unittest.TestCase):
+    def setUp(self):
+        self.config = ConfigModel.parse_obj(
+            {
+                "processing": {"text_fields": ["str_col"], "metadata_fields": [], "chunk_size": 1000},
+                "embedding": {"mode": "fake"},
+                "indexing": {
+                    "host": "MYACCOUNT",
+                    "port": 5432,
+                    "database": "MYDATABASE",
+                    "default_schema": "MYSCHEMA",
+                    "username": "MYUSERNAME",
+                    "credentials": {"password": "xxxxxxx"},
+                },
+            }
+        )
+        self.catalog = ConfiguredAirbyteCatalog(
+            streams=[
+                ConfiguredAirbyteStream(
+                    stream=AirbyteStream(
+                        name="mystream",
+                        json_schema={"type": "object", "properties": {"str_col": {"type": "string"}}},
+                        supported_sync_modes=[SyncMode.full_refresh],
+                    ),
+                    sync_mode=SyncMode.full_refresh,
+                    destination_sync_mode=DestinationSyncMode.overwrite,
+                )
+            ]
+        )
+
+    def _create_processor(self, temp_dir: Path, **kwargs) -> pgvector_processor.PGVectorProcessor:
+        with patch.object(pgvector_processor.PGVectorProcessor, "_ensure_schema_exists"):
+            processor = pgvector_processor.PGVectorProcessor(
+                sql_config=pgvector_processor.PostgresConfig(
+                    host=self.config.indexing.host,
+                    port=self.config.indexing.port,
+                    database=self.config.indexing.database,
+                    schema_name=self.config.indexing.default_schema,
+                    username=self.config.indexing.username,
+                    password=SecretString(self.config.indexing.credentials.password),
+                ),
+                splitter_config=self.config.processing,
+                embedder_config=self.config.embedding,
+                catalog_provider=CatalogProvider(self.catalog),
+                temp_dir=temp_dir,
+                **kwargs,
+            )
+        processor.file_writer = MagicMock()
+        return processor
+
+    @patch("destination_pgvector.pgvector_processor.embedder.create_from_config")
+    @patch("destination_pgvector.pgvector_processor.DocumentSplitter")
+    def test_embedder_and_splitter_are_created_once(self, MockedSplitter, mock_create_from_config):
+        MockedSplitter.return_value.process.return_value = ([Chunk(page_content="text", metadata={}, record=MagicMock())], None)
+        mock_create_from_config.return_value.embed_documents.return_value = [[0.1, 0.2]]
+        processor = self._create_processor(Path("/tmp"))
+
+        for i in range(3):
+            processor.process_record_message(
+                AirbyteRecordMessage(stream="mystream", data={"str_col": f"record {i}"}, emitted_at=0),
+                stream_schema={},
+            )
+
+        MockedSplitter.assert_called_once()
+        mock_create_from_config.assert_called_once()
+        self.assertEqual(processor.file_writer.process_record_message.call_count, 3)
+
+    @patch("destination_pgvector.pgvector_processor.embedder.create_from_config")
+    @patch("destination_pgvector.pgvector_processor.DocumentSplitter")
+    def test_phase_durations_are_recorded(self, MockedSplitter, mock_create_from_config):
+        MockedSplitter.return_value.process.return_value = ([Chunk(page_content="text", metadata={}, record=MagicMock())], None)
+        mock_create_from_config.return_value.embed_documents.return_value = [[0.1, 0.2]]
+        processor = self._create_processor(Path("/tmp"))
+
+        processor.process_record_message(
+            AirbyteRecordMessage(stream="mystream", data={"str_col": "some text"}, emitted_at=0),
+            stream_schema={},
+        )
+
+        self.assertEqual(set(processor._phase_durations), {"splitting", "embedding", "writing"})
+        self.assertTrue(all(duration >= 0 for duration in processor._phase_durations.values()))
+
+    @patch("destination_pgvector.pgvector_processor.embedder.create_from_config")
+    @patch("destination_pgvector.pgvector_processor.DocumentSplitter")
+    def _test_chunks_are_embedded_across_records(self, embedding_concurrency, MockedSplitter, mock_create_from_config):
+        def split(record_msg):
+            text = record_msg.data["str_col"]
+            return [Chunk(page_content=f"{text}-{i}", metadata={}, record=record_msg) for i in range(2)], None
+
+        MockedSplitter.return_value.process.side_effect = split
+        mock_embed = mock_create_from_config.return_value.embed_documents
+        mock_embed.side_effect = lambda documents: [[float(len(documents)), float(i)] for i in range(len(documents))]
+        processor = self._create_processor(Path("/tmp"), embedding_batch_size=4, embedding_concurrency=embedding_concurrency)
+
+        for i in range(3):
+            processor.process_record_message(
+                AirbyteRecordMessage(stream="mystream", data={"str_col": f"record{i}"}, emitted_at=0),
+                stream_schema={},
+            )
+        processor._flush_embeddings()
+
+        self.assertEqual(
+            [[chunk.page_content for chunk in call.kwargs["documents"]] for call in mock_embed.call_args_list],
+            [["record0-0", "record0-1", "record1-0", "record1-1"], ["record2-0", "record2-1"]],
+        )
+        written = [call.kwargs["record_msg"].data for call in processor.file_writer.process_record_message.call_args_list]
+        self.assertEqual(
+            [(data["document_content"], data["embedding"]) for data in written],
+            [
+                ("record0-0", [4.0, 0.0]),
+                ("record0-1", [4.0, 1.0]),
+                ("record1-0", [4.0, 2.0]),
+                ("record1-1", [4.0, 3.0]),
+                ("record2-0", [2.0, 0.0]),
+                ("record2-1", [2.0, 1.0]),
+            ],
+        )
+
+    def test_chunks_are_embedded_across_records(self):
+        self._test_chunks_are_embedded_across_records(1)
+
+    def test_chunks_are_embedded_across_records_concurrently(self):
+        self._test_chunks_are_embedded_across_records(3)
+
+    @patch("destination_pgvector.pgvector_processor.embedder.create_from_config")
+    @patch("destination_pgvector.pgvector_processor.DocumentSplitter")
+    def test_embedding_concurrency_requests_are_in_flight_while_splitting(self, MockedSplitter, mock_create_from_config):
+        MockedSplitter.return_value.process.return_value = ([Chunk(page_content="text", metadata={}, record=MagicMock())], None)
+        started = threading.Semaphore(0)
+        release = threading.Event()
+
+        def embed_documents(documents):
+            started.release()
+            release.wait(timeout=5)
+            return [[0.1, 0.2]] * len(documents)
+
+        mock_create_from_config.return_value.embed_documents.side_effect = embed_documents
+        processor = self._create_processor(Path("/tmp"), embedding_batch_size=1, embedding_concurrency=2)
+
+        for i in range(2):
+            processor.process_record_message(
+                AirbyteRecordMessage(stream="mystream", data={"str_col": f"record{i}"}, emitted_at=0),
+                stream_schema={},
+            )
+
+        # both requests run while nothing was waited for, and so written yet
+        self.assertTrue(started.acquire(timeout=5) and started.acquire(timeout=5))
+        processor.file_writer.process_record_message.assert_not_called()
+        release.set()
+        processor._flush_embeddings()
+        self.assertEqual(processor.file_writer.process_record_message.call_count, 2)
+        self.assertIsNone(processor._embedding_executor)
+
+    @patch("destination_pgvector.pgvector_processor.embedder.create_from_config")
+    @patch("destination_pgvector.pgvector_processor.DocumentSplitter")
+    def test_failing_embedding_request_shuts_the_executor_down(self, MockedSplitter, mock_create_from_config):
+        MockedSplitter.return_value.process.return_value = ([Chunk(page_content="text", metadata={}, record=MagicMock())], None)
+        mock_create_from_config.return_value.embed_documents.side_effect = RuntimeError("embedding failure")
+        processor = self._create_processor(Path("/tmp"), embedding_batch_size=1, embedding_concurrency=2)
+
+        with self.assertRaises(RuntimeError):
+            for i in range(3):
+                processor.process_record_message(
+                    AirbyteRecordMessage(stream="mystream", data={"str_col": f"record{i}"}, emitted_at=0),
+                    stream_schema={},
+                )
+
+        self.assertIsNone(processor._embedding_executor)
+        self.assertFalse(processor._embedding_futures)
+        processor.file_writer.process_record_message.assert_not_called()
+
+    def test_write_files_to_new_table_uses_copy(self):
+        processor = self._create_processor(Path("/tmp"))
+        copied = []
+        raw_connection = MagicMock()
+        raw_connection.cursor.return_value.__enter__.return_value.copy_expert.side_effect = lambda sql, file: copied.append(
+            (sql, file.read())
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "batch.jsonl.gz"
+            with gzip.open(file_path, "wt") as file:
+                file.write(
+                    json.dumps(
+                        {
+                            "document_id": "doc",
+                            "chunk_id": "1",
+                            "metadata": {"a": 1},
+                            "document_content": "text",
+                            "embedding": [0.5, 1.0],
+                            "_airbyte_raw_id": "ignored",
+                        }
+                    )
+                    + "\n"
+                )
+            with patch.object(processor, "_create_table_for_loading", return_value="mystream_batch"), patch.object(
+                processor, "get_sql_engine"
+            ) as mock_get_sql_engine, patch.object(processor, "embedder") as mock_embedder:
+                mock_embedder.embedding_dimensions = 2
+                mock_get_sql_engine.return_value.raw_connection.return_value = raw_connection
+                table_name = processor._write_files_to_new_table([file_path], "mystream", "batch")
+
+        self.assertEqual(table_name, "mystream_batch")
+        self.assertEqual(
+            copied,
+            [
+                (
+                    'COPY MYSCHEMA."mystream_batch" ("document_id", "chunk_id", "metadata", "document_content", "embedding") FROM STDIN',
+                    'doc\t1\t{"a": 1}\ttext\t[0.5,1.0]\n',
+                )
+            ],
+        )
+        raw_connection.commit.assert_called_once()
+        raw_connection.close.assert_called_once()
+
+    def test_streams_are_finalized_concurrently_and_states_released_in_order(self):
+        self.catalog.streams = [
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name=f"stream{i}",
+                    json_schema={"type": "object", "properties": {"str_col": {"type": "string"}}},
+                    supported_sync_modes=[SyncMode.full_refresh],
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+            for i in range(3)
+        ]
+        state_writer = MagicMock()
+        processor = self._create_processor(Path("/tmp"))
+        processor._state_writer = state_writer
+        processor.file_writer.get_pending_batches.return_value = []
+        for i in range(3):
+            processor._pending_state_messages[f"stream{i}"].append(
+                AirbyteStateMessage(
+                    type=AirbyteStateType.STREAM,
+                    stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name=f"stream{i}"), stream_state={"i": i}),
+                )
+            )
+
+        stream_names = processor.catalog_provider.stream_names
+        finalizing_threads = set()
+
+        def ensure_final_table_exists(stream_name, create_if_missing):
+            finalizing_threads.add(threading.current_thread().name)
+            # the first stream is the slowest, its state must still be released first
+            if stream_name == stream_names[0]:
+                time.sleep(0.2)
+            return stream_name
+
+        engine = MagicMock()
+        processor._engine = engine
+        with patch.object(processor, "_ensure_schema_exists") as ensure_schema_exists, patch.object(
+            processor, "_ensure_final_table_exists", side_effect=ensure_final_table_exists
+        ):
+            processor.write_all_stream_data(write_strategy=WriteStrategy.AUTO)
+
+        self.assertGreater(len(finalizing_threads), 1)
+        # pending writes and the schema are handled once, before the workers start
+        processor.file_writer.flush_active_batches.assert_called_once()
+        ensure_schema_exists.assert_called_once()
+        engine.dispose.assert_called_once()
+        self.assertEqual(
+            [call.kwargs["state_message"].stream.stream_descriptor.name for call in state_writer.write_state.call_args_list],
+            stream_names,
+        )
+        self.assertIsNone(processor._held_state_messages)
@@ -39,6 +39,23 @@ class QdrantIndexingConfigModel(BaseModel):
         description="The Distance metric used to measure similarities among vectors. This field is only used if the collection defined in the does not exist yet and is created automatically by the connector.",
     )
     text_field: str = Field(title="Text Field", description="The field in the payload that contains the embedded text", default="text")
+    upload_batch_size: int = Field(
+        default=64,
+        title="Upload Batch Size",
+        description="The number of points sent to Qdrant in a single upsert request",
+        ge=1,
+    )
+    upload_parallelism: int = Field(
+        default=1,
+        title="Upload Parallelism",
+        description="The number of upsert requests sent to Qdrant in parallel",
+        ge=1,
+    )
+    deterministic_point_ids: bool = Field(
+        default=False,
+        title="Deterministic Point IDs",
+        description="Derive point IDs from the stream, the record's primary key and the chunk index instead of generating random ones. Updated records then overwrite their points with an upsert, and only their remaining points are deleted afterwards.",
+    )
 
     class Config:
         title = "Indexing"
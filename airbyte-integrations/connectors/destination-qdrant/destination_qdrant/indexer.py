@@ -4,7 +4,9 @@
 
 
 import uuid
-from typing import List, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD, METADATA_STREAM_FIELD
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
@@ -22,6 +24,8 @@ DISTANCE_METRIC_MAP = {
     "euc": Distance.EUCLID,
 }
 
+POINT_ID_NAMESPACE = uuid.UUID("4a5cb1b4-1d1e-4c3b-8f36-c1b0d7a8a2f3")
+
 
 class QdrantIndexer(Indexer):
     config: QdrantIndexingConfigModel
@@ -29,6 +33,9 @@ class QdrantIndexer(Indexer):
     def __init__(self, config: QdrantIndexingConfigModel, embedding_dimensions: int):
         super().__init__(config)
         self.embedding_dimensions = embedding_dimensions
+        # with deterministic point IDs, the record IDs to delete of every stream are deleted once its points are upserted
+        self._pending_delete_ids: Dict[Tuple[Optional[str], str], List[str]] = defaultdict(list)
+        self._upload_executor: Optional[ThreadPoolExecutor] = None
 
     def check(self) -> Optional[str]:
         auth_method_mode = self.config.auth_method.mode
@@ -88,35 +95,84 @@ class QdrantIndexer(Indexer):
             )
 
     def delete(self, delete_ids, namespace, stream):
-        if len(delete_ids) > 0:
+        if self.config.deterministic_point_ids:
+            # The points of updated records are overwritten by the upsert in `index`, which then deletes their remaining points
+            self._pending_delete_ids[(namespace, stream)].extend(delete_ids)
+            return
+        self._delete_records(delete_ids)
+
+    def index(self, document_chunks, namespace, stream):
+        # the points of the last copy of every record with a primary key, so the record overwrites its points once
+        points_by_record_id: Dict[str, List[models.PointStruct]] = {}
+        points = []
+        previous_record = None
+        for chunk in document_chunks:
+            payload = chunk.metadata
+            if chunk.page_content is not None:
+                payload[self.config.text_field] = chunk.page_content
+            record_id = payload.get(METADATA_RECORD_ID_FIELD)
+            if self.config.deterministic_point_ids and record_id is not None:
+                if chunk.record is not previous_record:
+                    # the chunks of a record are consecutive, the index of a chunk is counted from the first chunk of its record
+                    points_by_record_id[record_id] = []
+                record_points = points_by_record_id[record_id]
+                point_id = self._point_id(payload.get(METADATA_STREAM_FIELD, stream), record_id, len(record_points))
+                record_points.append(models.PointStruct(id=point_id, payload=payload, vector=chunk.embedding))
+            else:
+                points.append(models.PointStruct(id=str(uuid.uuid4()), payload=payload, vector=chunk.embedding))
+            previous_record = chunk.record
+        for record_points in points_by_record_id.values():
+            points.extend(record_points)
+        self._upload_points(points)
+
+        delete_ids = self._pending_delete_ids.pop((namespace, stream), [])
+        if delete_ids:
+            # deletes the records without chunks, and the points of the updated records which were not overwritten
+            kept_point_ids = [point.id for record_points in points_by_record_id.values() for point in record_points]
+            self._delete_records(delete_ids, kept_point_ids)
+
+    def _upload_points(self, points: List[models.PointStruct]) -> None:
+        if not points:
+            return
+        if not self._upload_executor:
+            # a single pool of threads for the whole sync, rather than a pool of processes for every batch
+            self._upload_executor = ThreadPoolExecutor(max_workers=self.config.upload_parallelism)
+        batch_size = self.config.upload_batch_size
+        batches = [points[i : i + batch_size] for i in range(0, len(points), batch_size)]
+
+        def upsert(batch: List[models.PointStruct]) -> None:
+            self._client.upsert(collection_name=self.config.collection, points=batch)
+
+        for _ in self._upload_executor.map(upsert, batches):
+            pass
+
+    def _delete_records(self, record_ids: List[str], kept_point_ids: Optional[List[str]] = None) -> None:
+        if len(record_ids) > 0:
             self._delete_for_filter(
                 models.FilterSelector(
                     filter=models.Filter(
                         should=[
-                            models.FieldCondition(key=METADATA_RECORD_ID_FIELD, match=models.MatchValue(value=_id)) for _id in delete_ids
-                        ]
+                            models.FieldCondition(key=METADATA_RECORD_ID_FIELD, match=models.MatchValue(value=_id)) for _id in record_ids
+                        ],
+                        must_not=[models.HasIdCondition(has_id=kept_point_ids)] if kept_point_ids else None,
                     )
                 )
             )
 
-    def index(self, document_chunks, namespace, stream):
-        entities = []
-        for i in range(len(document_chunks)):
-            chunk = document_chunks[i]
-            payload = chunk.metadata
-            if chunk.page_content is not None:
-                payload[self.config.text_field] = chunk.page_content
-            entities.append(
-                models.Record(
-                    id=str(uuid.uuid4()),
-                    payload=payload,
-                    vector=chunk.embedding,
-                )
-            )
-        self._client.upload_records(collection_name=self.config.collection, records=entities)
+    @staticmethod
+    def _point_id(stream_identifier: str, record_id: str, chunk_index: int) -> str:
+        """Return a stable point ID for the given chunk of a record."""
+        return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{stream_identifier}_{record_id}_{chunk_index}"))
 
     def post_sync(self) -> List[AirbyteMessage]:
         try:
+            # the streams which records to delete were not indexed afterwards
+            for delete_ids in self._pending_delete_ids.values():
+                self._delete_records(delete_ids)
+            self._pending_delete_ids.clear()
+            if self._upload_executor:
+                self._upload_executor.shutdown()
+                self._upload_executor = None
             self._client.close()
             return [
                 AirbyteMessage(
@@ -154,7 +154,93 @@ class TestQdrantIndexer(unittest.TestCase):
             "some_stream",
         )
 
-        self.qdrant_indexer._client.upload_records.assert_called_once()
+        self.qdrant_indexer._client.upsert.assert_called_once()
+        _, kwargs = self.qdrant_indexer._client.upsert.call_args
+        self.assertEqual(kwargs["collection_name"], self.mock_config.collection)
+        self.assertEqual([point.payload["text"] for point in kwargs["points"]], ["some content", "some other content"])
+
+    def test_index_uploads_batches(self):
+        self.qdrant_indexer.config.upload_batch_size = 2
+        self.qdrant_indexer.config.upload_parallelism = 2
+        chunks = [Mock(metadata={"key": f"value{i}"}, page_content=str(i), embedding=[float(i)]) for i in range(5)]
+
+        self.qdrant_indexer.index(chunks, None, "some_stream")
+
+        batches = [call.kwargs["points"] for call in self.qdrant_indexer._client.upsert.call_args_list]
+        self.assertEqual(sorted(len(batch) for batch in batches), [1, 2, 2])
+        upload_executor = self.qdrant_indexer._upload_executor
+        self.qdrant_indexer.index(chunks, None, "some_stream")
+        self.assertIs(self.qdrant_indexer._upload_executor, upload_executor)
+
+    def _chunks(self, *records):
+        """The chunks of the records, given as (record ID, number of chunks)"""
+        chunks = []
+        for record_id, chunks_count in records:
+            record, metadata = Mock(), {"_ab_stream": "some_stream"}
+            if record_id is not None:
+                metadata["_ab_record_id"] = record_id
+            chunks.extend(
+                Mock(metadata=dict(metadata), record=record, page_content=f"{record_id}-{i}", embedding=[1.0]) for i in range(chunks_count)
+            )
+        return chunks
+
+    def _upserted_ids(self, call_index):
+        return [point.id for point in self.qdrant_indexer._client.upsert.call_args_list[call_index].kwargs["points"]]
+
+    def test_index_uses_deterministic_point_ids(self):
+        self.qdrant_indexer.config.deterministic_point_ids = True
+
+        self.qdrant_indexer.index(self._chunks(("1", 2), ("2", 1), (None, 1)), None, "some_stream")
+        self.qdrant_indexer.index(self._chunks(("1", 2), ("2", 1), (None, 1)), None, "some_stream")
+
+        first_ids, second_ids = self._upserted_ids(0), self._upserted_ids(1)
+        # the points of the records are sent after the points of the records without primary key
+        self.assertEqual(first_ids[1:], second_ids[1:])
+        self.assertEqual(len(set(first_ids[1:])), 3)
+        self.assertNotEqual(first_ids[0], second_ids[0])
+
+    def test_index_overwrites_the_points_of_the_last_copy_of_a_record(self):
+        self.qdrant_indexer.config.deterministic_point_ids = True
+
+        self.qdrant_indexer.index(self._chunks(("1", 3), ("1", 2)), None, "some_stream")
+
+        points = self.qdrant_indexer._client.upsert.call_args.kwargs["points"]
+        self.assertEqual([point.payload["text"] for point in points], ["1-0", "1-1"])
+        self.assertEqual([point.id for point in points], [QdrantIndexer._point_id("some_stream", "1", i) for i in range(2)])
+
+    def test_delete_with_deterministic_point_ids_deletes_the_points_not_overwritten(self):
+        self.qdrant_indexer.config.deterministic_point_ids = True
+
+        self.qdrant_indexer.delete(["1", "deleted"], None, "some_stream")
+        self.qdrant_indexer._client.delete.assert_not_called()
+        self.qdrant_indexer.index(self._chunks(("1", 2)), None, "some_stream")
+
+        self.qdrant_indexer._client.delete.assert_called_once_with(
+            collection_name=self.mock_config.collection,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(
+                    should=[
+                        models.FieldCondition(key="_ab_record_id", match=models.MatchValue(value="1")),
+                        models.FieldCondition(key="_ab_record_id", match=models.MatchValue(value="deleted")),
+                    ],
+                    must_not=[models.HasIdCondition(has_id=self._upserted_ids(0))],
+                )
+            ),
+        )
+
+    def test_delete_with_deterministic_point_ids_without_index(self):
+        self.qdrant_indexer.config.deterministic_point_ids = True
+
+        self.qdrant_indexer.delete(["deleted"], None, "some_stream")
+        self.qdrant_indexer.index([], None, "some_stream")
+
+        self.qdrant_indexer._client.upsert.assert_not_called()
+        self.qdrant_indexer._client.delete.assert_called_once_with(
+            collection_name=self.mock_config.collection,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(should=[models.FieldCondition(key="_ab_record_id", match=models.MatchValue(value="deleted"))])
+            ),
+        )
 
     def test_index_calls_delete(self):
         self.qdrant_indexer.delete(["some_id", "another_id"], None, "some_stream")
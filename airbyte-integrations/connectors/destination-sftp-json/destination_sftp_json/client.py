@@ -5,11 +5,11 @@
 
 import contextlib
 import errno
+import gzip
 import json
-from typing import Dict, List, TextIO
+from typing import Dict, List, Optional
 
 import paramiko
-import smart_open
 
 
 @contextlib.contextmanager
@@ -34,6 +34,18 @@ def sftp_client(
 
 
 class SftpClient:
+    """
+    Records are buffered in memory and appended to the stream files by `flush`, which the destination calls on every state message.
+    All the streams share a single SSH connection, opened on the first access to the server.
+
+    With gzip compression, every flush appends a new gzip member to the file: the concatenation is still a valid gzip file.
+    """
+
+    # Buffers are also flushed when their total size reaches this limit, to bound the memory used between two state messages
+    buffer_size_limit_in_mb = 64
+    # Size of the requests sent to the server, paramiko sends at most 32 KB of data per request anyway
+    file_buffer_size = 32768
+
     def __init__(
         self,
         host: str,
@@ -41,13 +53,18 @@ class SftpClient:
         password: str,
         destination_path: str,
         port: int = 22,
+        compression: str = "none",
     ):
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.destination_path = destination_path
-        self._files: Dict[str, TextIO] = {}
+        self.compression = compression
+        self._buffers: Dict[str, List[str]] = {}
+        self._buffers_size = 0
+        self._exit_stack: Optional[contextlib.ExitStack] = None
+        self._sftp: Optional[paramiko.SFTPClient] = None
 
     def __enter__(self):
         return self
@@ -56,42 +73,65 @@ class SftpClient:
         self.close()
 
     def _get_path(self, stream: str) -> str:
-        return f"{self.destination_path}/airbyte_json_{stream}.jsonl"
-
-    def _get_uri(self, stream: str) -> str:
-        path = self._get_path(stream)
-        return f"sftp://{self.username}:{self.password}@{self.host}:{self.port}/{path}"
+        extension = ".jsonl.gz" if self.compression == "gzip" else ".jsonl"
+        return f"{self.destination_path}/airbyte_json_{stream}{extension}"
 
-    def _open(self, stream: str) -> TextIO:
-        uri = self._get_uri(stream)
-        return smart_open.open(uri, mode="a+")
+    def _get_sftp(self) -> paramiko.SFTPClient:
+        if self._sftp is None:
+            exit_stack = contextlib.ExitStack()
+            self._sftp = exit_stack.enter_context(sftp_client(self.host, self.port, self.username, self.password))
+            self._exit_stack = exit_stack
+        return self._sftp
 
     def close(self):
-        for file in self._files.values():
-            file.close()
+        try:
+            self.flush()
+        finally:
+            if self._exit_stack is not None:
+                self._exit_stack.close()
+                self._exit_stack, self._sftp = None, None
 
     def write(self, stream: str, record: Dict) -> None:
-        if stream not in self._files:
-            self._files[stream] = self._open(stream)
         text = json.dumps(record)
-        self._files[stream].write(f"{text}\n")
+        self._buffers.setdefault(stream, []).append(f"{text}\n")
+        self._buffers_size += len(text) + 1
+        if self._buffers_size >= self.buffer_size_limit_in_mb * 1024 * 1024:
+            self.flush()
+
+    def flush(self) -> None:
+        """Appends the buffered records of every stream to its file"""
+        for stream, lines in self._buffers.items():
+            data = "".join(lines).encode("utf-8")
+            if self.compression == "gzip":
+                data = gzip.compress(data)
+            with self._get_sftp().open(self._get_path(stream), mode="ab", bufsize=self.file_buffer_size) as file:
+                # Pipelined writes don't wait for the server to acknowledge every request, closing the file waits for all of them
+                file.set_pipelined(True)
+                file.write(data)
+        self._buffers.clear()
+        self._buffers_size = 0
 
     def read_data(self, stream: str) -> List[Dict]:
-        with self._open(stream) as file:
-            pos = file.tell()
-            file.seek(0)
-            lines = file.readlines()
-            file.seek(pos)
-            data = [json.loads(line.strip()) for line in lines]
-        return data
+        try:
+            with self._get_sftp().open(self._get_path(stream), mode="rb") as file:
+                file.prefetch()
+                data = file.read()
+        except IOError as err:
+            if err.errno != errno.ENOENT:
+                raise
+            data = b""
+        if self.compression == "gzip" and data:
+            data = gzip.decompress(data)
+        return [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
 
     def delete(self, stream: str) -> None:
-        with sftp_client(self.host, self.port, self.username, self.password) as sftp:
-            try:
-                path = self._get_path(stream)
-                sftp.remove(path)
-            except IOError as err:
-                # Ignore the case where the file doesn't exist, only raise the
-                # exception if it's something else
-                if err.errno != errno.ENOENT:
-                    raise
+        if stream in self._buffers:
+            self._buffers_size -= sum(len(line) for line in self._buffers.pop(stream))
+        try:
+            path = self._get_path(stream)
+            self._get_sftp().remove(path)
+        except IOError as err:
+            # Ignore the case where the file doesn't exist, only raise the
+            # exception if it's something else
+            if err.errno != errno.ENOENT:
+                raise
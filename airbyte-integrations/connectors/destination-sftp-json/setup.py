@@ -5,7 +5,7 @@
 
 from setuptools import find_packages, setup
 
-MAIN_REQUIREMENTS = ["airbyte-cdk", "smart_open==5.1.0", "paramiko==2.10.1"]
+MAIN_REQUIREMENTS = ["airbyte-cdk", "paramiko==2.10.1"]
 
 TEST_REQUIREMENTS = ["pytest~=6.1", "docker==5.0.3"]
 
@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures how many records per second the client writes to a local SFTP server, compared to writing every record with its own
+write call like the connector used to.
+
+From the connector directory run:
+
+    python -m unit_tests.benchmark_client --records 100000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from destination_sftp_json.client import SftpClient, sftp_client
+from unit_tests.sftp_server import local_sftp_server
+
+STATE_INTERVAL = 10000
+
+
+def _record(i: int):
+    return {"id": i, "name": f"record {i}", "updated_at": "2023-01-01T00:00:00Z"}
+
+
+def write_line_by_line(config, records: int) -> float:
+    start = time.perf_counter()
+    with sftp_client(config["host"], config["port"], config["username"], config["password"]) as sftp:
+        with sftp.open(f"{config['destination_path']}/line_by_line.jsonl", mode="a") as file:
+            for i in range(records):
+                file.write(f"{json.dumps(_record(i))}\n")
+    return time.perf_counter() - start
+
+
+def write_buffered(config, records: int, compression: str) -> float:
+    start = time.perf_counter()
+    with SftpClient(**config, compression=compression) as client:
+        for i in range(records):
+            client.write(f"buffered_{compression}", _record(i))
+            if i % STATE_INTERVAL == STATE_INTERVAL - 1:
+                client.flush()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root, local_sftp_server(Path(root)) as config:
+        runs = {
+            "line by line": lambda: write_line_by_line(config, args.records),
+            "buffered": lambda: write_buffered(config, args.records, "none"),
+            "buffered, gzip": lambda: write_buffered(config, args.records, "gzip"),
+        }
+        for name, run in runs.items():
+            elapsed = run()
+            print(f"{name}: {args.records / elapsed:,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Minimal SFTP server serving a local directory, used by the unit tests and the benchmark instead of a docker container.
+"""
+
+import contextlib
+import os
+import socket
+import threading
+from pathlib import Path
+from typing import Iterator, Mapping
+
+import paramiko
+
+USERNAME = "user"
+PASSWORD = "pass"
+
+
+class _Server(paramiko.ServerInterface):
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL if (username, password) == (USERNAME, PASSWORD) else paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+
+class _Handle(paramiko.SFTPHandle):
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(os.fstat((self.readfile or self.writefile).fileno()))
+
+
+class _SftpServer(paramiko.SFTPServerInterface):
+    def __init__(self, server, root: str, *args, **kwargs):
+        super().__init__(server, *args, **kwargs)
+        self.root = root
+
+    def _local_path(self, path: str) -> str:
+        return os.path.join(self.root, path.lstrip("/"))
+
+    def open(self, path, flags, attr):
+        try:
+            fd = os.open(self._local_path(path), flags, 0o644)
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        mode = "ab" if flags & os.O_APPEND else "r+b" if flags & os.O_RDWR else "wb" if flags & os.O_WRONLY else "rb"
+        handle = _Handle(flags)
+        file = os.fdopen(fd, mode)
+        handle.readfile = file if mode in ("rb", "r+b") else None
+        handle.writefile = file if mode != "rb" else None
+        return handle
+
+    def remove(self, path):
+        try:
+            os.remove(self._local_path(path))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(self._local_path(path)))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    lstat = stat
+
+
+@contextlib.contextmanager
+def local_sftp_server(root: Path) -> Iterator[Mapping]:
+    """Serves `root` until the context exits and yields the connector configuration to use it"""
+    host_key = paramiko.RSAKey.generate(2048)
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    transports = []
+
+    def serve():
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(connection)
+            transport.add_server_key(host_key)
+            transport.set_subsystem_handler("sftp", paramiko.SFTPServer, _SftpServer, str(root))
+            transport.start_server(server=_Server())
+            transports.append(transport)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        yield {
+            "host": "127.0.0.1",
+            "port": listener.getsockname()[1],
+            "username": USERNAME,
+            "password": PASSWORD,
+            "destination_path": "/",
+        }
+    finally:
+        listener.close()
+        for transport in transports:
+            transport.close()
@@ -6,6 +6,8 @@ from __future__ import annotations
 import abc
 import contextlib
 import enum
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
@@ -141,6 +143,9 @@ class SqlProcessorBase(RecordProcessorBase):
     supports_merge_insert = False
     """True if the database supports the MERGE INTO syntax."""
 
+    max_finalization_workers: int = 4
+    """The maximum number of streams finalized concurrently, each on its own pooled connection."""
+
     # Constructor:
 
     def __init__(
@@ -161,6 +166,9 @@ class SqlProcessorBase(RecordProcessorBase):
         state_writer = state_writer or StdOutStateWriter()
 
         self._sql_config: SqlConfig = sql_config
+        self._engine: Engine | None = None
+        self._engine_lock = threading.Lock()
+        self._held_state_messages: dict[str, list[AirbyteStateMessage]] | None = None
 
         super().__init__(
             state_writer=state_writer,
@@ -192,8 +200,15 @@ class SqlProcessorBase(RecordProcessorBase):
 
     @final
     def get_sql_engine(self) -> Engine:
-        """Return a new SQL engine to use."""
-        return self.sql_config.get_sql_engine()
+        """Return the SQL engine to use.
+
+        The engine is created once, so that connections are pooled and reused across statements
+        and finalization workers.
+        """
+        with self._engine_lock:
+            if self._engine is None:
+                self._engine = self.sql_config.get_sql_engine()
+            return self._engine
 
     @contextmanager
     def get_sql_connection(self) -> Generator[sqlalchemy.engine.Connection, None, None]:
@@ -473,6 +488,50 @@ class SqlProcessorBase(RecordProcessorBase):
 
         return columns
 
+    def write_all_stream_data(self, write_strategy: WriteStrategy) -> None:
+        """Finalize any pending writes, finalizing independent streams concurrently.
+
+        State messages are held back by the workers and released in the same order as when
+        finalizing streams one after another, once the batches of their stream are committed.
+        """
+        stream_names = list(self.catalog_provider.stream_names)
+        max_workers = min(self.max_finalization_workers, len(stream_names))
+        if max_workers <= 1:
+            super().write_all_stream_data(write_strategy=write_strategy)
+            return
+
+        # Done once here, the workers only finalize the batches of their stream.
+        self.file_writer.flush_active_batches()
+        self._ensure_schema_exists()
+
+        self._held_state_messages = {}
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="finalize",
+            ) as executor:
+                futures = [
+                    executor.submit(self._finalize_stream_batches, stream_name, write_strategy)
+                    for stream_name in stream_names
+                ]
+                for stream_name, future in zip(stream_names, futures):
+                    try:
+                        future.result()
+                    except Exception:
+                        for pending_future in futures:
+                            pending_future.cancel()
+                        raise
+
+                    self._finalize_state_messages(
+                        self._held_state_messages.pop(stream_name, []),
+                    )
+        finally:
+            self._held_state_messages = None
+            # Close the connections opened by the workers, the engine opens new ones on demand.
+            with self._engine_lock:
+                if self._engine is not None:
+                    self._engine.dispose()
+
     @final
     def write_stream_data(
         self,
@@ -491,10 +550,22 @@ class SqlProcessorBase(RecordProcessorBase):
         """
         # Flush any pending writes
         self.file_writer.flush_active_batches()
+        # Make sure the target schema exists.
+        self._ensure_schema_exists()
 
+        return self._finalize_stream_batches(stream_name, write_strategy)
+
+    @final
+    def _finalize_stream_batches(
+        self,
+        stream_name: str,
+        write_strategy: WriteStrategy,
+    ) -> list[BatchHandle]:
+        """Finalize the uncommitted batches of a stream, once pending writes are flushed and the
+        target schema exists.
+        """
         with self.finalizing_batches(stream_name) as batches_to_finalize:
-            # Make sure the target schema and target table exist.
-            self._ensure_schema_exists()
+            # Make sure the target table exists.
             final_table_name = self._ensure_final_table_exists(
                 stream_name,
                 create_if_missing=True,
@@ -556,7 +627,11 @@ class SqlProcessorBase(RecordProcessorBase):
 
         progress.log_batches_finalizing(stream_name, len(batches_to_finalize))
         yield batches_to_finalize
-        self._finalize_state_messages(state_messages_to_finalize)
+        if self._held_state_messages is None:
+            self._finalize_state_messages(state_messages_to_finalize)
+        else:
+            # Released by `write_all_stream_data()`, in stream order.
+            self._held_state_messages[stream_name] = state_messages_to_finalize
         progress.log_batches_finalized(stream_name, len(batches_to_finalize))
 
         for batch_handle in batches_to_finalize:
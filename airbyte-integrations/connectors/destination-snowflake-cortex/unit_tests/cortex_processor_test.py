@@ -0,0 +1,150 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from airbyte.secrets import SecretString
+from airbyte.strategies import WriteStrategy
+from airbyte_cdk.models import (
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStream,
+    AirbyteStreamState,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    StreamDescriptor,
+    SyncMode,
+)
+
+from destination_snowflake_cortex import cortex_processor
+from destination_snowflake_cortex.common.catalog.catalog_providers import CatalogProvider
+from destination_snowflake_cortex.config import ConfigModel
+
+
+class TestSnowflakeCortexSqlProcessor(unittest.TestCase):
+    def setUp(self):
+        self.config = ConfigModel.parse_obj({
+            "processing": {"text_fields": ["str_col"], "metadata_fields": [], "chunk_size": 1000},
+            "embedding": {"mode": "openai", "openai_key": "mykey"},
+            "indexing": {
+                "host": "MYACCOUNT",
+                "role": "MYUSERNAME",
+                "warehouse": "MYWAREHOUSE",
+                "database": "MYDATABASE",
+                "default_schema": "MYSCHEMA",
+                "username": "MYUSERNAME",
+                "credentials": {"password": "xxxxxxx"},
+            },
+        })
+        self.catalog = ConfiguredAirbyteCatalog(
+            streams=[
+                ConfiguredAirbyteStream(
+                    stream=AirbyteStream(
+                        name=f"stream{i}",
+                        json_schema={
+                            "type": "object",
+                            "properties": {"str_col": {"type": "string"}},
+                        },
+                        supported_sync_modes=[SyncMode.full_refresh],
+                    ),
+                    sync_mode=SyncMode.full_refresh,
+                    destination_sync_mode=DestinationSyncMode.overwrite,
+                )
+                for i in range(3)
+            ]
+        )
+
+    def _create_processor(self) -> cortex_processor.SnowflakeCortexSqlProcessor:
+        with patch.object(cortex_processor.SnowflakeCortexSqlProcessor, "_ensure_schema_exists"):
+            processor = cortex_processor.SnowflakeCortexSqlProcessor(
+                sql_config=cortex_processor.SnowflakeCortexConfig(
+                    host=self.config.indexing.host,
+                    role=self.config.indexing.role,
+                    warehouse=self.config.indexing.warehouse,
+                    database=self.config.indexing.database,
+                    schema_name=self.config.indexing.default_schema,
+                    username=self.config.indexing.username,
+                    password=SecretString(self.config.indexing.credentials.password),
+                ),
+                splitter_config=self.config.processing,
+                embedder_config=self.config.embedding,
+                catalog_provider=CatalogProvider(self.catalog),
+                temp_dir=Path("/tmp"),
+            )
+        processor.file_writer = MagicMock()
+        processor.file_writer.get_pending_batches.return_value = []
+        processor._state_writer = MagicMock()
+        processor._engine = MagicMock()
+        for i in range(3):
+            processor._pending_state_messages[f"stream{i}"].append(
+                AirbyteStateMessage(
+                    type=AirbyteStateType.STREAM,
+                    stream=AirbyteStreamState(
+                        stream_descriptor=StreamDescriptor(name=f"stream{i}"),
+                        stream_state={"i": i},
+                    ),
+                )
+            )
+        return processor
+
+    def _written_states(self, processor) -> list:
+        return [
+            call.kwargs["state_message"].stream.stream_descriptor.name
+            for call in processor._state_writer.write_state.call_args_list
+        ]
+
+    def test_streams_are_finalized_concurrently_and_states_released_in_order(self):
+        processor = self._create_processor()
+        stream_names = processor.catalog_provider.stream_names
+        finalizing_threads = set()
+
+        def ensure_final_table_exists(stream_name, create_if_missing):
+            finalizing_threads.add(threading.current_thread().name)
+            # the first stream is the slowest, its state must still be released first
+            if stream_name == stream_names[0]:
+                time.sleep(0.2)
+            return stream_name
+
+        final_table_patch = patch.object(
+            processor, "_ensure_final_table_exists", side_effect=ensure_final_table_exists
+        )
+        with patch.object(processor, "_ensure_schema_exists") as ensure_schema_exists:
+            with final_table_patch:
+                processor.write_all_stream_data(write_strategy=WriteStrategy.AUTO)
+
+        self.assertGreater(len(finalizing_threads), 1)
+        # pending writes and the schema are handled once, before the workers start
+        processor.file_writer.flush_active_batches.assert_called_once()
+        ensure_schema_exists.assert_called_once()
+        processor._engine.dispose.assert_called_once()
+        self.assertEqual(self._written_states(processor), stream_names)
+        self.assertIsNone(processor._held_state_messages)
+
+    def test_failing_stream_disposes_the_engine_and_holds_its_states(self):
+        processor = self._create_processor()
+        stream_names = processor.catalog_provider.stream_names
+
+        def ensure_final_table_exists(stream_name, create_if_missing):
+            if stream_name == stream_names[1]:
+                raise RuntimeError("finalization failure")
+            return stream_name
+
+        final_table_patch = patch.object(
+            processor, "_ensure_final_table_exists", side_effect=ensure_final_table_exists
+        )
+        with patch.object(processor, "_ensure_schema_exists") as ensure_schema_exists:
+            with final_table_patch, self.assertRaises(RuntimeError):
+                processor.write_all_stream_data(write_strategy=WriteStrategy.AUTO)
+
+        processor.file_writer.flush_active_batches.assert_called_once()
+        ensure_schema_exists.assert_called_once()
+        processor._engine.dispose.assert_called_once()
+        # the states of the failing stream and of the streams after it are not released
+        self.assertEqual(self._written_states(processor), stream_names[:1])
+        self.assertIsNone(processor._held_state_messages)
@@ -10,11 +10,14 @@ import sqlite3
 import uuid
 from asyncio.log import logger
 from collections import defaultdict
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, List, Mapping, Tuple
 
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
 
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_CACHED_STATEMENTS = 128
+
 
 class DestinationSqlite(Destination):
     @staticmethod
@@ -55,75 +58,105 @@ class DestinationSqlite(Destination):
         streams = {s.stream.name for s in configured_catalog.streams}
         path = config.get("destination_path")
         path = self._get_destination_path(path)
-        con = sqlite3.connect(path)
-        with con:
-            # create the tables if needed
-            for configured_stream in configured_catalog.streams:
-                name = configured_stream.stream.name
-                table_name = f"_airbyte_raw_{name}"
-                if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
-                    # delete the tables
+        bulk_load = config.get("bulk_load", False)
+        batch_size = config.get("batch_size", DEFAULT_BATCH_SIZE)
+        # the sqlite3 module caches compiled statements by query text, make room for one insert statement per stream
+        con = sqlite3.connect(path, cached_statements=max(DEFAULT_CACHED_STATEMENTS, len(streams)))
+        journal_mode = None
+        try:
+            if bulk_load:
+                journal_mode = con.execute("PRAGMA journal_mode").fetchone()[0]
+                con.execute("PRAGMA journal_mode=WAL")
+                con.execute("PRAGMA synchronous=NORMAL")
+            with con:
+                # create the tables if needed
+                for configured_stream in configured_catalog.streams:
+                    name = configured_stream.stream.name
+                    table_name = f"_airbyte_raw_{name}"
+                    if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
+                        # delete the tables
+                        query = """
+                        DROP TABLE IF EXISTS {}
+                        """.format(
+                            table_name
+                        )
+                        con.execute(query)
+                    # create the table if needed
                     query = """
-                    DROP TABLE IF EXISTS {}
+                    CREATE TABLE IF NOT EXISTS {table_name} (
+                        _airbyte_ab_id TEXT PRIMARY KEY,
+                        _airbyte_emitted_at TEXT,
+                        _airbyte_data TEXT
+                    )
                     """.format(
-                        table_name
+                        table_name=table_name
                     )
                     con.execute(query)
-                # create the table if needed
-                query = """
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    _airbyte_ab_id TEXT PRIMARY KEY,
-                    _airbyte_emitted_at TEXT,
-                    _airbyte_data TEXT
-                )
-                """.format(
-                    table_name=table_name
-                )
-                con.execute(query)
-
-            buffer = defaultdict(list)
-
-            for message in input_messages:
-                if message.type == Type.STATE:
-                    # flush the buffer
-                    for stream_name in buffer.keys():
-
-                        query = """
-                        INSERT INTO {table_name}
-                        VALUES (?,?,?)
-                        """.format(
-                            table_name=f"_airbyte_raw_{stream_name}"
-                        )
-
-                        con.executemany(query, buffer[stream_name])
 
+                # build the insert queries once so that every flush reuses the same prepared statement
+                insert_queries = {
+                    name: """
+                    INSERT INTO {table_name}
+                    VALUES (?,?,?)
+                    """.format(
+                        table_name=f"_airbyte_raw_{name}"
+                    )
+                    for name in streams
+                }
+                buffer = defaultdict(list)
+                buffered_rows = 0
+
+                for message in input_messages:
+                    if message.type == Type.STATE:
+                        # flush the buffer
+                        self._flush(con, buffer, insert_queries)
+                        buffer = defaultdict(list)
+                        buffered_rows = 0
+
+                        yield message
+                    elif message.type == Type.RECORD:
+                        data = message.record.data
+                        stream = message.record.stream
+                        if stream not in streams:
+                            logger.debug(f"Stream {stream} was not present in configured streams, skipping")
+                            continue
+
+                        # add to buffer
+                        buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
+                        buffered_rows += 1
+
+                        if bulk_load and buffered_rows >= batch_size:
+                            # bound the size of each transaction instead of waiting for the next state message
+                            self._flush(con, buffer, insert_queries)
+                            buffer = defaultdict(list)
+                            buffered_rows = 0
+
+                # flush any remaining messages
+                self._flush(con, buffer, insert_queries)
+
+                if bulk_load and config.get("create_emitted_at_index", False):
+                    # building the index once after the load is much cheaper than maintaining it on every insert
+                    for name in streams:
+                        table_name = f"_airbyte_raw_{name}"
+                        con.execute(f"CREATE INDEX IF NOT EXISTS {table_name}_emitted_at ON {table_name} (_airbyte_emitted_at)")
                     con.commit()
-                    buffer = defaultdict(list)
-
-                    yield message
-                elif message.type == Type.RECORD:
-                    data = message.record.data
-                    stream = message.record.stream
-                    if stream not in streams:
-                        logger.debug(f"Stream {stream} was not present in configured streams, skipping")
-                        continue
+        finally:
+            # also when the sync fails, so that the database is left in its original journal mode
+            try:
+                if journal_mode is not None:
+                    # fold the write-ahead log back into the database file and restore the original journal mode
+                    con.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                    con.execute(f"PRAGMA journal_mode={journal_mode}")
+            finally:
+                con.close()
 
-                    # add to buffer
-                    buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
-
-            # flush any remaining messages
-            for stream_name in buffer.keys():
-
-                query = """
-                INSERT INTO {table_name}
-                VALUES (?,?,?)
-                """.format(
-                    table_name=f"_airbyte_raw_{stream_name}"
-                )
-
-                con.executemany(query, buffer[stream_name])
+    @staticmethod
+    def _flush(con: sqlite3.Connection, buffer: Mapping[str, List[Tuple[str, str, str]]], insert_queries: Mapping[str, str]):
+        """Insert the buffered rows of every stream and commit them in a single transaction."""
+        for stream_name, rows in buffer.items():
+            con.executemany(insert_queries[stream_name], rows)
 
-            con.commit()
+        con.commit()
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
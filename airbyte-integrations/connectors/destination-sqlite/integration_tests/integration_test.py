@@ -135,3 +135,65 @@ def test_write(
     assert len(result) == 2
     assert result[0][2] == json.dumps(airbyte_message1.record.data)
     assert result[1][2] == json.dumps(airbyte_message2.record.data)
+
+
+@pytest.mark.parametrize("config", ["local_file_config"])
+def test_write_bulk_load(
+    config: Dict[str, str],
+    request,
+    configured_catalogue: ConfiguredAirbyteCatalog,
+    test_table_name: str,
+):
+    config = {**request.getfixturevalue(config), "bulk_load": True, "batch_size": 3, "create_emitted_at_index": True}
+    messages = [
+        AirbyteMessage(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage(
+                stream=test_table_name, data={"bulk_load_key": f"value{i}"}, emitted_at=int(datetime.now().timestamp()) * 1000
+            ),
+        )
+        for i in range(10)
+    ]
+    destination = DestinationSqlite()
+    result = list(destination.write(config=config, configured_catalog=configured_catalogue, input_messages=messages))
+    assert len(result) == 0
+
+    con = sqlite3.connect(config.get("destination_path"))
+    with con:
+        # the table is shared with the other tests of the module
+        count = con.execute(
+            f"SELECT count(*) FROM _airbyte_raw_{test_table_name} WHERE json_extract(_airbyte_data, '$.bulk_load_key') IS NOT NULL"
+        ).fetchone()[0]
+        indexes = [row[1] for row in con.execute(f"PRAGMA index_list(_airbyte_raw_{test_table_name})")]
+        journal_mode = con.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert count == 10
+    assert f"_airbyte_raw_{test_table_name}_emitted_at" in indexes
+    assert journal_mode == "delete"
+
+
+@pytest.mark.parametrize("config", ["local_file_config"])
+def test_write_bulk_load_failure_restores_journal_mode(
+    config: Dict[str, str],
+    request,
+    configured_catalogue: ConfiguredAirbyteCatalog,
+    test_table_name: str,
+):
+    config = {**request.getfixturevalue(config), "bulk_load": True}
+
+    def failing_messages():
+        yield AirbyteMessage(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage(stream=test_table_name, data={"key1": "value"}, emitted_at=int(datetime.now().timestamp()) * 1000),
+        )
+        raise RuntimeError("source failure")
+
+    destination = DestinationSqlite()
+    with pytest.raises(RuntimeError):
+        list(destination.write(config=config, configured_catalog=configured_catalogue, input_messages=failing_messages()))
+
+    con = sqlite3.connect(config.get("destination_path"))
+    with con:
+        journal_mode = con.execute("PRAGMA journal_mode").fetchone()[0]
+    con.close()
+    assert journal_mode == "delete"
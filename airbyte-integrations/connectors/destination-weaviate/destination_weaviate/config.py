@@ -64,6 +64,12 @@ class WeaviateIndexingConfigModel(BaseModel):
         ..., title="Authentication", description="Authentication method", discriminator="mode", type="object", order=2
     )
     batch_size: int = Field(title="Batch Size", description="The number of records to send to Weaviate in each batch", default=128)
+    parallel_batches: int = Field(
+        title="Parallel Batches",
+        description="The number of batches to send to Weaviate concurrently. While batches are slow to be written or fail, the batch size is reduced automatically, and grown back up to the configured batch size once the cluster keeps up.",
+        default=1,
+        ge=1,
+    )
     text_field: str = Field(title="Text Field", description="The field in the object that contains the embedded text", default="text")
     tenant_id: str = Field(title="Tenant ID", description="The tenant ID to use for multi tenancy", airbyte_secret=True, default="")
     default_vectorizer: str = Field(
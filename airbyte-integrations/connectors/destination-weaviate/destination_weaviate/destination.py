@@ -11,7 +11,7 @@ from airbyte_cdk.destinations.vector_db_based.document_processor import Document
 from airbyte_cdk.destinations.vector_db_based.embedder import Embedder, create_from_config
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
 from airbyte_cdk.destinations.vector_db_based.writer import Writer
-from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status
+from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, ConnectorSpecification, Status, Type
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode
 from destination_weaviate.config import ConfigModel
 from destination_weaviate.indexer import WeaviateIndexer
@@ -39,10 +39,15 @@ class DestinationWeaviate(Destination):
             config_model.processing,
             self.indexer,
             self.embedder,
-            batch_size=config_model.indexing.batch_size,
+            # hand over enough chunks at once to keep all parallel batches busy
+            batch_size=config_model.indexing.batch_size * config_model.indexing.parallel_batches,
             omit_raw_text=config_model.omit_raw_text,
         )
-        yield from writer.write(configured_catalog, input_messages)
+        for message in writer.write(configured_catalog, input_messages):
+            if message.type == Type.STATE:
+                # batches are written in the background, all records before the state have to be written before emitting it
+                self.indexer.flush()
+            yield message
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         parsed_config = ConfigModel.parse_obj(config)
@@ -6,10 +6,14 @@
 import json
 import logging
 import os
+import queue
 import re
+import threading
+import time
 import uuid
-from collections import defaultdict
-from typing import Optional
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, List, Optional, Tuple
 
 import weaviate
 from airbyte_cdk.destinations.vector_db_based.document_processor import METADATA_RECORD_ID_FIELD
@@ -26,31 +30,44 @@ class WeaviatePartialBatchError(Exception):
 
 CLOUD_DEPLOYMENT_MODE = "cloud"
 
+# Batches taking longer than this to be written shrink the batch size, batches taking less than half of it grow it back
+TARGET_BATCH_LATENCY_SECONDS = 10.0
+
+# properties, class name, object id and vector of an object to write
+WeaviateObject = Tuple[dict, str, str, Any]
+
 
 class WeaviateIndexer(Indexer):
     config: WeaviateIndexingConfigModel
 
     def __init__(self, config: WeaviateIndexingConfigModel):
         super().__init__(config)
+        self._batch_size = config.batch_size
+        self._batch_size_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._idle_clients: "queue.Queue[weaviate.Client]" = queue.Queue()
+        self._in_flight: Deque[Future] = deque()
 
     def _create_client(self):
+        self.client = self._new_client()
+
+    def _new_client(self) -> weaviate.Client:
         headers = {
             self.config.additional_headers[i].header_key: self.config.additional_headers[i].value
             for i in range(len(self.config.additional_headers))
         }
         if self.config.auth.mode == "username_password":
             credentials = weaviate.auth.AuthClientPassword(self.config.auth.username, self.config.auth.password)
-            self.client = weaviate.Client(url=self.config.host, auth_client_secret=credentials, additional_headers=headers)
+            client = weaviate.Client(url=self.config.host, auth_client_secret=credentials, additional_headers=headers)
         elif self.config.auth.mode == "token":
             credentials = weaviate.auth.AuthApiKey(self.config.auth.token)
-            self.client = weaviate.Client(url=self.config.host, auth_client_secret=credentials, additional_headers=headers)
+            client = weaviate.Client(url=self.config.host, auth_client_secret=credentials, additional_headers=headers)
         else:
-            self.client = weaviate.Client(url=self.config.host, additional_headers=headers)
+            client = weaviate.Client(url=self.config.host, additional_headers=headers)
 
         # disable dynamic batching because it's handled asynchroniously in the client
-        self.client.batch.configure(
-            batch_size=None, dynamic=False, weaviate_error_retries=weaviate.WeaviateErrorRetryConf(number_retries=5)
-        )
+        client.batch.configure(batch_size=None, dynamic=False, weaviate_error_retries=weaviate.WeaviateErrorRetryConf(number_retries=5))
+        return client
 
     def _add_tenant_to_class_if_missing(self, class_name: str):
         class_tenants = self.client.schema.get_class_tenants(class_name=class_name)
@@ -75,6 +92,11 @@ class WeaviateIndexer(Indexer):
 
     def pre_sync(self, catalog: ConfiguredAirbyteCatalog) -> None:
         self._create_client()
+        if self.config.parallel_batches > 1:
+            # the batch of a client is a buffer that is not thread-safe, so every worker sends its batches with a client of its own
+            for _ in range(self.config.parallel_batches):
+                self._idle_clients.put(self._new_client())
+            self._executor = ThreadPoolExecutor(max_workers=self.config.parallel_batches, thread_name_prefix="weaviate-batch")
         classes = {c["class"]: c for c in self.client.schema.get().get("classes", [])}
         self.has_record_id_metadata = defaultdict(lambda: False)
 
@@ -119,8 +141,17 @@ class WeaviateIndexer(Indexer):
                     prop.get("name") == METADATA_RECORD_ID_FIELD for prop in schema.get("properties", {})
                 )
 
+    def post_sync(self):
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        return super().post_sync()
+
     def delete(self, delete_ids, namespace, stream):
         if len(delete_ids) > 0:
+            # chunks of the deleted records could still be in flight, they have to be written before they can be deleted
+            self.flush()
             class_name = self._stream_to_class_name(stream)
             if self.has_record_id_metadata[class_name]:
                 where_filter = {"path": [METADATA_RECORD_ID_FIELD], "operator": "ContainsAny", "valueStringArray": delete_ids}
@@ -140,23 +171,43 @@ class WeaviateIndexer(Indexer):
         if len(document_chunks) == 0:
             return
 
-        # As a single record can be split into lots of documents, break them into batches as configured to not overwhelm the cluster
-        batches = create_chunks(document_chunks, batch_size=self.config.batch_size)
-        for batch in batches:
-            for i in range(len(batch)):
-                chunk = batch[i]
-                weaviate_object = {**self._normalize(chunk.metadata)}
-                if chunk.page_content is not None:
-                    weaviate_object[self.config.text_field] = chunk.page_content
-                object_id = str(uuid.uuid4())
-                class_name = self._stream_to_class_name(chunk.record.stream)
-                if self.config.tenant_id.strip():
-                    self.client.batch.add_data_object(
-                        weaviate_object, class_name, object_id, vector=chunk.embedding, tenant=self.config.tenant_id
-                    )
-                else:
-                    self.client.batch.add_data_object(weaviate_object, class_name, object_id, vector=chunk.embedding)
-            self._flush()
+        objects: List[WeaviateObject] = []
+        for chunk in document_chunks:
+            weaviate_object = {**self._normalize(chunk.metadata)}
+            if chunk.page_content is not None:
+                weaviate_object[self.config.text_field] = chunk.page_content
+            objects.append((weaviate_object, self._stream_to_class_name(chunk.record.stream), str(uuid.uuid4()), chunk.embedding))
+
+        # As a single record can be split into lots of documents, break them into batches to not overwhelm the cluster.
+        # The batch size is picked again for every batch as it adapts to how fast the cluster writes them.
+        start = 0
+        while start < len(objects):
+            batch = objects[start : start + min(self._batch_size, self.config.batch_size)]
+            start += len(batch)
+            if self._executor is None:
+                self._write_batch(self.client, batch)
+            else:
+                self._submit(batch)
+
+    def flush(self) -> None:
+        """
+        Wait until all batches sent so far are written, raising the error of the first failed batch.
+        """
+        while self._in_flight:
+            self._in_flight.popleft().result()
+
+    def _submit(self, batch: List[WeaviateObject]) -> None:
+        # Back-pressure: once enough batches are in flight, wait for the oldest one to be written before sending more
+        while len(self._in_flight) >= self.config.parallel_batches:
+            self._in_flight.popleft().result()
+        self._in_flight.append(self._executor.submit(self._write_batch_with_idle_client, batch))
+
+    def _write_batch_with_idle_client(self, batch: List[WeaviateObject]) -> None:
+        client = self._idle_clients.get()
+        try:
+            self._write_batch(client, batch)
+        finally:
+            self._idle_clients.put(client)
 
     def _stream_to_class_name(self, stream_name: str) -> str:
         pattern = "[^0-9A-Za-z_]+"
@@ -194,8 +245,28 @@ class WeaviateIndexer(Indexer):
 
         return result
 
-    def _flush(self, retries: int = 3):
-        results = self.client.batch.create_objects()
+    def _write_batch(self, client: weaviate.Client, batch: List[WeaviateObject], retries: int = 3):
+        for weaviate_object, class_name, object_id, vector in batch:
+            if self.config.tenant_id.strip():
+                client.batch.add_data_object(weaviate_object, class_name, object_id, vector=vector, tenant=self.config.tenant_id)
+            else:
+                client.batch.add_data_object(weaviate_object, class_name, object_id, vector=vector)
+
+        start_time = time.monotonic()
+        try:
+            results = client.batch.create_objects()
+        except Exception as e:
+            client.batch.empty_objects()
+            if retries == 0 or len(batch) == 1:
+                raise
+            # Objects keep their ids, so sending them again overwrites whatever was written before the failure
+            self._shrink_batch_size()
+            logging.warning(f"Writing a batch of {len(batch)} objects failed, retrying in smaller batches: {format_exception(e)}")
+            for smaller_batch in create_chunks(batch, batch_size=(len(batch) + 1) // 2):
+                self._write_batch(client, list(smaller_batch), retries - 1)
+            return
+        self._adapt_batch_size(time.monotonic() - start_time)
+
         all_errors = []
 
         for result in results:
@@ -206,3 +277,15 @@ class WeaviateIndexer(Indexer):
         if len(all_errors) > 0:
             error_msg = "Errors while loading: " + ", ".join([str(error) for error in all_errors])
             raise WeaviatePartialBatchError(error_msg)
+
+    def _adapt_batch_size(self, latency: float) -> None:
+        if latency > TARGET_BATCH_LATENCY_SECONDS:
+            self._shrink_batch_size()
+        elif latency < TARGET_BATCH_LATENCY_SECONDS / 2:
+            with self._batch_size_lock:
+                self._batch_size = min(self.config.batch_size, self._batch_size + max(1, self.config.batch_size // 8))
+
+    def _shrink_batch_size(self) -> None:
+        with self._batch_size_lock:
+            self._batch_size = max(1, self._batch_size // 2)
+            logging.info(f"Reduced the batch size to {self._batch_size} objects")
@@ -6,7 +6,7 @@ import logging
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
-from airbyte_cdk.models import ConnectorSpecification, Status
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, ConnectorSpecification, Status, Type
 from destination_weaviate.config import ConfigModel
 from destination_weaviate.destination import DestinationWeaviate
 
@@ -85,6 +85,25 @@ class TestDestinationWeaviate(unittest.TestCase):
         MockedWriter.assert_called_once_with(self.config_model.processing, mock_indexer, mock_embedder, batch_size=128, omit_raw_text=False)
         mock_writer.write.assert_called_once_with(configured_catalog, input_messages)
 
+    @patch("destination_weaviate.destination.Writer")
+    @patch("destination_weaviate.destination.WeaviateIndexer")
+    @patch("destination_weaviate.destination.create_from_config")
+    def test_write_flushes_indexer_before_state(self, MockedEmbedder, MockedWeaviateIndexer, MockedWriter):
+        mock_indexer = Mock()
+        MockedWeaviateIndexer.return_value = mock_indexer
+        mock_writer = Mock()
+        MockedWriter.return_value = mock_writer
+        state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={}))
+        mock_writer.write.return_value = [state_message]
+
+        config = {**self.config, "indexing": {**self.config["indexing"], "parallel_batches": 4}}
+        destination = DestinationWeaviate()
+        result = list(destination.write(config, MagicMock(), []))
+
+        self.assertEqual(result, [state_message])
+        mock_indexer.flush.assert_called_once()
+        self.assertEqual(MockedWriter.call_args.kwargs["batch_size"], 512)
+
     def test_spec(self):
         destination = DestinationWeaviate()
         result = destination.spec()
@@ -276,3 +276,91 @@ class TestWeaviateIndexer(unittest.TestCase):
             ANY,
             vector=[1, 2, 3],
         )
+
+    def _chunks(self, count):
+        return [
+            Chunk(
+                page_content=f"content_{i}",
+                embedding=[i],
+                metadata={"someField": f"value_{i}"},
+                record=AirbyteRecordMessage(stream="test", data={"someField": f"value_{i}"}, emitted_at=0),
+            )
+            for i in range(count)
+        ]
+
+    @patch("destination_weaviate.indexer.weaviate.Client")
+    def test_index_parallel_batches(self, MockClient):
+        clients = [Mock() for _ in range(4)]
+        for client in clients:
+            client.schema.get.return_value = {"classes": []}
+            client.batch.create_objects.return_value = []
+        MockClient.side_effect = clients
+        self.indexer.config.batch_size = 2
+        self.indexer.config.parallel_batches = 3
+        self.indexer.pre_sync(self.mock_catalog)
+
+        self.indexer.index(self._chunks(9), None, "test")
+        self.indexer.flush()
+
+        # the main client is only used for schema operations, batches are sent by the worker clients
+        clients[0].batch.create_objects.assert_not_called()
+        assert sum(client.batch.create_objects.call_count for client in clients[1:]) == 5
+        assert sum(client.batch.add_data_object.call_count for client in clients[1:]) == 9
+        self.indexer.post_sync()
+
+    @patch("destination_weaviate.indexer.weaviate.Client")
+    def test_index_parallel_batches_propagates_error_on_flush(self, MockClient):
+        clients = [Mock() for _ in range(3)]
+        for client in clients:
+            client.schema.get.return_value = {"classes": []}
+            client.batch.create_objects.return_value = [{"result": {"errors": ["some_error"]}, "id": "some_id"}]
+        MockClient.side_effect = clients
+        self.indexer.config.parallel_batches = 2
+        self.indexer.pre_sync(self.mock_catalog)
+
+        self.indexer.index(self._chunks(2), None, "test")
+        with self.assertRaises(WeaviatePartialBatchError):
+            self.indexer.flush()
+
+    @patch("destination_weaviate.indexer.time.monotonic")
+    def test_index_adapts_batch_size_to_latency(self, MockMonotonic):
+        mock_client = Mock()
+        self.indexer.client = mock_client
+        mock_client.batch.create_objects.return_value = []
+        self.indexer.config.batch_size = 8
+        self.indexer._batch_size = 8
+
+        # the first batch is slow, the following ones are fast
+        MockMonotonic.side_effect = [0, 60, 60, 61, 61, 62]
+        self.indexer.index(self._chunks(17), None, "test")
+
+        batch_sizes = []
+        objects = 0
+        for name, _, _ in mock_client.method_calls:
+            if name == "batch.add_data_object":
+                objects += 1
+            elif name == "batch.create_objects":
+                batch_sizes.append(objects)
+                objects = 0
+        assert batch_sizes == [8, 4, 5]
+
+    def test_index_retries_failed_batch_in_smaller_batches(self):
+        mock_client = Mock()
+        self.indexer.client = mock_client
+        mock_client.batch.create_objects.side_effect = [Exception("timeout"), [], []]
+
+        self.indexer.index(self._chunks(4), None, "test")
+
+        assert mock_client.batch.create_objects.call_count == 3
+        mock_client.batch.empty_objects.assert_called_once()
+        assert mock_client.batch.add_data_object.call_count == 8
+        assert self.indexer._batch_size < self.config.batch_size
+
+    def test_index_raises_when_retries_are_exhausted(self):
+        mock_client = Mock()
+        self.indexer.client = mock_client
+        mock_client.batch.create_objects.side_effect = Exception("unavailable")
+
+        with self.assertRaises(Exception):
+            self.indexer.index(self._chunks(2), None, "test")
+        assert mock_client.batch.create_objects.call_count == 2
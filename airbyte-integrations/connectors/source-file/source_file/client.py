@@ -3,25 +3,37 @@
 #
 
 
+import codecs
+import hashlib
+import io
+import itertools
 import json
 import logging
 import os
+import random
+import shutil
 import sys
 import tempfile
 import traceback
 import urllib
 import zipfile
 from os import environ
-from typing import Iterable
+from typing import Iterable, List, Optional, Set
 from urllib.parse import urlparse
 from zipfile import BadZipFile
 
 import backoff
 import boto3
 import botocore
+import fastparquet
 import google
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.orc as pa_orc
+import requests
 import smart_open
 import smart_open.ssh
 from airbyte_cdk.entrypoint import logger
@@ -41,6 +53,7 @@ from yaml import safe_load
 from .utils import LOCAL_STORAGE_NAME, backoff_handler
 
 SSH_TIMEOUT = 60
+HTTP_TIMEOUT = 60
 
 # Force the log level of the smart-open logger to ERROR - https://github.com/airbytehq/airbyte/pull/27157
 logging.getLogger("smart_open").setLevel(logging.ERROR)
@@ -148,10 +161,8 @@ class URLFile:
                 uri = f"{storage}{user}@{host}:{port}/{url}"
             return smart_open.open(uri, transport_params=transport_params, **self.args)
         elif storage in ("https://", "http://"):
-            transport_params = None
-            if "user_agent" in self._provider and self._provider["user_agent"]:
-                airbyte_version = environ.get("AIRBYTE_VERSION", "0.0")
-                transport_params = {"headers": {"Accept-Encoding": "identity", "User-Agent": f"Airbyte/{airbyte_version}"}}
+            headers = self._http_headers()
+            transport_params = {"headers": headers} if headers else None
             logger.info(f"TransportParams: {transport_params}")
             return smart_open.open(self.full_url, transport_params=transport_params, **self.args)
         return smart_open.open(self.full_url, **self.args)
@@ -197,7 +208,43 @@ class URLFile:
         logger.error(f"Unknown Storage provider in: {self._url}")
         return ""
 
-    def _open_gcs_url(self) -> object:
+    def content_version(self) -> Optional[str]:
+        """Identify the current content of the file from its metadata, without downloading it
+
+        :return: the ETag of the file, or its size and modification time, None when the provider doesn't expose them
+        """
+        storage = self.storage_scheme
+        try:
+            if storage == "file://":
+                stat = os.stat(os.path.expanduser(self.url))
+                return f"{stat.st_size}-{stat.st_mtime_ns}"
+            elif storage in ("https://", "http://"):
+                response = requests.head(self.full_url, headers=self._http_headers(), allow_redirects=True, timeout=HTTP_TIMEOUT)
+                response.raise_for_status()
+                etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    return etag or f"{last_modified}-{response.headers.get('Content-Length')}"
+            elif storage == "s3://":
+                bucket, key = self.url.split("/", 1)
+                return self._aws_client().head_object(Bucket=bucket, Key=key)["ETag"]
+            elif storage == "gs://":
+                bucket, key = self.url.split("/", 1)
+                blob = self._gcs_client().bucket(bucket).get_blob(key)
+                return blob.etag if blob else None
+            elif storage == "azure://":
+                container, blob = self.url.split("/", 1)
+                return self._azblob_client().get_blob_client(container, blob).get_blob_properties().etag
+        except Exception as err:
+            logger.info(f"Failed to read the metadata of {self.full_url}: {repr(err)}")
+        return None
+
+    def _http_headers(self) -> Optional[dict]:
+        if "user_agent" in self._provider and self._provider["user_agent"]:
+            airbyte_version = environ.get("AIRBYTE_VERSION", "0.0")
+            return {"Accept-Encoding": "identity", "User-Agent": f"Airbyte/{airbyte_version}"}
+        return None
+
+    def _gcs_client(self) -> GCSClient:
         service_account_json = self._provider.get("service_account_json")
         credentials = None
         if service_account_json:
@@ -213,7 +260,10 @@ class URLFile:
             client = GCSClient(credentials=credentials, project=credentials._project_id)
         else:
             client = GCSClient.create_anonymous_client()
-        file_to_close = smart_open.open(self.full_url, transport_params={"client": client}, **self.args)
+        return client
+
+    def _open_gcs_url(self) -> object:
+        file_to_close = smart_open.open(self.full_url, transport_params={"client": self._gcs_client()}, **self.args)
 
         return file_to_close
 
@@ -228,12 +278,19 @@ class URLFile:
             url = f"{self.storage_scheme}{aws_access_key_id}:{aws_secret_access_key}@{self.url}"
             result = smart_open.open(url, **self.args)
         else:
-            config = botocore.client.Config(signature_version=botocore.UNSIGNED)
-            params = {"client": boto3.client("s3", config=config)}
+            params = {"client": self._aws_client()}
             result = smart_open.open(self.full_url, transport_params=params, **self.args)
         return result
 
-    def _open_azblob_url(self):
+    def _aws_client(self):
+        aws_access_key_id = self._provider.get("aws_access_key_id")
+        aws_secret_access_key = self._provider.get("aws_secret_access_key")
+        if aws_access_key_id and aws_secret_access_key:
+            return boto3.client("s3", aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key)
+        config = botocore.client.Config(signature_version=botocore.UNSIGNED)
+        return boto3.client("s3", config=config)
+
+    def _azblob_client(self) -> BlobServiceClient:
         storage_account = self._provider.get("storage_account")
         storage_acc_url = f"https://{storage_account}.blob.core.windows.net"
         sas_token = self._provider.get("sas_token", None)
@@ -246,27 +303,157 @@ class URLFile:
         else:
             # assuming anonymous public read access given no credential
             client = BlobServiceClient(account_url=storage_acc_url)
+        return client
 
+    def _open_azblob_url(self):
         url = f"{self.storage_scheme}{self.url}"
-        return smart_open.open(url, transport_params=dict(client=client), **self.args)
+        return smart_open.open(url, transport_params=dict(client=self._azblob_client()), **self.args)
+
+
+class _ReplayStream(io.RawIOBase):
+    """Binary stream returning `head`, then the rest of `fp`: lets the header of a non seekable file be parsed before reading it"""
+
+    def __init__(self, head: bytes, fp):
+        self._head = memoryview(head)
+        self._fp = fp
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._head:
+            size = min(len(buffer), len(self._head))
+            buffer[:size] = self._head[:size]
+            self._head = self._head[size:]
+            return size
+        data = self._fp.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class _CountingStream:
+    """Proxy of a file object counting the bytes (characters in text mode) read from it, to stop sampling after a byte budget"""
+
+    def __init__(self, fp):
+        self._fp = fp
+        self.bytes_read = 0
+
+    def __getattr__(self, name):
+        return getattr(self._fp, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self._fp)
+        self.bytes_read += len(line)
+        return line
+
+    @property
+    def mode(self) -> str:
+        # pandas decodes the streams it considers binary
+        return "rb" if isinstance(self._fp, (io.BufferedIOBase, io.RawIOBase)) else getattr(self._fp, "mode", "r")
+
+    def _count(self, data):
+        self.bytes_read += len(data)
+        return data
+
+    def read(self, size=-1):
+        return self._count(self._fp.read(size))
+
+    def read1(self, size=-1):
+        return self._count(self._fp.read1(size))
+
+    def readline(self, size=-1):
+        return self._count(self._fp.readline(size))
+
+    def readinto(self, buffer) -> int:
+        size = self._fp.readinto(buffer)
+        self.bytes_read += size or 0
+        return size
 
 
 class Client:
     """Class that manages reading and parsing data from streams"""
 
     CSV_CHUNK_SIZE = 10_000
+    # Size of the blocks of csv files parsed at once by pyarrow, their rows are regrouped into chunks of CSV_CHUNK_SIZE rows
+    ARROW_CSV_BLOCK_SIZE = 1 << 20
+    # Size of the chunks copied at once when a stream has to be cached to a temporary file
+    CACHE_STREAM_CHUNK_SIZE = 1 << 20
     binary_formats = {"excel", "excel_binary", "feather", "parquet", "orc", "pickle"}
-
-    def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: dict = None):
+    # Formats read in chunks (row groups, stripes or record batches) when the only reader option is `columns`
+    columnar_formats = {"feather", "parquet", "orc"}
+    # Reader options honoured by the pyarrow csv reader, pandas.read_csv is used when other options are provided
+    arrow_csv_reader_options = {
+        "sep",
+        "delimiter",
+        "quotechar",
+        "escapechar",
+        "doublequote",
+        "encoding",
+        "header",
+        "names",
+        "skiprows",
+        "na_values",
+    }
+    # Strings parsed as null values by pandas.read_csv
+    csv_null_values = pa_csv.ConvertOptions().null_values + ["None", "<NA>"]
+    # Strings parsed as integers and booleans by pandas.read_csv, integers are parsed once stripped of whitespaces and of a plus sign
+    csv_integer_pattern = r"^-?\d+$"
+    csv_infinity_pattern = r"(?i)^-?inf(inity)?$"
+    csv_bool_values = pa.array(["true", "false"])
+    # Sampling modes of the schema_inference option, with the setting bounding the sample of each one
+    sampling_modes = {"first_rows": "rows", "byte_budget": "max_bytes", "reservoir": "rows"}
+    # Seed of the reservoir sampling, so that discovering the same file twice gives the same schema
+    SAMPLING_SEED = 0
+    # Directory of the inferred schemas, caching can be disabled by setting the variable to an empty string
+    SCHEMA_CACHE_DIR_ENV = "SOURCE_FILE_SCHEMA_CACHE_DIR"
+    # To increment when the inferred schemas change, so that the schemas cached by previous versions are not used anymore
+    SCHEMA_CACHE_VERSION = 1
+    # Provider fields which don't identify the file, and are not written to the cache even hashed
+    schema_cache_ignored_provider_fields = {
+        "password",
+        "aws_access_key_id",
+        "aws_secret_access_key",
+        "service_account_json",
+        "sas_token",
+        "shared_key",
+    }
+
+    def __init__(
+        self,
+        dataset_name: str,
+        url: str,
+        provider: dict,
+        format: str = None,
+        reader_options: dict = None,
+        schema_inference: dict = None,
+    ):
         self._dataset_name = dataset_name
         self._url = url
         self._provider = provider
         self._reader_format = format or "csv"
         self._reader_options = reader_options or {}
+        self._schema_inference = self._validate_schema_inference(schema_inference)
         self._is_zip = url.endswith(".zip")
         self.binary_source = self._reader_format in self.binary_formats or self._is_zip
         self.encoding = self._reader_options.get("encoding")
 
+    @classmethod
+    def _validate_schema_inference(cls, schema_inference: Optional[dict]) -> Optional[dict]:
+        if not schema_inference:
+            return None
+        sampling = schema_inference.get("sampling")
+        limit = schema_inference.get(cls.sampling_modes.get(sampling))
+        if sampling not in cls.sampling_modes or not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            error_msg = (
+                f"Invalid schema inference settings {schema_inference}: the sampling should be one of {', '.join(cls.sampling_modes)}, "
+                "with a positive number of rows or bytes."
+            )
+            raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error)
+        return {"sampling": sampling, cls.sampling_modes[sampling]: limit}
+
     @property
     def reader_class(self):
         if is_cloud_environment():
@@ -284,7 +471,8 @@ class Client:
         # Use Genson Library to take JSON objects and generate schemas that describe them,
         builder = SchemaBuilder()
         if self._reader_format == "jsonl":
-            for o in self.read():
+            fp = _CountingStream(fp)
+            for o in self._sample_records(self._iter_json_lines(fp), fp):
                 builder.add_object(o)
         else:
             builder.add_object(json.load(fp))
@@ -299,27 +487,32 @@ class Client:
 
     def load_nested_json(self, fp) -> list:
         if self._reader_format == "jsonl":
-            result = []
-            line = fp.readline()
-            while line:
-                result.append(json.loads(line))
-                line = fp.readline()
+            result = list(self._iter_json_lines(fp))
         else:
             result = json.load(fp)
             if not isinstance(result, list):
                 result = [result]
         return result
 
+    @staticmethod
+    def _iter_json_lines(fp) -> Iterable:
+        line = fp.readline()
+        while line:
+            yield json.loads(line)
+            line = fp.readline()
+
     def load_yaml(self, fp):
         if self._reader_format == "yaml":
             return pd.DataFrame(safe_load(fp))
 
-    def load_dataframes(self, fp, skip_data=False, read_sample_chunk: bool = False) -> Iterable:
+    def load_dataframes(self, fp, skip_data=False, read_sample_chunk: bool = False, chunk_size: int = None, fields: Set = None) -> Iterable:
         """load and return the appropriate pandas dataframe.
 
         :param fp: file-like object to read from
         :param skip_data: limit reading data
         :param read_sample_chunk: indicates whether a single chunk should only be read to generate schema
+        :param chunk_size: number of rows of the chunks of csv files, CSV_CHUNK_SIZE by default
+        :param fields: columns to read from parquet, feather and orc files, all of them by default
         :return: a list of dataframe loaded from files described in the configuration
         """
         readers = {
@@ -350,7 +543,7 @@ class Client:
         try:
             if self._reader_format == "csv":
                 bytes_read = 0
-                reader_options["chunksize"] = self.CSV_CHUNK_SIZE
+                reader_options["chunksize"] = chunk_size or self.CSV_CHUNK_SIZE
                 if skip_data:
                     reader_options["nrows"] = 0
                     reader_options["index_col"] = 0
@@ -362,6 +555,8 @@ class Client:
             elif self._reader_format == "excel_binary":
                 reader_options["engine"] = "pyxlsb"
                 yield reader(fp, **reader_options)
+            elif self._reader_format in self.columnar_formats and set(reader_options) <= {"columns"}:
+                yield from self._load_columnar_dataframes(fp, fields)
             elif self._reader_format == "parquet":
                 reader_options["engine"] = "fastparquet"
                 yield reader(fp, **reader_options)
@@ -385,6 +580,233 @@ class Client:
             logger.error(f"{error_msg}\n{traceback.format_exc()}")
             raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error) from err
 
+    def _load_columnar_dataframes(self, fp, fields: Optional[Set]) -> Iterable[pd.DataFrame]:
+        """Read a parquet file row group by row group, an orc file stripe by stripe and a feather file record batch by record batch,
+        with the dtypes of pandas.read_parquet (with fastparquet), pandas.read_orc and pandas.read_feather"""
+        if self._reader_format == "parquet":
+            # like pandas.read_parquet, integer and boolean columns with nulls are read as floats
+            parquet_file = fastparquet.ParquetFile(fp, pandas_nulls=False)
+            yield from parquet_file.iter_row_groups(columns=self._select_columns(parquet_file.columns, fields))
+        elif self._reader_format == "orc":
+            orc_file = pa_orc.ORCFile(fp)
+            columns = self._select_columns(orc_file.schema.names, fields)
+            for stripe in range(orc_file.nstripes):
+                yield orc_file.read_stripe(stripe, columns=columns).to_pandas()
+        else:
+            try:
+                feather_file = pa.ipc.open_file(fp)
+            except pa.ArrowInvalid:
+                # Feather V1 files are not Arrow IPC files, they can only be read whole
+                fp.seek(0)
+                yield pd.read_feather(fp, **self._reader_options)
+                return
+            columns = self._select_columns(feather_file.schema.names, fields)
+            for index in range(feather_file.num_record_batches):
+                batch = feather_file.get_batch(index)
+                yield (batch.select(columns) if columns else batch).to_pandas()
+
+    def _select_columns(self, names: List[str], fields: Optional[Set]) -> Optional[List[str]]:
+        """Columns to read among the `columns` reader option and the selected fields, None to read all of them"""
+        columns = self._reader_options.get("columns")
+        return [name for name in names if (not fields or name in fields) and (not columns or name in columns)] or None
+
+    def load_record_batches(self, fp, fields: Set = None) -> Iterable[pa.RecordBatch]:
+        """load a csv file in batches of records with pyarrow, without materializing it whole.
+
+        :param fp: binary file-like object to read from
+        :param fields: columns to read, all of them by default
+        :return: the record batches read from the file
+        """
+        try:
+            yield from self._load_csv_record_batches(fp, fields)
+        except ConnectionResetError:
+            # retried by read
+            raise
+        except (pa.ArrowInvalid, OSError) as err:
+            raise self._arrow_parsing_error(fp, err) from err
+
+    def _arrow_parsing_error(self, fp, err: Exception) -> AirbyteTracedException:
+        error_msg = (
+            f"File {fp} can't be parsed with reader of chosen type ({self._reader_format}). "
+            f"Please check provided Format and Reader Options. {repr(err)}."
+        )
+        logger.error(f"{error_msg}\n{traceback.format_exc()}")
+        return AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error)
+
+    def _load_csv_record_batches(self, fp, fields: Optional[Set]) -> Iterable[pa.RecordBatch]:
+        options = self._arrow_csv_options()
+        column_names, skip_rows = options["column_names"], options["skip_rows"]
+        if not column_names:
+            head = fp.read(self.ARROW_CSV_BLOCK_SIZE)
+            column_names = self._read_csv_header(head, options)
+            # the header row is skipped as the names are now provided
+            skip_rows += 1
+            fp = _ReplayStream(head, fp)
+
+        # Every column is read as strings, then typed batch by batch like pandas types the chunks of csv files
+        columns = [name for name in column_names if not fields or name in fields] or column_names
+        reader = pa_csv.open_csv(
+            fp,
+            read_options=pa_csv.ReadOptions(
+                column_names=column_names, skip_rows=skip_rows, encoding=options["encoding"], block_size=self.ARROW_CSV_BLOCK_SIZE
+            ),
+            parse_options=options["parse_options"],
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in columns},
+                include_columns=columns,
+                null_values=options["null_values"],
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=True,
+            ),
+        )
+        # the rows are typed in chunks of CSV_CHUNK_SIZE rows like pandas.read_csv does, not block by block,
+        # so that the types of the columns don't depend on the size of the values
+        chunk = pa.Table.from_batches([], schema=reader.schema)
+        for batch in reader:
+            chunk = pa.concat_tables([chunk, pa.Table.from_batches([batch])])
+            while chunk.num_rows >= self.CSV_CHUNK_SIZE:
+                yield self._infer_csv_column_types(chunk.slice(0, self.CSV_CHUNK_SIZE).combine_chunks().to_batches()[0])
+                chunk = chunk.slice(self.CSV_CHUNK_SIZE)
+        if chunk.num_rows:
+            yield self._infer_csv_column_types(chunk.combine_chunks().to_batches()[0])
+
+    def _read_csv_header(self, head: bytes, options: dict) -> List[str]:
+        """Parse the column names of a csv file from its first bytes, deduplicated the way pandas does"""
+        text = codecs.getincrementaldecoder(options["encoding"])().decode(head)
+        # only complete lines are parsed
+        if "\n" in text:
+            text = text[: text.rindex("\n") + 1]
+        reader = pa_csv.open_csv(
+            io.BytesIO(text.encode("utf8")),
+            read_options=pa_csv.ReadOptions(skip_rows=options["skip_rows"]),
+            parse_options=options["parse_options"],
+        )
+        column_names = []
+        for index, name in enumerate(reader.schema.names):
+            name = name or f"Unnamed: {index}"
+            deduplicated_name, suffix = name, 0
+            while deduplicated_name in column_names:
+                suffix += 1
+                deduplicated_name = f"{name}.{suffix}"
+            column_names.append(deduplicated_name)
+        return column_names
+
+    @classmethod
+    def _infer_csv_column_types(cls, batch: pa.RecordBatch) -> pa.RecordBatch:
+        return pa.RecordBatch.from_arrays([cls._infer_csv_column_type(column) for column in batch.columns], names=batch.schema.names)
+
+    @classmethod
+    def _infer_csv_column_type(cls, column: pa.Array) -> pa.Array:
+        """Type a column of strings the way pandas.read_csv types the columns of a chunk: integer, float, boolean, else string"""
+        numbers = pc.replace_substring_regex(pc.utf8_trim_whitespace(column), pattern=r"^\+", replacement="")
+        # `all` is null for a column of nulls, which pandas reads as floats
+        if pc.all(pc.match_substring_regex(numbers, cls.csv_integer_pattern)).as_py() is not False:
+            for arrow_type in (pa.int64(), pa.uint64()):
+                try:
+                    integers = numbers.cast(arrow_type)
+                except pa.ArrowInvalid:
+                    continue
+                # pandas reads the integer columns with missing values as floats
+                return integers.cast(pa.float64()) if integers.null_count else integers
+            # integers too large for 64 bits are kept as strings
+            return column
+        try:
+            # failing to cast a whole column is slow, the first values are tried first to rule out most columns quickly
+            numbers.slice(0, 100).cast(pa.float64())
+            floats = numbers.cast(pa.float64())
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+        else:
+            # pandas keeps the columns with values overflowing floats (1e400) as strings, unlike the infinity literals
+            overflows = pc.and_(pc.is_inf(floats), pc.invert(pc.match_substring_regex(numbers, cls.csv_infinity_pattern)))
+            return column if pc.any(overflows).as_py() else floats
+        lowered = pc.utf8_lower(column)
+        if pc.all(pc.or_(pc.is_in(lowered, value_set=cls.csv_bool_values), pc.is_null(column))).as_py():
+            return pc.equal(lowered, "true")
+        return column
+
+    @staticmethod
+    def record_batch_to_records(batch: pa.RecordBatch) -> List[dict]:
+        """Convert a batch to records, column by column: converting flat columns through pandas is much faster than RecordBatch.to_pylist"""
+        columns = []
+        for column in batch.columns:
+            if pa.types.is_integer(column.type) or pa.types.is_boolean(column.type) or pa.types.is_string(column.type):
+                columns.append(column.to_pandas(integer_object_nulls=True).tolist())
+            elif pa.types.is_floating(column.type):
+                values = column.to_pandas()
+                # nulls and NaN values are both converted to None
+                columns.append([None if value != value else value for value in values.tolist()] if values.isna().any() else values.tolist())
+            else:
+                columns.append(column.to_pylist())
+        names = batch.schema.names
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def _sample_dataframes(self, dataframes: Iterable[pd.DataFrame], fp: Optional[_CountingStream] = None) -> Iterable[pd.DataFrame]:
+        """Sample the rows used to infer the schema from the chunks of a file, according to the schema_inference option
+
+        :param dataframes: chunks of the file
+        :param fp: stream the chunks are parsed from, files read at once are sampled by rows only
+        """
+        sampling = self._schema_inference["sampling"]
+        if sampling == "first_rows":
+            rows_left = self._schema_inference["rows"]
+            for df in dataframes:
+                yield df.iloc[:rows_left]
+                rows_left -= len(df)
+                if rows_left <= 0:
+                    return
+        elif sampling == "byte_budget":
+            for df in dataframes:
+                yield df
+                if fp is not None and fp.bytes_read >= self._schema_inference["max_bytes"]:
+                    return
+        else:
+            yield from self._reservoir_sample_dataframes(dataframes, self._schema_inference["rows"])
+
+    def _reservoir_sample_dataframes(self, dataframes: Iterable[pd.DataFrame], size: int) -> Iterable[pd.DataFrame]:
+        """Keep a uniform sample of `size` rows of the whole file, holding a single chunk in memory besides the sample"""
+        rng = np.random.default_rng(self.SAMPLING_SEED)
+        sample, rows_seen = None, 0
+        for df in dataframes:
+            missing_rows = size - rows_seen
+            if missing_rows > 0:
+                # the sample is filled with the first rows of the file
+                head, df = df.iloc[:missing_rows], df.iloc[missing_rows:]
+                sample = head if sample is None else pd.concat([sample, head], ignore_index=True)
+                rows_seen += len(head)
+            if len(df):
+                # the i-th row of the file replaces a random row of the sample with probability size / i
+                slots = rng.integers(0, np.arange(rows_seen + 1, rows_seen + len(df) + 1))
+                rows_seen += len(df)
+                replacing = pd.Series(np.flatnonzero(slots < size), index=slots[slots < size])
+                # the last row replacing a given row of the sample wins
+                replacing = replacing[~replacing.index.duplicated(keep="last")]
+                sample = pd.concat([sample.drop(index=replacing.index), df.iloc[replacing.values]], ignore_index=True)
+        if sample is not None:
+            yield sample
+
+    def _sample_records(self, records: Iterable[dict], fp: _CountingStream) -> Iterable[dict]:
+        """Sample the records of a jsonl file used to infer its schema, like _sample_dataframes"""
+        if not self._schema_inference:
+            yield from records
+        elif self._schema_inference["sampling"] == "first_rows":
+            yield from itertools.islice(records, self._schema_inference["rows"])
+        elif self._schema_inference["sampling"] == "byte_budget":
+            for record in records:
+                yield record
+                if fp.bytes_read >= self._schema_inference["max_bytes"]:
+                    return
+        else:
+            size, rng, sample = self._schema_inference["rows"], random.Random(self.SAMPLING_SEED), []
+            for index, record in enumerate(records):
+                if index < size:
+                    sample.append(record)
+                else:
+                    slot = rng.randint(0, index)
+                    if slot < size:
+                        sample[slot] = record
+            yield from sample
+
     @staticmethod
     def dtype_to_json_type(current_type: str, dtype) -> str:
         """Convert Pandas Dataframe types to Airbyte Types.
@@ -409,7 +831,55 @@ class Client:
 
     @property
     def reader(self) -> reader_class:
-        return self.reader_class(url=self._url, provider=self._provider, binary=self.binary_source, encoding=self.encoding)
+        # pyarrow decodes csv files itself, using the encoding of the reader options
+        binary = self.binary_source or self.use_arrow_reader
+        return self.reader_class(url=self._url, provider=self._provider, binary=binary, encoding=self.encoding)
+
+    @property
+    def use_arrow_reader(self) -> bool:
+        """Whether records of csv files are read in batches with pyarrow instead of loading pandas dataframes"""
+        return self._reader_format == "csv" and self._arrow_csv_options() is not None
+
+    def _arrow_csv_options(self) -> Optional[dict]:
+        """Translate the pandas.read_csv reader options to the pyarrow csv reader options, None if some can't be translated"""
+        options = self._reader_options
+        if not set(options) <= self.arrow_csv_reader_options:
+            return None
+
+        delimiter = options.get("sep", options.get("delimiter", ","))
+        quote_char = options.get("quotechar", '"')
+        escape_char = options.get("escapechar") or False
+        names = options.get("names")
+        header = options.get("header", "infer")
+        if header == "infer":
+            header = None if names else 0
+        skip_rows = options.get("skiprows", 0)
+        na_values = options.get("na_values", [])
+        na_values = [na_values] if isinstance(na_values, str) else na_values
+
+        single_chars = [delimiter, quote_char] + ([escape_char] if escape_char else [])
+        if not all(isinstance(char, str) and len(char) == 1 for char in single_chars):
+            return None
+        # Without a header nor names, pandas names the columns after their position
+        if header not in (0, None) or (header is None and not names):
+            return None
+        if not isinstance(skip_rows, int) or isinstance(skip_rows, bool):
+            return None
+        if names is not None and not (isinstance(names, list) and all(isinstance(name, str) for name in names)):
+            return None
+        if not (isinstance(na_values, list) and all(isinstance(value, str) for value in na_values)):
+            return None
+
+        return {
+            "encoding": options.get("encoding") or "utf8",
+            # rows to skip before the first data row, the header is only parsed when no names are provided
+            "skip_rows": skip_rows + (1 if names and header == 0 else 0),
+            "column_names": names,
+            "parse_options": pa_csv.ParseOptions(
+                delimiter=delimiter, quote_char=quote_char, escape_char=escape_char, double_quote=options.get("doublequote", True)
+            ),
+            "null_values": self.csv_null_values + na_values,
+        }
 
     @backoff.on_exception(backoff.expo, ConnectionResetError, on_backoff=backoff_handler, max_tries=5, max_time=60)
     def read(self, fields: Iterable = None) -> Iterable[dict]:
@@ -430,10 +900,14 @@ class Client:
                         fp = self._cache_stream(fp)
                     if self._is_zip:
                         fp = self._unzip(fp)
-                    for df in self.load_dataframes(fp):
-                        columns = fields.intersection(set(df.columns)) if fields else df.columns
-                        df.replace({np.nan: None}, inplace=True)
-                        yield from df[list(columns)].to_dict(orient="records")
+                    if self.use_arrow_reader:
+                        for batch in self.load_record_batches(fp, fields):
+                            yield from self.record_batch_to_records(batch)
+                    else:
+                        for df in self.load_dataframes(fp, fields=fields):
+                            columns = fields.intersection(set(df.columns)) if fields else df.columns
+                            df.replace({np.nan: None}, inplace=True)
+                            yield from df[list(columns)].to_dict(orient="records")
             except ConnectionResetError:
                 logger.info(f"Catched `connection reset error - 104`, stream: {self.stream_name} ({self.reader.full_url})")
                 raise ConnectionResetError
@@ -445,24 +919,32 @@ class Client:
                 raise AirbyteTracedException(message=error_msg, internal_message=error_msg, failure_type=FailureType.config_error) from err
 
     def _unzip(self, fp):
-        tmp_dir = tempfile.TemporaryDirectory()
-        with zipfile.ZipFile(str(fp.name), "r") as zip_ref:
-            zip_ref.extractall(tmp_dir.name)
-
-        logger.info("Temp dir content: " + str(os.listdir(tmp_dir.name)))
-        final_file: str = os.path.join(tmp_dir.name, os.listdir(tmp_dir.name)[0])
-        logger.info("Pick up first file: " + final_file)
-        fp_tmp = open(final_file, "rb")
-        return fp_tmp
+        """open the first file of the archive, which is decompressed on the fly while it is read"""
+        zip_ref = zipfile.ZipFile(fp, "r")
+        logger.info("Archive content: " + str(zip_ref.namelist()))
+        first_file = next(info for info in zip_ref.infolist() if not info.is_dir())
+        logger.info("Pick up first file: " + first_file.filename)
+        return zip_ref.open(first_file)
 
     def _cache_stream(self, fp):
-        """cache stream to file"""
+        """cache stream to file, unless it is seekable: files of the providers supporting range requests are read in place"""
+        if self._is_seekable(fp):
+            return fp
         fp_tmp = tempfile.NamedTemporaryFile(mode="w+b")
-        fp_tmp.write(fp.read())
+        shutil.copyfileobj(fp, fp_tmp, self.CACHE_STREAM_CHUNK_SIZE)
         fp_tmp.seek(0)
         fp.close()
         return fp_tmp
 
+    @staticmethod
+    def _is_seekable(fp) -> bool:
+        try:
+            seekable = fp.seekable()
+        except (AttributeError, OSError, ValueError):
+            return False
+        # smart_open can't seek from the end of HTTP responses without a Content-Length
+        return seekable and getattr(fp, "content_length", 0) != -1
+
     def _stream_properties(self, fp, empty_schema: bool = False, read_sample_chunk: bool = False):
         """
         empty_schema param is used to check connectivity, i.e. we only read a header and do not produce stream properties
@@ -470,12 +952,22 @@ class Client:
         """
         if self._reader_format == "yaml":
             df_list = [self.load_yaml(fp)]
+            if self._schema_inference:
+                df_list = self._sample_dataframes(df_list)
         else:
             if self.binary_source:
                 fp = self._cache_stream(fp)
             if self._is_zip:
                 fp = self._unzip(fp)
-            df_list = self.load_dataframes(fp, skip_data=empty_schema, read_sample_chunk=read_sample_chunk)
+            if self._schema_inference and not empty_schema:
+                counting_fp, chunk_size = None, None
+                if self._reader_format == "csv":
+                    fp = counting_fp = _CountingStream(fp)
+                    if self._schema_inference["sampling"] == "first_rows":
+                        chunk_size = min(self._schema_inference["rows"], self.CSV_CHUNK_SIZE)
+                df_list = self._sample_dataframes(self.load_dataframes(fp, chunk_size=chunk_size), counting_fp)
+            else:
+                df_list = self.load_dataframes(fp, skip_data=empty_schema, read_sample_chunk=read_sample_chunk)
         fields = {}
         for df in df_list:
             for col in df.columns:
@@ -491,19 +983,71 @@ class Client:
         }
 
     def streams(self, empty_schema: bool = False) -> Iterable:
-        """Discovers available streams"""
+        """Discovers available streams, the schemas inferred from files which didn't change since the last discovery are cached"""
         # TODO handle discovery of directories of multiple files instead
-        with self.reader.open() as fp:
-            if self._reader_format in ["json", "jsonl"]:
-                json_schema = self.load_nested_json_schema(fp)
-            else:
-                json_schema = {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "type": "object",
-                    "properties": self._stream_properties(fp, empty_schema=empty_schema, read_sample_chunk=True),
-                }
+        reader = self.reader
+        cache_path = self._schema_cache_path(reader)
+        json_schema = self._read_cached_schema(cache_path) if cache_path else None
+        if json_schema is None:
+            with reader.open() as fp:
+                if self._reader_format in ["json", "jsonl"]:
+                    json_schema = self.load_nested_json_schema(fp)
+                else:
+                    json_schema = {
+                        "$schema": "http://json-schema.org/draft-07/schema#",
+                        "type": "object",
+                        "properties": self._stream_properties(fp, empty_schema=empty_schema, read_sample_chunk=True),
+                    }
+            # the schema checked with an empty sample only holds the names of the columns
+            if cache_path and not empty_schema:
+                self._write_cached_schema(cache_path, json_schema)
         yield AirbyteStream(name=self.stream_name, json_schema=json_schema, supported_sync_modes=[SyncMode.full_refresh])
 
+    @property
+    def schema_cache_dir(self) -> Optional[str]:
+        return environ.get(self.SCHEMA_CACHE_DIR_ENV, os.path.join(tempfile.gettempdir(), "airbyte-source-file-schemas")) or None
+
+    def _schema_cache_path(self, reader: URLFile) -> Optional[str]:
+        """Path of the cached schema of the current content of the file, None when it can't be identified from its metadata"""
+        if not self.schema_cache_dir:
+            return None
+        content_version = reader.content_version()
+        if not content_version:
+            return None
+        key = {
+            "cache_version": self.SCHEMA_CACHE_VERSION,
+            "url": reader.full_url,
+            "provider": {name: value for name, value in self._provider.items() if name not in self.schema_cache_ignored_provider_fields},
+            "format": self._reader_format,
+            "reader_options": self._reader_options,
+            "schema_inference": self._schema_inference,
+            "content_version": content_version,
+        }
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode("utf8")).hexdigest()
+        return os.path.join(self.schema_cache_dir, f"{digest}.json")
+
+    @staticmethod
+    def _read_cached_schema(path: str) -> Optional[dict]:
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.info(f"Ignoring the cached schema {path}: {repr(err)}")
+            return None
+
+    @staticmethod
+    def _write_cached_schema(path: str, json_schema: dict):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # written to a temporary file first, so that concurrent discoveries never read a partial schema
+            with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), suffix=".tmp", delete=False) as file:
+                json.dump(json_schema, file)
+            os.replace(file.name, path)
+        except OSError as err:
+            logger.info(f"Failed to cache the schema in {path}: {repr(err)}")
+
     def openpyxl_chunk_reader(self, file, **kwargs):
         """
         Use openpyxl's lazy loading feature to read Excel files (xlsx only) in chunks of 500 lines at a time.
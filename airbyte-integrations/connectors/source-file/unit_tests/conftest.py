@@ -8,6 +8,13 @@ import pytest
 from source_file.client import Client
 
 
+@pytest.fixture(autouse=True)
+def schema_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "schemas"
+    monkeypatch.setenv(Client.SCHEMA_CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def read_file():
     def _read_file(file_name):
@@ -3,9 +3,13 @@
 #
 
 
+import io
+import os
+import zipfile
 from tempfile import NamedTemporaryFile
-from unittest.mock import patch, sentinel
+from unittest.mock import PropertyMock, patch, sentinel
 
+import numpy as np
 import pandas as pd
 import pytest
 from airbyte_cdk.utils import AirbyteTracedException
@@ -294,3 +298,311 @@ def test_excel_reader_option_header(config):
         read_file = next(client.load_dataframes(fp=tmp.name))
         assert isinstance(read_file, pd.DataFrame)
         assert read_file.to_dict(orient="records") == expected_data
+
+
+def test_read_parquet_keeps_the_types_of_pandas(tmp_path):
+    import datetime
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    file_path = tmp_path / "test.parquet"
+    table = pa.table({"id": [1, None], "day": pa.array([datetime.date(2020, 1, 1), None], pa.date32())})
+    pq.write_table(table, file_path)
+    client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"}, format="parquet")
+
+    assert not client.use_arrow_reader
+    with client.reader.open() as fp:
+        properties = client._stream_properties(fp)
+    records = list(client.read())
+
+    assert properties == {"id": {"type": ["number", "null"]}, "day": {"type": ["string", "null"], "format": "date-time"}}
+    assert records == [{"id": 1.0, "day": pd.Timestamp("2020-01-01")}, {"id": None, "day": None}]
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "orc", "feather"])
+def test_read_columnar_file_in_chunks(tmp_path, file_format):
+    import pyarrow as pa
+    import pyarrow.feather as pf
+    import pyarrow.orc as po
+    import pyarrow.parquet as pq
+
+    file_path = tmp_path / f"test.{file_format}"
+    table = pa.table({"id": list(range(5000)), "value": [float(i) for i in range(5000)], "ignored": ["a"] * 5000})
+    if file_format == "parquet":
+        pq.write_table(table, file_path, row_group_size=1000)
+    elif file_format == "orc":
+        po.write_table(table, file_path, stripe_size=1024, batch_size=1000)
+    else:
+        pf.write_feather(table, file_path, chunksize=1000)
+    client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"}, format=file_format)
+
+    with patch.object(pd, f"read_{file_format}", side_effect=AssertionError("the file should not be read whole")):
+        with client.reader.open() as fp:
+            dataframes = list(client.load_dataframes(fp, fields={"id", "value"}))
+        records = list(client.read(fields=["id", "value"]))
+
+    assert len(dataframes) > 1
+    assert all(list(df.columns) == ["id", "value"] for df in dataframes)
+    assert pd.concat(dataframes, ignore_index=True).equals(table.select(["id", "value"]).to_pandas())
+    assert records == [{"id": i, "value": float(i)} for i in range(5000)]
+
+
+def test_read_csv_with_arrow_types_columns_like_pandas(tmp_path):
+    file_path = tmp_path / "test.csv"
+    file_path.write_text('id;name;amount;flag;name;date\n1;a;1.5;True;x;2020-01-01\n2;"";NA;false;y;\n')
+    client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"}, reader_options={"sep": ";"})
+
+    assert client.use_arrow_reader
+    assert list(client.read()) == [
+        {"id": 1, "name": "a", "amount": 1.5, "flag": True, "name.1": "x", "date": "2020-01-01"},
+        {"id": 2, "name": None, "amount": None, "flag": False, "name.1": "y", "date": None},
+    ]
+    assert list(client.read(fields=["name.1", "id"])) == [{"id": 1, "name.1": "x"}, {"id": 2, "name.1": "y"}]
+
+
+def test_read_csv_with_arrow_types_numbers_and_booleans_like_pandas(tmp_path):
+    file_path = tmp_path / "test.csv"
+    file_path.write_text("padded,signed,flag,mixed,big\n 1,+1,TRUE,0,18446744073709551616\n2 ,-2,false,true,1\n")
+    client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"})
+
+    records = list(client.read())
+    expected = pd.read_csv(file_path).to_dict(orient="records")
+
+    assert records == expected == [
+        {"padded": 1, "signed": 1, "flag": True, "mixed": "0", "big": "18446744073709551616"},
+        {"padded": 2, "signed": -2, "flag": False, "mixed": "true", "big": "1"},
+    ]
+
+
+def test_read_csv_with_arrow_like_pandas_across_blocks_and_chunks(tmp_path):
+    rows = []
+    for i in range(25_000):
+        rows.append(
+            [
+                str(i),
+                # a string in the second chunk of 10000 rows only
+                "x" if i == 15_000 else str(i),
+                # a float in the third chunk only
+                "1.5" if i == 21_000 else str(i),
+                # a value overflowing floats
+                "1e400" if i == 5_000 else f"{i}.5",
+                "" if i % 7 else str(i),
+                "true" if i % 2 else "FALSE",
+            ]
+        )
+    file_path = tmp_path / "test.csv"
+    file_path.write_text("id,late_string,late_float,overflow,sparse,flag\n" + "".join(",".join(row) + "\n" for row in rows))
+    client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"})
+    # blocks of pyarrow are not aligned with the chunks of pandas
+    client.ARROW_CSV_BLOCK_SIZE = 4096
+
+    assert client.use_arrow_reader
+    records = list(client.read())
+    expected = [
+        record
+        for df in pd.read_csv(file_path, chunksize=Client.CSV_CHUNK_SIZE)
+        for record in df.replace({np.nan: None}).to_dict(orient="records")
+    ]
+
+    assert records == expected
+    assert [[type(value) for value in record.values()] for record in records] == [
+        [type(value) for value in record.values()] for record in expected
+    ]
+    assert records[9_999]["late_string"] == 9_999 and records[10_000]["late_string"] == "10000"
+    assert records[5_000]["overflow"] == "1e400"
+
+
+@pytest.mark.parametrize(
+    "file_format, reader_options, use_arrow_reader",
+    [
+        ("csv", {}, True),
+        ("csv", {"sep": ";", "names": ["a", "b"], "header": 0, "skiprows": 1, "na_values": ["-"]}, True),
+        ("csv", {"sep": "\\s+"}, False),
+        ("csv", {"header": None}, False),
+        ("csv", {"dtype": {"a": "str"}}, False),
+        ("parquet", {"columns": ["a"]}, False),
+        ("excel", {}, False),
+    ],
+)
+def test_use_arrow_reader(file_format, reader_options, use_arrow_reader):
+    client = Client(dataset_name="test", url="/tmp/file", provider={"storage": "local"}, format=file_format, reader_options=reader_options)
+    assert client.use_arrow_reader is use_arrow_reader
+
+
+class RemoteFile(io.RawIOBase):
+    """Remote file read with range requests, counting the bytes read"""
+
+    def __init__(self, data: bytes, seekable: bool = True):
+        self._data = io.BytesIO(data)
+        self._seekable = seekable
+        self.bytes_read = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return self._seekable
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if not self._seekable:
+            raise OSError("stream is not seekable")
+        return self._data.seek(offset, whence)
+
+    def tell(self):
+        return self._data.tell()
+
+    def readinto(self, buffer):
+        if len(buffer) > Client.CACHE_STREAM_CHUNK_SIZE:
+            raise AssertionError("the stream should be read in chunks")
+        data = self._data.read(len(buffer))
+        buffer[: len(data)] = data
+        self.bytes_read += len(data)
+        return len(data)
+
+
+def _read_remote_file(client, remote_file, fields=None):
+    with patch.object(Client, "reader", new_callable=PropertyMock) as reader:
+        reader.return_value.open.return_value.__enter__.return_value = remote_file
+        return list(client.read(fields=fields))
+
+
+def test_read_seekable_parquet_file_in_place(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    file_path = tmp_path / "test.parquet"
+    pq.write_table(pa.table({"id": list(range(10_000)), "text": [os.urandom(50).hex() for _ in range(10_000)]}), file_path)
+    remote_file = RemoteFile(file_path.read_bytes())
+    client = Client(dataset_name="test", url="https://host/test.parquet", provider={"storage": "HTTPS"}, format="parquet")
+
+    records = _read_remote_file(client, remote_file, fields=["id"])
+
+    assert records == [{"id": i} for i in range(10_000)]
+    # only the footer and the "id" column were read
+    assert remote_file.bytes_read < file_path.stat().st_size / 4
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_read_zipped_csv_file_streaming(tmp_path, seekable):
+    file_path = tmp_path / "test.csv.zip"
+    with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("folder/", "")
+        archive.writestr("folder/test.csv", "id,name\n" + "".join(f"{i},name {i}\n" for i in range(100_000)))
+    client = Client(dataset_name="test", url="https://host/test.csv.zip", provider={"storage": "HTTPS"})
+
+    with patch.object(zipfile.ZipFile, "extractall", side_effect=AssertionError("the archive should not be extracted")):
+        records = _read_remote_file(client, RemoteFile(file_path.read_bytes(), seekable=seekable))
+
+    assert len(records) == 100_000
+    assert records[-1] == {"id": 99_999, "name": "name 99999"}
+
+
+def _discover(client):
+    return next(client.streams()).json_schema["properties"]
+
+
+@pytest.mark.parametrize(
+    "schema_inference, expected_amount_type",
+    [
+        (None, "number"),
+        ({"sampling": "first_rows", "rows": 50}, "number"),
+        ({"sampling": "byte_budget", "max_bytes": 10}, "number"),
+        ({"sampling": "byte_budget", "max_bytes": 1 << 30}, "string"),
+        ({"sampling": "reservoir", "rows": 5_000}, "string"),
+    ],
+)
+def test_schema_inference_sampling(tmp_path, schema_inference, expected_amount_type):
+    file_path = tmp_path / "test.csv"
+    rows = [f"{i},{i / 2}" for i in range(50_000)]
+    # the values of the chunks after the first one are not numbers
+    rows[20_000::100] = ["0,unknown"] * len(rows[20_000::100])
+    file_path.write_text("id,amount\n" + "\n".join(rows) + "\n")
+    client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"}, schema_inference=schema_inference)
+
+    assert _discover(client) == {"id": {"type": ["number", "null"]}, "amount": {"type": [expected_amount_type, "null"]}}
+
+
+def test_schema_inference_sampling_of_jsonl_files(tmp_path):
+    file_path = tmp_path / "test.jsonl"
+    file_path.write_text("".join(f'{{"id": {i}}}\n' for i in range(1_000)) + '{"id": 1000, "late": true}\n')
+
+    def discover(schema_inference):
+        client = Client(
+            dataset_name="test", url=str(file_path), provider={"storage": "local"}, format="jsonl", schema_inference=schema_inference
+        )
+        return set(_discover(client))
+
+    assert discover(None) == {"id", "late"}
+    assert discover({"sampling": "first_rows", "rows": 10}) == {"id"}
+    assert discover({"sampling": "byte_budget", "max_bytes": 100}) == {"id"}
+    assert discover({"sampling": "reservoir", "rows": 1_001}) == {"id", "late"}
+
+
+def test_reservoir_sample_is_uniform():
+    schema_inference = {"sampling": "reservoir", "rows": 1_000}
+    client = Client(dataset_name="test", url="/tmp/file", provider={"storage": "local"}, schema_inference=schema_inference)
+    chunks = (pd.DataFrame({"id": range(start, start + 10_000)}) for start in range(0, 100_000, 10_000))
+
+    (sample,) = client._sample_dataframes(chunks)
+
+    assert len(sample) == 1_000 and sample["id"].is_unique
+    # a tenth of the rows of the sample comes from each tenth of the file, give or take
+    assert all(50 < count < 150 for count in (sample["id"] // 10_000).value_counts())
+
+
+@pytest.mark.parametrize(
+    "schema_inference",
+    [{"sampling": "random"}, {"sampling": "first_rows"}, {"sampling": "reservoir", "rows": 0}, {"sampling": "byte_budget", "rows": 10}],
+)
+def test_invalid_schema_inference(schema_inference):
+    with pytest.raises(AirbyteTracedException):
+        Client(dataset_name="test", url="/tmp/file", provider={"storage": "local"}, schema_inference=schema_inference)
+
+
+def test_schema_of_unchanged_file_is_cached(tmp_path, schema_cache_dir):
+    file_path = tmp_path / "test.csv"
+    file_path.write_text("id,name\n1,a\n")
+    client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"})
+
+    assert _discover(client) == {"id": {"type": ["number", "null"]}, "name": {"type": ["string", "null"]}}
+    assert len(list(schema_cache_dir.iterdir())) == 1
+    with patch.object(URLFile, "open", side_effect=AssertionError("the file should not be read again")):
+        assert _discover(client) == {"id": {"type": ["number", "null"]}, "name": {"type": ["string", "null"]}}
+        assert list(client.streams(empty_schema=True))
+
+    # other reader options or another content of the file are parsed again
+    other_client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"}, reader_options={"dtype": "string"})
+    assert _discover(other_client) == {"id": {"type": ["string", "null"]}, "name": {"type": ["string", "null"]}}
+    file_path.write_text("id,name,amount\n1,a,1.5\n")
+    assert set(_discover(client)) == {"id", "name", "amount"}
+    assert len(list(schema_cache_dir.iterdir())) == 3
+
+
+def test_schema_cache_can_be_disabled(tmp_path, monkeypatch, schema_cache_dir):
+    monkeypatch.setenv(Client.SCHEMA_CACHE_DIR_ENV, "")
+    file_path = tmp_path / "test.csv"
+    file_path.write_text("id,name\n1,a\n")
+    client = Client(dataset_name="test", url=str(file_path), provider={"storage": "local"})
+
+    assert _discover(client)
+    assert not schema_cache_dir.exists()
+
+
+@pytest.mark.parametrize(
+    "headers, expected_version",
+    [
+        ({"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}, '"abc"'),
+        ({"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT", "Content-Length": "12"}, "Wed, 21 Oct 2015 07:28:00 GMT-12"),
+        ({}, None),
+    ],
+)
+def test_content_version_of_https_file(requests_mock, headers, expected_version):
+    requests_mock.head("https://host/test.csv", headers=headers)
+    assert URLFile(url="https://host/test.csv", provider={"storage": "HTTPS"}).content_version() == expected_version
+
+
+def test_content_version_is_none_when_metadata_are_unavailable(requests_mock):
+    requests_mock.head("https://host/test.csv", status_code=405)
+    assert URLFile(url="https://host/test.csv", provider={"storage": "HTTPS"}).content_version() is None
+    assert URLFile(url="sftp://host/test.csv", provider={"storage": "SFTP", "user": "user", "host": "host"}).content_version() is None
@@ -74,6 +74,16 @@ class Config(AbstractFileBasedSpec):
         default="use_records_transfer",
     )
 
+    use_listing_manifest: bool = Field(
+        title="List Only New Keys in Incremental Syncs",
+        default=False,
+        description="Incremental syncs only list the keys sorting after the last key listed by the previous sync under the prefix of "
+        "every glob, instead of the whole prefix. Only enable it when new files are added with keys sorting after the existing ones, "
+        "e.g. date partitioned keys like `year=2024/month=01/day=31/file.csv`, and are never modified: files modified in place, or "
+        "added with keys sorting before the last listed one, are not synced.",
+        order=7,
+    )
+
     @root_validator
     def validate_optional_args(cls, values):
         aws_access_key_id = values.get("aws_access_key_id")
@@ -4,7 +4,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, MutableMapping
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Set
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
@@ -19,11 +19,17 @@ class Cursor(DefaultFileBasedCursor):
     _LEGACY_DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
     _V4_MIGRATION_BUFFER = timedelta(hours=1)
     _V3_MIN_SYNC_DATE_FIELD = "v3_min_sync_date"
+    _LISTING_MANIFEST_FIELD = "listing_manifest"
+    _LISTING_MANIFEST_GLOBS_FIELD = "listing_manifest_globs"
 
     def __init__(self, stream_config: FileBasedStreamConfig, **_: Any):
         super().__init__(stream_config)
         self._running_migration = False
         self._v3_migration_start_datetime = None
+        self._listing_manifest: Dict[str, str] = {}
+        self._listing_manifest_globs = sorted(stream_config.globs or [])
+        self._pending_listing_manifest: Optional[Dict[str, str]] = None
+        self._files_pending_listing_manifest: Set[str] = set()
 
     def set_initial_state(self, value: StreamState) -> None:
         if self._is_legacy_state(value):
@@ -36,10 +42,18 @@ class Cursor(DefaultFileBasedCursor):
             if Cursor._V3_MIN_SYNC_DATE_FIELD in value
             else None
         )
+        # keys listed before the last key of a prefix were only synced if they matched the globs they were listed with
+        if value.get(Cursor._LISTING_MANIFEST_GLOBS_FIELD) == self._listing_manifest_globs:
+            self._listing_manifest = dict(value.get(Cursor._LISTING_MANIFEST_FIELD, {}))
+        else:
+            self._listing_manifest = {}
         super().set_initial_state(value)
 
     def get_state(self) -> StreamState:
         state = {"history": self._file_to_datetime_history, self.CURSOR_FIELD: self._get_cursor()}
+        if self._listing_manifest:
+            state[Cursor._LISTING_MANIFEST_FIELD] = self._listing_manifest
+            state[Cursor._LISTING_MANIFEST_GLOBS_FIELD] = self._listing_manifest_globs
         if self._v3_migration_start_datetime:
             return {
                 **state,
@@ -52,6 +66,30 @@ class Cursor(DefaultFileBasedCursor):
         else:
             return state
 
+    def start_listing(self) -> MutableMapping[str, str]:
+        """
+        Returns the listing manifest of the state, mapping prefixes to the last key listed under them, for the stream reader to only list
+        the keys after them and to record the new last keys. The manifest of the state is only updated once every file to sync is synced:
+        a failed sync lists the same keys again.
+        """
+        self._pending_listing_manifest = dict(self._listing_manifest)
+        return self._pending_listing_manifest
+
+    def get_files_to_sync(self, all_files: Iterable[RemoteFile], logger: logging.Logger) -> List[RemoteFile]:
+        files_to_sync = list(super().get_files_to_sync(all_files, logger))
+        self._files_pending_listing_manifest = {file.uri for file in files_to_sync}
+        self._update_listing_manifest()
+        return files_to_sync
+
+    def add_file(self, file: RemoteFile) -> None:
+        super().add_file(file)
+        self._files_pending_listing_manifest.discard(file.uri)
+        self._update_listing_manifest()
+
+    def _update_listing_manifest(self) -> None:
+        if self._pending_listing_manifest is not None and not self._files_pending_listing_manifest:
+            self._listing_manifest, self._pending_listing_manifest = self._pending_listing_manifest, None
+
     def _should_sync_file(self, file: RemoteFile, logger: logging.Logger) -> bool:
         """
         Never sync files earlier than the v3 migration start date. V3 purged the history from the state, so we assume all files were already synced
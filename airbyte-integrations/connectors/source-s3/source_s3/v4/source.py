@@ -26,12 +26,16 @@ from airbyte_cdk.models import (
     TraceType,
     Type,
 )
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.file_based_source import DEFAULT_CONCURRENCY, FileBasedSource
+from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
+from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from source_s3.source import SourceS3Spec
 from source_s3.utils import airbyte_message_to_json
 from source_s3.v4.config import Config
 from source_s3.v4.cursor import Cursor
 from source_s3.v4.legacy_config_transformer import LegacyConfigTransformer
+from source_s3.v4.stream import S3FileBasedStream
 from source_s3.v4.stream_reader import SourceS3StreamReader
 
 _V3_DEPRECATION_FIELD_MAPPING = {
@@ -140,6 +144,25 @@ class SourceS3(FileBasedSource):
 
         return "Deprecated and will be removed soon. Please do not use this field anymore. "
 
+    def _make_default_stream(
+        self,
+        stream_config: FileBasedStreamConfig,
+        cursor: Optional[AbstractFileBasedCursor],
+        use_file_transfer: bool = False,
+    ) -> AbstractFileBasedStream:
+        return S3FileBasedStream(
+            config=stream_config,
+            catalog_schema=self.stream_schemas.get(stream_config.name),
+            stream_reader=self.stream_reader,
+            availability_strategy=self.availability_strategy,
+            discovery_policy=self.discovery_policy,
+            parsers=self.parsers,
+            validation_policy=self._validate_and_get_validation_policy(stream_config),
+            errors_collector=self.errors_collector,
+            cursor=cursor,
+            use_file_transfer=use_file_transfer,
+        )
+
     @classmethod
     def launch(cls, args: list[str] | None = None) -> None:
         """Launch the source using the provided CLI args.
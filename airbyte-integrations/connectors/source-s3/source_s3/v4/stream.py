@@ -0,0 +1,23 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Iterable
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream import DefaultFileBasedStream
+from source_s3.v4.cursor import Cursor
+
+
+class S3FileBasedStream(DefaultFileBasedStream):
+    """
+    Incremental syncs list the keys after the ones listed by the previous sync when the listing manifest is enabled, see
+    `Cursor.start_listing`.
+    """
+
+    def get_files(self) -> Iterable[RemoteFile]:
+        if not (self.stream_reader.config.use_listing_manifest and isinstance(self.cursor, Cursor)):
+            return super().get_files()
+        return self.stream_reader.get_matching_files(
+            self.config.globs or [], self.config.legacy_prefix, self.logger, listing_manifest=self.cursor.start_listing()
+        )
@@ -3,11 +3,15 @@
 #
 
 import logging
+import queue
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import IOBase
 from os import getenv, makedirs, path
-from typing import Dict, Iterable, List, Optional, Set, cast
+from typing import Dict, Iterable, List, MutableMapping, Optional, Pattern, cast
 
 import boto3.session
 import pendulum
@@ -26,16 +30,24 @@ from botocore.session import get_session
 from source_s3.v4.config import Config
 from source_s3.v4.zip_reader import DecompressedStream, RemoteFileInsideArchive, ZipContentReader, ZipFileHandler
 from typing_extensions import override
+from wcmatch.glob import GLOBSTAR, translate
 
 AWS_EXTERNAL_ID = getenv("AWS_ASSUME_ROLE_EXTERNAL_ID")
 
+# Put in the queue of the pages of a prefix once all of them are listed
+_LISTING_DONE = object()
+
 
 class SourceS3StreamReader(AbstractFileBasedStreamReader):
     FILE_SIZE_LIMIT = 1_000_000_000
+    # Prefixes listed at the same time, each one at most LISTING_PAGES_AHEAD pages ahead of the files being yielded
+    MAX_CONCURRENT_LISTINGS = 8
+    LISTING_PAGES_AHEAD = 4
 
     def __init__(self):
         super().__init__()
         self._s3_client = None
+        self._start_date = None
 
     @property
     def config(self) -> Config:
@@ -54,6 +66,7 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         """
         assert isinstance(value, Config)
         self._config = value
+        self._start_date = pendulum.parse(value.start_date).naive() if value.start_date else None
 
     @property
     def s3_client(self) -> BaseClient:
@@ -128,20 +141,36 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
 
         return autorefresh_session.client("s3", **client_kv_args)
 
-    def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
+    def get_matching_files(
+        self,
+        globs: List[str],
+        prefix: Optional[str],
+        logger: logging.Logger,
+        listing_manifest: Optional[MutableMapping[str, str]] = None,
+    ) -> Iterable[RemoteFile]:
         """
         Get all files matching the specified glob patterns.
+
+        With a listing manifest, mapping prefixes to the last key listed under them by a previous sync, only the keys after that one are
+        listed. The manifest is updated with the last key listed under every prefix.
         """
         s3 = self.s3_client
-        prefixes = [prefix] if prefix else self.get_prefixes_from_globs(globs)
+        prefixes = [prefix] if prefix else self._get_listing_prefixes(globs)
+        glob_patterns = self._compile_globs(globs)
         seen = set()
         total_n_keys = 0
 
         try:
-            for current_prefix in prefixes if prefixes else [None]:
-                for remote_file in self._page(s3, globs, self.config.bucket, current_prefix, seen, logger):
-                    total_n_keys += 1
-                    yield remote_file
+            for file in self._list_objects(s3, self.config.bucket, prefixes, logger, listing_manifest):
+                for remote_file in self._handle_file(file):
+                    if (
+                        any(pattern.match(remote_file.uri) for pattern in glob_patterns)
+                        and self.is_modified_after_start_date(remote_file.last_modified)
+                        and remote_file.uri not in seen
+                    ):
+                        seen.add(remote_file.uri)
+                        total_n_keys += 1
+                        yield remote_file
 
             logger.info(f"Finished listing objects from S3. Found {total_n_keys} objects total ({len(seen)} unique objects).")
         except ClientError as exc:
@@ -153,6 +182,79 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         except Exception as exc:
             self._raise_error_listing_files(globs, exc)
 
+    @staticmethod
+    def _get_listing_prefixes(globs: List[str]) -> List[Optional[str]]:
+        """
+        Sorted prefixes of the globs, without the ones inside another prefix: their files are listed with it. The whole bucket is listed
+        (with the `None` prefix) when a glob has no prefix.
+        """
+        if any(not glob.split("*")[0] for glob in globs):
+            return [None]
+        prefixes = []
+        for prefix in sorted(SourceS3StreamReader.get_prefixes_from_globs(globs)):
+            if not prefixes or not prefix.startswith(prefixes[-1]):
+                prefixes.append(prefix)
+        return prefixes
+
+    @staticmethod
+    def _compile_globs(globs: List[str]) -> List[Pattern]:
+        """Compile the globs once, `file_matches_globs` parses them again for every file"""
+        include_patterns, _ = translate(globs, flags=GLOBSTAR) if globs else ([], [])
+        return [re.compile(pattern) for pattern in include_patterns]
+
+    def _list_objects(
+        self,
+        s3: BaseClient,
+        bucket: str,
+        prefixes: List[Optional[str]],
+        logger: logging.Logger,
+        listing_manifest: Optional[MutableMapping[str, str]] = None,
+    ) -> Iterable[dict]:
+        """
+        List the objects under the prefixes, yielded in the order of the prefixes: the pages of the next prefixes are listed concurrently
+        while the objects of the current one are yielded.
+        """
+        if len(prefixes) <= 1:
+            for prefix in prefixes:
+                for page in self._page(s3, bucket, prefix, logger, listing_manifest):
+                    yield from page
+            return
+
+        stop = threading.Event()
+        prefix_queues = [queue.Queue(maxsize=self.LISTING_PAGES_AHEAD) for _ in prefixes]
+
+        def put(prefix_queue: queue.Queue, item) -> bool:
+            # gives up when the objects are not consumed anymore, rather than blocking the thread forever
+            while not stop.is_set():
+                try:
+                    prefix_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def list_prefix(prefix: Optional[str], prefix_queue: queue.Queue):
+            try:
+                for page in self._page(s3, bucket, prefix, logger, listing_manifest):
+                    if not put(prefix_queue, page):
+                        return
+                put(prefix_queue, _LISTING_DONE)
+            except Exception as exc:
+                put(prefix_queue, exc)
+
+        executor = ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_LISTINGS, len(prefixes)), thread_name_prefix="s3-listing")
+        try:
+            for prefix, prefix_queue in zip(prefixes, prefix_queues):
+                executor.submit(list_prefix, prefix, prefix_queue)
+            for prefix_queue in prefix_queues:
+                while (page := prefix_queue.get()) is not _LISTING_DONE:
+                    if isinstance(page, Exception):
+                        raise page
+                    yield from page
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _raise_error_listing_files(self, globs: List[str], exc: Optional[Exception] = None):
         """Helper method to raise the ErrorListingFiles exception."""
         raise ErrorListingFiles(
@@ -260,7 +362,8 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
 
     @override
     def file_size(self, file: RemoteFile) -> int:
-        s3_object: boto3.s3.Object = self.s3_client.get_object(
+        # HEAD request: the metadata of the object, without opening its body
+        s3_object = self.s3_client.head_object(
             Bucket=self.config.bucket,
             Key=file.uri,
         )
@@ -271,13 +374,23 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
         return file["Key"].endswith("/")
 
     def _page(
-        self, s3: BaseClient, globs: List[str], bucket: str, prefix: Optional[str], seen: Set[str], logger: logging.Logger
-    ) -> Iterable[RemoteFile]:
+        self,
+        s3: BaseClient,
+        bucket: str,
+        prefix: Optional[str],
+        logger: logging.Logger,
+        listing_manifest: Optional[MutableMapping[str, str]] = None,
+    ) -> Iterable[List[dict]]:
         """
-        Page through lists of S3 objects.
+        Page through lists of S3 objects, yielding the objects of each page which are not folders.
         """
         total_n_keys_for_prefix = 0
         kwargs = {"Bucket": bucket}
+        # the whole bucket is listed without prefix
+        manifest_key = prefix or ""
+        if listing_manifest and listing_manifest.get(manifest_key):
+            kwargs["StartAfter"] = listing_manifest[manifest_key]
+            logger.info(f"Listing objects from S3 for prefix '{prefix}' after '{kwargs['StartAfter']}'.")
         while True:
             response = s3.list_objects_v2(Prefix=prefix, **kwargs) if prefix else s3.list_objects_v2(**kwargs)
             key_count = response.get("KeyCount")
@@ -285,18 +398,10 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
             logger.info(f"Received {key_count} objects from S3 for prefix '{prefix}'.")
 
             if "Contents" in response:
-                for file in response["Contents"]:
-                    if self._is_folder(file):
-                        continue
-
-                    for remote_file in self._handle_file(file):
-                        if (
-                            self.file_matches_globs(remote_file, globs)
-                            and self.is_modified_after_start_date(remote_file.last_modified)
-                            and remote_file.uri not in seen
-                        ):
-                            seen.add(remote_file.uri)
-                            yield remote_file
+                if listing_manifest is not None and response["Contents"]:
+                    # keys are listed in lexicographic order
+                    listing_manifest[manifest_key] = response["Contents"][-1]["Key"]
+                yield [file for file in response["Contents"] if not self._is_folder(file)]
             else:
                 logger.warning(f"Invalid response from S3; missing 'Contents' key. kwargs={kwargs}.")
 
@@ -308,9 +413,9 @@ class SourceS3StreamReader(AbstractFileBasedStreamReader):
 
     def is_modified_after_start_date(self, last_modified_date: Optional[datetime]) -> bool:
         """Returns True if given date higher or equal than start date or something is missing"""
-        if not (self.config.start_date and last_modified_date):
+        if not (self._start_date and last_modified_date):
             return True
-        return last_modified_date >= pendulum.parse(self.config.start_date).naive()
+        return last_modified_date >= self._start_date
 
     def _handle_file(self, file):
         if file["Key"].endswith(".zip"):
@@ -489,3 +489,43 @@ def _init_cursor_with_state(input_state, max_history_size: Optional[int] = None)
     if max_history_size is not None:
         cursor.DEFAULT_MAX_HISTORY_SIZE = max_history_size
     return cursor
+
+
+def test_listing_manifest_is_updated_once_every_file_is_synced() -> None:
+    cursor = _init_cursor_with_state({"history": {}, "listing_manifest": {"a/": "a/file0.csv"}, "listing_manifest_globs": ["**"]})
+    files = [RemoteFile(uri=f"a/file{i}.csv", last_modified=datetime(2024, 1, i)) for i in (1, 2)]
+
+    listing_manifest = cursor.start_listing()
+    assert listing_manifest == {"a/": "a/file0.csv"}
+    listing_manifest["a/"] = "a/file2.csv"
+    files_to_sync = cursor.get_files_to_sync(files, Mock())
+
+    assert files_to_sync == files
+    cursor.add_file(files[1])
+    # a sync failing now lists the files after the last key of the previous sync again
+    assert cursor.get_state()["listing_manifest"] == {"a/": "a/file0.csv"}
+    cursor.add_file(files[0])
+    assert cursor.get_state()["listing_manifest"] == {"a/": "a/file2.csv"}
+
+
+def test_listing_manifest_is_updated_when_there_is_no_file_to_sync() -> None:
+    cursor = _init_cursor_with_state({})
+    assert "listing_manifest" not in cursor.get_state()
+
+    cursor.start_listing()[""] = "last_key.csv"
+    assert cursor.get_files_to_sync([], Mock()) == []
+
+    assert cursor.get_state()["listing_manifest"] == {"": "last_key.csv"}
+    assert cursor.get_state()["listing_manifest_globs"] == ["**"]
+
+
+@pytest.mark.parametrize(
+    "listing_manifest_globs",
+    [pytest.param(["a/*.csv"], id="other_globs"), pytest.param(None, id="no_globs")],
+)
+def test_listing_manifest_is_dropped_when_the_globs_change(listing_manifest_globs) -> None:
+    state = {"history": {}, "listing_manifest": {"a/": "a/file0.csv"}, "listing_manifest_globs": listing_manifest_globs}
+    cursor = _init_cursor_with_state(state)
+
+    assert cursor.start_listing() == {}
+    assert "listing_manifest" not in cursor.get_state()
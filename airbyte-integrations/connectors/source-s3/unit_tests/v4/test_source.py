@@ -6,7 +6,9 @@ import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from source_s3.v4 import Config, SourceS3, SourceS3StreamReader
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from source_s3.v4 import Config, Cursor, SourceS3, SourceS3StreamReader
 
 _V3_FIELDS = ["dataset", "format", "path_pattern", "provider", "schema"]
 TEST_FILES_FOLDER = Path(__file__).resolve().parent.parent.joinpath("sample_files")
@@ -51,3 +53,17 @@ class SourceTest(unittest.TestCase):
     def test_when_spec_then_v3_nested_fields_are_not_required(self) -> None:
         spec = self._source.spec()
         assert not spec.connectionSpecification["properties"]["provider"]["required"]
+
+    def test_given_listing_manifest_when_get_files_then_list_after_the_last_keys_of_the_state(self) -> None:
+        stream_config = FileBasedStreamConfig(name="test", globs=["a/*.csv"], format=CsvFormat(), validation_policy="Emit Record")
+        cursor = Cursor(stream_config)
+        cursor.set_initial_state({"history": {}, "listing_manifest": {"a/": "a/file1.csv"}, "listing_manifest_globs": ["a/*.csv"]})
+        self._stream_reader.config = Config(bucket="a-bucket", streams=[stream_config], use_listing_manifest=True)
+        self._stream_reader.get_matching_files.return_value = []
+        stream = self._source._make_default_stream(stream_config, cursor)
+
+        stream.get_files()
+
+        self._stream_reader.get_matching_files.assert_called_once_with(
+            ["a/*.csv"], None, stream.logger, listing_manifest={"a/": "a/file1.csv"}
+        )
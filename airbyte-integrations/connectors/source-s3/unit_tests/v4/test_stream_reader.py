@@ -5,6 +5,7 @@
 
 import io
 import logging
+import threading
 from datetime import datetime, timedelta
 from itertools import product
 from typing import Any, Dict, List, Optional, Set
@@ -15,6 +16,7 @@ from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import Abstr
 from airbyte_cdk.sources.file_based.exceptions import ErrorListingFiles, FileBasedSourceError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from botocore.exceptions import ClientError
 from botocore.stub import Stubber
 from moto import mock_sts
 from pydantic.v1 import AnyUrl
@@ -351,3 +353,99 @@ def test_filter_file_by_start_date(start_date: datetime, last_modified_date: dat
     )
 
     assert expected_result == reader.is_modified_after_start_date(last_modified_date)
+
+
+def _listing_reader(start_date: Optional[str] = None) -> SourceS3StreamReader:
+    reader = SourceS3StreamReader()
+    reader.config = Config(bucket="test", aws_access_key_id="test", aws_secret_access_key="test", streams=[], start_date=start_date)
+    return reader
+
+
+@pytest.mark.parametrize(
+    "globs, expected_prefixes",
+    [
+        ([], []),
+        (["b/*.csv", "a/**/*.csv", "a/b/*.jsonl", "ab/*.csv"], ["a/", "ab/", "b/"]),
+        (["a/*.csv", "**/*.jsonl"], [None]),
+    ],
+)
+def test_get_listing_prefixes(globs: List[str], expected_prefixes: List[Optional[str]]) -> None:
+    assert SourceS3StreamReader._get_listing_prefixes(globs) == expected_prefixes
+
+
+def test_prefixes_are_listed_concurrently_and_merged_in_order() -> None:
+    reader = _listing_reader()
+    # the first pages of "a/" and "b/" wait for each other, which only works when the prefixes are listed concurrently
+    barrier = threading.Barrier(2, timeout=5)
+
+    def list_objects_v2(Bucket, Prefix, ContinuationToken=None):
+        if Prefix in ("a/", "b/") and ContinuationToken is None:
+            barrier.wait()
+        page = 2 if ContinuationToken else 1
+        response = {"Contents": [{"Key": f"{Prefix}file{page}.csv", "LastModified": datetime.now()}], "KeyCount": 1}
+        return {**response, "NextContinuationToken": "token"} if page == 1 else response
+
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock) as mock_s3_client:
+        mock_s3_client.list_objects_v2 = MagicMock(side_effect=list_objects_v2)
+        files = list(reader.get_matching_files(["c/*.csv", "b/*.csv", "a/*.csv"], None, logger))
+
+    assert [file.uri for file in files] == ["a/file1.csv", "a/file2.csv", "b/file1.csv", "b/file2.csv", "c/file1.csv", "c/file2.csv"]
+
+
+def test_error_listing_a_prefix_concurrently_is_raised() -> None:
+    reader = _listing_reader()
+
+    def list_objects_v2(Bucket, Prefix, ContinuationToken=None):
+        if Prefix == "b/":
+            raise ClientError({"Error": {"Code": "AccessDenied"}}, "ListObjectsV2")
+        return {"Contents": [{"Key": f"{Prefix}file.csv", "LastModified": datetime.now()}], "KeyCount": 1}
+
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock) as mock_s3_client:
+        mock_s3_client.list_objects_v2 = MagicMock(side_effect=list_objects_v2)
+        with pytest.raises(ErrorListingFiles):
+            list(reader.get_matching_files(["a/*.csv", "b/*.csv", "c/*.csv"], None, logger))
+
+
+def test_globs_and_start_date_are_parsed_once() -> None:
+    reader = _listing_reader(start_date="2024-01-01T00:00:00Z")
+    contents = [{"Key": f"file{i}.csv", "LastModified": datetime(2024, 1, 1 + i % 2)} for i in range(10)]
+
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock) as mock_s3_client, patch(
+        "source_s3.v4.stream_reader.pendulum.parse"
+    ) as parse, patch.object(SourceS3StreamReader, "file_matches_globs") as file_matches_globs:
+        mock_s3_client.list_objects_v2.return_value = {"Contents": contents, "KeyCount": len(contents)}
+        files = list(reader.get_matching_files(["*.csv"], None, logger))
+
+    assert len(files) == 10
+    parse.assert_not_called()
+    file_matches_globs.assert_not_called()
+    assert not reader.is_modified_after_start_date(datetime(2023, 12, 31))
+
+
+def test_file_size_is_read_from_the_object_metadata() -> None:
+    reader = _listing_reader()
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock) as mock_s3_client:
+        mock_s3_client.head_object.return_value = {"ContentLength": 123}
+        assert reader.file_size(RemoteFile(uri="a/file.csv", last_modified=datetime.now())) == 123
+
+    mock_s3_client.head_object.assert_called_once_with(Bucket="test", Key="a/file.csv")
+    mock_s3_client.get_object.assert_not_called()
+
+
+@pytest.mark.parametrize("globs", [["a/*.csv"], ["a/*.csv", "b/*.csv"]])
+def test_listing_manifest_lists_keys_after_the_last_listed_one(globs: List[str]) -> None:
+    reader = _listing_reader()
+    listing_manifest = {"a/": "a/file1.csv"}
+
+    def list_objects_v2(Bucket, Prefix, StartAfter=None, ContinuationToken=None):
+        keys = [f"{Prefix}file{i}.csv" for i in range(1, 4)]
+        keys = [key for key in keys if not StartAfter or key > StartAfter]
+        return {"Contents": [{"Key": key, "LastModified": datetime.now()} for key in keys], "KeyCount": len(keys)}
+
+    with patch.object(SourceS3StreamReader, "s3_client", new_callable=MagicMock) as mock_s3_client:
+        mock_s3_client.list_objects_v2 = MagicMock(side_effect=list_objects_v2)
+        files = list(reader.get_matching_files(globs, None, logger, listing_manifest=listing_manifest))
+
+    expected_uris = ["a/file2.csv", "a/file3.csv"] + (["b/file1.csv", "b/file2.csv", "b/file3.csv"] if len(globs) > 1 else [])
+    assert [file.uri for file in files] == expected_uris
+    assert listing_manifest == {"a/": "a/file3.csv", **({"b/": "b/file3.csv"} if len(globs) > 1 else {})}
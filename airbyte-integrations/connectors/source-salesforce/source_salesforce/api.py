@@ -3,7 +3,12 @@
 #
 
 import concurrent.futures
+import hashlib
+import json
 import logging
+import os
+import tempfile
+from email.utils import formatdate
 from typing import Any, List, Mapping, Optional, Tuple
 
 import requests  # type: ignore[import]
@@ -223,6 +228,13 @@ class Salesforce:
     logger = logging.getLogger("airbyte")
     version = "v57.0"
     parallel_tasks_size = 100
+    # Number of concurrent `describe` requests, the default of ThreadPoolExecutor, min(32, cpu + 4), when None:
+    # describing more objects at once mostly adds load on the API, where concurrent requests are limited per org
+    describe_workers: Optional[int] = None
+    # Directory of the cached `describe` responses, caching can be disabled by setting the variable to an empty string
+    DESCRIBE_CACHE_DIR_ENV = "SOURCE_SALESFORCE_DESCRIBE_CACHE_DIR"
+    # To increment when the cached responses change, so that the responses cached by previous versions are not used anymore
+    DESCRIBE_CACHE_VERSION = 1
     # https://developer.salesforce.com/docs/atlas.en-us.salesforce_app_limits_cheatsheet.meta/salesforce_app_limits_cheatsheet/salesforce_app_limits_platform_api.htm
     # Request Size Limits
     REQUEST_SIZE_LIMITS = 16_384
@@ -248,6 +260,8 @@ class Salesforce:
         adapter = request_adapters.HTTPAdapter(pool_connections=self.parallel_tasks_size, pool_maxsize=self.parallel_tasks_size)
         self.session.mount("https://", adapter)
         self._http_client = HttpClient("sf_api", self.logger, session=self.session, error_handler=SalesforceErrorHandler())
+        # A single pool for the `describe` requests of all the objects
+        self._describe_executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.describe_workers, thread_name_prefix="sf_describe")
 
         self.is_sandbox = is_sandbox in [True, "true"]
         if self.is_sandbox:
@@ -319,18 +333,68 @@ class Salesforce:
         self.instance_url = auth["instance_url"]
 
     def describe(self, sobject: str = None, sobject_options: Mapping[str, Any] = None) -> Mapping[str, Any]:
-        """Describes all objects or a specific object"""
+        """Describes all objects or a specific object, the cached description is used while Salesforce reports it is not modified"""
         headers = self._get_standard_headers()
 
         endpoint = "sobjects" if not sobject else f"sobjects/{sobject}/describe"
 
         url = f"{self.instance_url}/services/data/{self.version}/{endpoint}"
+        cache_path = self._describe_cache_path(endpoint)
+        cached_describe = self._read_cached_describe(cache_path) if cache_path else None
+        if cached_describe:
+            headers["If-Modified-Since"] = cached_describe["last_modified"]
         resp = self._make_request("GET", url, headers=headers)
+        if resp.status_code == 304 and cached_describe:
+            return cached_describe["response"]
         if resp.status_code == 404 and sobject:
             self.logger.error(f"not found a description for the sobject '{sobject}'. Sobject options: {sobject_options}")
         resp_json: Mapping[str, Any] = resp.json()
+        if cache_path and resp.ok:
+            last_modified = resp.headers.get("Date") or formatdate(usegmt=True)
+            self._write_cached_describe(cache_path, {"last_modified": last_modified, "response": resp_json})
         return resp_json
 
+    @property
+    def describe_cache_dir(self) -> Optional[str]:
+        default_dir = os.path.join(tempfile.gettempdir(), "airbyte-source-salesforce-describe")
+        return os.environ.get(self.DESCRIBE_CACHE_DIR_ENV, default_dir) or None
+
+    def _describe_cache_path(self, endpoint: str) -> Optional[str]:
+        """Path of the cached `describe` response of the endpoint, for the instance, the API version and the user"""
+        if not self.describe_cache_dir:
+            return None
+        key = {
+            "cache_version": self.DESCRIBE_CACHE_VERSION,
+            "instance_url": self.instance_url,
+            "version": self.version,
+            "endpoint": endpoint,
+            # the described fields depend on the permissions of the user, the key is hashed so the token is never written
+            "client_id": self.client_id,
+            "refresh_token": self.refresh_token or self.token,
+        }
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf8")).hexdigest()
+        return os.path.join(self.describe_cache_dir, f"{digest}.json")
+
+    def _read_cached_describe(self, path: str) -> Optional[Mapping[str, Any]]:
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            self.logger.info(f"Ignoring the cached description {path}: {repr(err)}")
+            return None
+
+    def _write_cached_describe(self, path: str, cached_describe: Mapping[str, Any]) -> None:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # written to a temporary file first, so that concurrent syncs never read a partial description
+            with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), suffix=".tmp", delete=False) as file:
+                json.dump(cached_describe, file)
+            os.replace(file.name, path)
+        except OSError as err:
+            self.logger.info(f"Failed to cache the description in {path}: {repr(err)}")
+
     def generate_schema(self, stream_name: str = None, stream_options: Mapping[str, Any] = None) -> Mapping[str, Any]:
         response = self.describe(stream_name, stream_options)
         schema = {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object", "additionalProperties": True, "properties": {}}
@@ -346,26 +410,20 @@ class Salesforce:
                 return name, None, str(e)
             return name, result, None
 
-        stream_names = list(stream_objects.keys())
-        # try to split all requests by chunks
+        # at most `describe_workers` objects are described at once
         stream_schemas = {}
-        for i in range(0, len(stream_names), self.parallel_tasks_size):
-            chunk_stream_names = stream_names[i : i + self.parallel_tasks_size]
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                for stream_name, schema, err in executor.map(
-                    lambda args: load_schema(*args), [(stream_name, stream_objects[stream_name]) for stream_name in chunk_stream_names]
-                ):
-                    if err:
-                        self.logger.error(f"Loading error of the {stream_name} schema: {err}")
-                        # Without schema information, the source can't determine the type of stream to instantiate and there might be issues
-                        # related to property chunking
-                        raise AirbyteTracedException(
-                            message=f"Schema could not be extracted for stream {stream_name}. Please retry later.",
-                            internal_message=str(err),
-                            failure_type=FailureType.system_error,
-                            stream_descriptor=StreamDescriptor(name=stream_name),
-                        )
-                    stream_schemas[stream_name] = schema
+        for stream_name, schema, err in self._describe_executor.map(lambda args: load_schema(*args), stream_objects.items()):
+            if err:
+                self.logger.error(f"Loading error of the {stream_name} schema: {err}")
+                # Without schema information, the source can't determine the type of stream to instantiate and there might be issues
+                # related to property chunking
+                raise AirbyteTracedException(
+                    message=f"Schema could not be extracted for stream {stream_name}. Please retry later.",
+                    internal_message=str(err),
+                    failure_type=FailureType.system_error,
+                    stream_descriptor=StreamDescriptor(name=stream_name),
+                )
+            stream_schemas[stream_name] = schema
         return stream_schemas
 
     @staticmethod
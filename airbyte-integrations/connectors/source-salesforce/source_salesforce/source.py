@@ -156,6 +156,7 @@ class SourceSalesforce(ConcurrentSourceAdapter):
             "start_date": config.get("start_date"),
             "job_tracker": self._job_tracker,
             "message_repository": self.message_repository,
+            "property_chunks_concurrency": config.get("property_chunks_concurrency", 1),
         }
 
         api_type = self._get_api_type(stream_name, json_schema, config.get("force_use_bulk_api", False))
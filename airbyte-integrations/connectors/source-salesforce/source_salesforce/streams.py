@@ -4,10 +4,13 @@
 
 import csv
 import ctypes
+import json
+import sqlite3
 import urllib.parse
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
 import pendulum
 import requests  # type: ignore[import]
@@ -78,11 +81,13 @@ class SalesforceStream(HttpStream, ABC):
         sobject_options: Mapping[str, Any] = None,
         schema: dict = None,
         start_date=None,
+        property_chunks_concurrency: int = 1,
         **kwargs,
     ):
         self.stream_name = stream_name
         self.pk = pk
         self.sf_api = sf_api
+        self.property_chunks_concurrency = property_chunks_concurrency
         super().__init__(**kwargs)
         self.schema: Mapping[str, Any] = schema  # type: ignore[assignment]
         self.sobject_options = sobject_options
@@ -178,8 +183,70 @@ class PropertyChunk:
         self.next_page = None
 
 
+class PartialRecords:
+    """
+    Keeps the parts of the records read by the different property chunks, by primary key, until every chunk has read the record.
+    Up to `max_records_in_memory` incomplete records are kept in memory, the parts of the other ones are spilled to a temporary
+    SQLite database on disk, which is removed once closed.
+    """
+
+    def __init__(self, chunks_count: int, max_records_in_memory: int):
+        self.chunks_count = chunks_count
+        self.max_records_in_memory = max_records_in_memory
+        self._records: Dict[Any, Tuple[MutableMapping[str, Any], int]] = {}
+        self._spilled_records: Optional[sqlite3.Connection] = None
+
+    def _spill(self, record_id: Any, partial_record: Mapping[str, Any], counter: int) -> None:
+        if not self._spilled_records:
+            # an empty filename stands for a private temporary database on disk
+            self._spilled_records = sqlite3.connect("", isolation_level=None, check_same_thread=False)
+            self._spilled_records.execute("PRAGMA journal_mode = OFF")
+            self._spilled_records.execute("PRAGMA synchronous = OFF")
+            self._spilled_records.execute("CREATE TABLE records (id PRIMARY KEY, record TEXT NOT NULL, counter INTEGER NOT NULL)")
+        self._spilled_records.execute("INSERT INTO records VALUES (?, ?, ?)", (record_id, json.dumps(partial_record), counter))
+
+    def _pop(self, record_id: Any) -> Tuple[MutableMapping[str, Any], int]:
+        if record_id in self._records:
+            return self._records.pop(record_id)
+        if self._spilled_records:
+            row = self._spilled_records.execute("SELECT record, counter FROM records WHERE id = ?", (record_id,)).fetchone()
+            if row:
+                self._spilled_records.execute("DELETE FROM records WHERE id = ?", (record_id,))
+                return json.loads(row[0]), row[1]
+        return {}, 0
+
+    def add(self, record_id: Any, record: Mapping[str, Any]) -> Optional[MutableMapping[str, Any]]:
+        """
+        Adds the part of the record read by a chunk, returns the complete record once every chunk has read it.
+        """
+        partial_record, counter = self._pop(record_id)
+        partial_record.update(record)
+        counter += 1
+        if counter == self.chunks_count:
+            return partial_record
+        if len(self._records) < self.max_records_in_memory:
+            self._records[record_id] = (partial_record, counter)
+        else:
+            self._spill(record_id, partial_record, counter)
+        return None
+
+    def incomplete_record_ids(self) -> List[Any]:
+        record_ids = list(self._records)
+        if self._spilled_records:
+            record_ids.extend(record_id for record_id, in self._spilled_records.execute("SELECT id FROM records"))
+        return record_ids
+
+    def close(self) -> None:
+        self._records.clear()
+        if self._spilled_records:
+            self._spilled_records.close()
+            self._spilled_records = None
+
+
 class RestSalesforceStream(SalesforceStream):
     state_converter = IsoMillisConcurrentStreamStateConverter(is_sequential_state=False)
+    # the incomplete records kept in memory while the property chunks are read, the next ones are spilled to disk
+    max_partial_records_in_memory = 100_000
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -264,6 +331,19 @@ class RestSalesforceStream(SalesforceStream):
             return None
         return min(non_exhausted_chunks, key=non_exhausted_chunks.get)
 
+    def _next_chunk_ids(self, property_chunks: Mapping[int, PropertyChunk]) -> List[int]:
+        """
+        Figure out which chunks are going to be read next, their pages are requested concurrently.
+        When the chunks are read concurrently, the next page of every non-exhausted chunk is read,
+        so the chunks keep reading the same records.
+        """
+        if self.property_chunks_concurrency > 1:
+            return [
+                chunk_id for chunk_id, property_chunk in property_chunks.items() if property_chunk.first_time or property_chunk.next_page
+            ]
+        chunk_id = self._next_chunk_id(property_chunks)
+        return [] if chunk_id is None else [chunk_id]
+
     def _read_pages(
         self,
         records_generator_fn: Callable[
@@ -273,62 +353,60 @@ class RestSalesforceStream(SalesforceStream):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
-        records_by_primary_key = {}
         property_chunks: Mapping[int, PropertyChunk] = {
             index: PropertyChunk(properties=properties) for index, properties in enumerate(self.chunk_properties())
         }
-        while True:
-            chunk_id = self._next_chunk_id(property_chunks)
-            if chunk_id is None:
-                # pagination complete
-                break
+        partial_records = PartialRecords(len(property_chunks), self.max_partial_records_in_memory)
 
+        def fetch_next_page(chunk_id: int) -> Tuple[requests.PreparedRequest, requests.Response]:
             property_chunk = property_chunks[chunk_id]
-            request, response = self._fetch_next_page_for_chunk(
-                stream_slice, stream_state, property_chunk.next_page, property_chunk.properties
-            )
+            return self._fetch_next_page_for_chunk(stream_slice, stream_state, property_chunk.next_page, property_chunk.properties)
 
-            # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the next chunk
-            if property_chunk.first_time:
-                property_chunk.first_time = False
-            property_chunk.next_page = self.next_page_token(response)
-            chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
-            if not self.too_many_properties:
-                # this is the case when a stream has no primary key
-                # (it is allowed when properties length does not exceed the maximum value)
-                # so there would be a single chunk, therefore we may and should yield records immediately
-                for record in chunk_page_records:
-                    property_chunk.record_counter += 1
-                    yield record
-                continue
-
-            # stick together different parts of records by their primary key and emit if a record is complete
-            for record in chunk_page_records:
-                property_chunk.record_counter += 1
-                record_id = record[self.primary_key]
-                if record_id not in records_by_primary_key:
-                    records_by_primary_key[record_id] = (record, 1)
-                    continue
-                partial_record, counter = records_by_primary_key[record_id]
-                partial_record.update(record)
-                counter += 1
-                if counter == len(property_chunks):
-                    yield partial_record  # now it's complete
-                    records_by_primary_key.pop(record_id)
-                else:
-                    records_by_primary_key[record_id] = (partial_record, counter)
-
-        # Process what's left.
-        # Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
-        # there's a chance that the number of records corresponding to the query may change between the calls.
-        # Select 'a', 'b' from table order by pk -> returns records with ids `1`, `2`
-        #   <insert smth.>
-        # Select 'c', 'd' from table order by pk -> returns records with ids `1`, `3`
-        # Then records `2` and `3` would be incomplete.
-        # This may result in data inconsistency. We skip such records for now and log a warning message.
-        incomplete_record_ids = ",".join([str(key) for key in records_by_primary_key])
-        if incomplete_record_ids:
-            self.logger.warning(f"Inconsistent record(s) with primary keys {incomplete_record_ids} found. Skipping them.")
+        try:
+            with ThreadPoolExecutor(max_workers=self.property_chunks_concurrency) as executor:
+                while True:
+                    chunk_ids = self._next_chunk_ids(property_chunks)
+                    if not chunk_ids:
+                        # pagination complete
+                        break
+
+                    for chunk_id, (request, response) in zip(chunk_ids, executor.map(fetch_next_page, chunk_ids)):
+                        property_chunk = property_chunks[chunk_id]
+                        # When this is the first time we're getting a chunk's records,
+                        # we set this to False to be used when deciding the next chunk
+                        if property_chunk.first_time:
+                            property_chunk.first_time = False
+                        property_chunk.next_page = self.next_page_token(response)
+                        chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
+                        if not self.too_many_properties:
+                            # this is the case when a stream has no primary key
+                            # (it is allowed when properties length does not exceed the maximum value)
+                            # so there would be a single chunk, therefore we may and should yield records immediately
+                            for record in chunk_page_records:
+                                property_chunk.record_counter += 1
+                                yield record
+                            continue
+
+                        # stick together different parts of records by their primary key and emit if a record is complete
+                        for record in chunk_page_records:
+                            property_chunk.record_counter += 1
+                            complete_record = partial_records.add(record[self.primary_key], record)
+                            if complete_record is not None:
+                                yield complete_record
+
+            # Process what's left.
+            # Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
+            # there's a chance that the number of records corresponding to the query may change between the calls.
+            # Select 'a', 'b' from table order by pk -> returns records with ids `1`, `2`
+            #   <insert smth.>
+            # Select 'c', 'd' from table order by pk -> returns records with ids `1`, `3`
+            # Then records `2` and `3` would be incomplete.
+            # This may result in data inconsistency. We skip such records for now and log a warning message.
+            incomplete_record_ids = ",".join([str(key) for key in partial_records.incomplete_record_ids()])
+            if incomplete_record_ids:
+                self.logger.warning(f"Inconsistent record(s) with primary keys {incomplete_record_ids} found. Skipping them.")
+        finally:
+            partial_records.close()
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
@@ -837,6 +915,7 @@ class BulkSalesforceStream(SalesforceStream):
             authenticator=self._http_client._session.auth,
             job_tracker=self._job_tracker,
             message_repository=self._message_repository,
+            property_chunks_concurrency=self.property_chunks_concurrency,
         )
         new_cls: Type[SalesforceStream] = RestSalesforceStream
         if isinstance(self, BulkIncrementalSalesforceStream):
@@ -6,6 +6,7 @@ import csv
 import io
 import logging
 import re
+import urllib.parse
 from datetime import datetime, timedelta
 from typing import List
 from unittest.mock import Mock
@@ -39,6 +40,7 @@ from source_salesforce.streams import (
     BulkSalesforceStream,
     BulkSalesforceSubStream,
     IncrementalRestSalesforceStream,
+    PartialRecords,
     RestSalesforceStream,
 )
 
@@ -451,6 +453,29 @@ def _get_streams(stream_config, stream_names, catalog_stream_names, sync_type) -
         return source.streams(config=stream_config)
 
 
+def test_describe_is_cached_until_modified(stream_config, describe_cache_dir, requests_mock):
+    sf_object = Salesforce(**stream_config)
+    sf_object.instance_url = "https://fase-account.salesforce.com"
+    describe_response = {"fields": [{"name": "Id", "type": "id"}]}
+    requests_mock.get(
+        f"{sf_object.instance_url}/services/data/{sf_object.version}/sobjects/Account/describe",
+        [
+            {"json": describe_response, "headers": {"Date": "Sun, 18 Oct 2026 10:00:00 GMT"}},
+            {"status_code": 304},
+            {"json": {"fields": []}},
+        ],
+    )
+
+    assert sf_object.describe("Account") == describe_response
+    assert "If-Modified-Since" not in requests_mock.last_request.headers
+    # not modified since
+    assert sf_object.describe("Account") == describe_response
+    assert requests_mock.last_request.headers["If-Modified-Since"] == "Sun, 18 Oct 2026 10:00:00 GMT"
+    # modified since
+    assert sf_object.describe("Account") == {"fields": []}
+    assert len(list(describe_cache_dir.iterdir())) == 1
+
+
 def test_csv_field_size_limit():
     DEFAULT_CSV_FIELD_SIZE_LIMIT = 1024 * 128
 
@@ -543,6 +568,44 @@ def test_stream_with_no_records_in_response(stream_config, stream_api_v2_pk_too_
     assert records == []
 
 
+def test_too_many_properties_with_concurrent_property_chunks(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
+    stream = generate_stream("Account", dict(stream_config, property_chunks_concurrency=2), stream_api_v2_pk_too_many_properties)
+    # spill every incomplete record but one to disk
+    stream.max_partial_records_in_memory = 1
+    chunks = list(stream.chunk_properties())
+    url = "https://fase-account.salesforce.com/services/data/v57.0/queryAll"
+
+    def chunk_page(request, context):
+        if "/chunk-" in request.path:
+            # the second and last page of the chunk
+            chunk_index, record_ids = int(request.path.rsplit("-", 1)[1]), [3, 4]
+            next_records_url = None
+        else:
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)["q"][0]
+            chunk_index = next(index for index, chunk in enumerate(chunks) if query.startswith(f"SELECT {','.join(chunk)} "))
+            record_ids, next_records_url = [1, 2], f"/services/data/v57.0/queryAll/chunk-{chunk_index}"
+        records = [{"Id": record_id, f"property{chunk_index}": chunk_index} for record_id in record_ids]
+        return {"records": records, "nextRecordsUrl": next_records_url}
+
+    requests_mock.get(re.compile(re.escape(url)), json=chunk_page)
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert records == [{"Id": record_id, **{f"property{index}": index for index in range(len(chunks))}} for record_id in [1, 2, 3, 4]]
+    assert len(requests_mock.request_history) == 2 * len(chunks)
+
+
+def test_partial_records_spill_to_disk() -> None:
+    partial_records = PartialRecords(chunks_count=2, max_records_in_memory=1)
+    for record_id in [1, 2, 3]:
+        assert partial_records.add(record_id, {"Id": record_id, "propertyA": "A"}) is None
+    assert sorted(partial_records.incomplete_record_ids()) == [1, 2, 3]
+
+    assert partial_records.add(2, {"Id": 2, "propertyB": "B"}) == {"Id": 2, "propertyA": "A", "propertyB": "B"}
+    assert partial_records.add(1, {"Id": 1, "propertyB": "B"}) == {"Id": 1, "propertyA": "A", "propertyB": "B"}
+    assert partial_records.incomplete_record_ids() == [3]
+    partial_records.close()
+
+
 @freezegun.freeze_time("2023-04-01")
 def test_bulk_stream_request_params_states(stream_config_date_format, stream_api, bulk_catalog, requests_mock):
     """Check that request params ignore records cursor and use start date from slice ONLY"""
@@ -25,6 +25,13 @@ def time_sleep_mock(mocker):
     yield time_mock
 
 
+@pytest.fixture(autouse=True)
+def describe_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "describe"
+    monkeypatch.setenv(Salesforce.DESCRIBE_CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture(scope="module")
 def bulk_catalog():
     with (pathlib.Path(__file__).parent / "bulk_catalog.json").open() as f:
@@ -4,8 +4,11 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from os import remove
+from queue import Full, Queue
+from threading import Event, Thread
 from time import sleep, time
-from typing import Any, Final, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Final, Iterable, List, Mapping, Optional
 
 import pendulum as pdm
 import requests
@@ -21,6 +24,9 @@ from .retry import bulk_retry_on_exception
 from .status import ShopifyBulkJobStatus
 from .tools import END_OF_FILE, BulkTools
 
+# marks the end of the BULK Job result download
+_DOWNLOAD_DONE: Final[object] = object()
+
 
 @dataclass
 class ShopifyBulkManager:
@@ -33,9 +39,15 @@ class ShopifyBulkManager:
 
     parent_stream_name: Optional[str] = None
     parent_stream_cursor: Optional[str] = None
+    # parse the BULK Job result while it's downloaded, instead of saving the whole result to the file first
+    job_result_streaming: bool = True
+    # while streaming, spool the downloaded result to the file, so the download never waits for the parsing
+    job_result_spool: bool = False
 
     # 10Mb chunk size to save the file
     _retrieve_chunk_size: Final[int] = 1024 * 1024 * 10
+    # how many chunks are downloaded ahead of the parsing, while streaming without spool
+    _retrieve_chunks_ahead: Final[int] = 4
     _job_max_retries: Final[int] = 6
     _job_backoff_time: int = 5
 
@@ -56,6 +68,8 @@ class ShopifyBulkManager:
     _job_state: str = field(init=False, default=None)  # this string is based on ShopifyBulkJobStatus
     # completed and saved Bulk Job result filename
     _job_result_filename: Optional[str] = field(init=False, default=None)
+    # completed Bulk Job result url, to stream the result from
+    _job_result_url: Optional[str] = field(init=False, default=None)
     # date-time when the Bulk Job was created on the server
     _job_created_at: Optional[str] = field(init=False, default=None)
     # indicated whether or not we manually force-cancel the current job
@@ -194,6 +208,8 @@ class ShopifyBulkManager:
         self._job_state = None
         # reset the filename to default
         self._job_result_filename = None
+        # reset the result url to default
+        self._job_result_url = None
         # setting self-cancelation to default
         self._job_self_canceled = False
         # set the running job message counter to default
@@ -261,8 +277,12 @@ class ShopifyBulkManager:
         partial_result_url = parsed_response.get("partialDataUrl") if parsed_response else None
         job_result_url = full_result_url if full_result_url else partial_result_url
         if job_result_url:
-            # save to local file using chunks to avoid OOM
             filename = self._tools.filename_from_url(job_result_url)
+            if self.job_result_streaming:
+                # the result is downloaded while the records are produced, see `_job_stream_result`
+                self._job_result_url = job_result_url
+                return filename
+            # save to local file using chunks to avoid OOM
             _, response = self.http_client.send_request(http_method="GET", url=job_result_url, request_kwargs={"stream": True})
             response.raise_for_status()
             with open(filename, "wb") as file:
@@ -272,6 +292,98 @@ class ShopifyBulkManager:
                 file.write(END_OF_FILE.encode())
             return filename
 
+    def _job_download_result(self, url: str, on_chunk: Callable[[bytes], bool]) -> None:
+        """
+        Downloads the BULK Job result in chunks, passed to `on_chunk` until it returns False.
+        When the connection drops, the download is resumed from the last byte received, using the `Range` header.
+        """
+        downloaded, retries = 0, 0
+        while True:
+            headers = {"Range": f"bytes={downloaded}-"} if downloaded else None
+            try:
+                _, response = self.http_client.send_request(http_method="GET", url=url, headers=headers, request_kwargs={"stream": True})
+                response.raise_for_status()
+                # the whole result is sent again, when the `Range` header is not supported
+                skip = downloaded if response.status_code != requests.codes.partial_content else 0
+                for chunk in response.iter_content(chunk_size=self._retrieve_chunk_size):
+                    chunk_size, chunk = len(chunk), chunk[skip:]
+                    skip = max(0, skip - chunk_size)
+                    if not chunk:
+                        continue
+                    if not on_chunk(chunk):
+                        return
+                    downloaded += len(chunk)
+                return
+            except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError) as e:
+                retries += 1
+                if retries > self._job_max_retries:
+                    raise
+                LOGGER.warning(
+                    f"Stream: `{self.http_client.name}`, the BULK Job result download failed after {downloaded} bytes: {repr(e)}. Resuming {retries}/{self._job_max_retries} after {self._job_backoff_time} sec."
+                )
+                sleep(self._job_backoff_time)
+
+    def _job_stream_result(self, url: str, filename: str) -> Iterable[bytes]:
+        """
+        Yields the chunks of the BULK Job result, while the next ones are downloaded in the background.
+
+        Without spool, at most `_retrieve_chunks_ahead` chunks are kept in memory and the download waits for the parsing.
+        With spool, the chunks are saved to the `filename` as soon as they are downloaded and read back from it,
+        so a slow parsing never leaves the download connection idle. The file is removed once the result is read.
+        """
+        chunks: Queue = Queue(maxsize=0 if self.job_result_spool else self._retrieve_chunks_ahead)
+        stop = Event()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=self._job_check_interval)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def download() -> None:
+            try:
+                if self.job_result_spool:
+                    with open(filename, "wb") as spool:
+
+                        def spool_chunk(chunk: bytes) -> bool:
+                            spool.write(chunk)
+                            spool.flush()
+                            return put(len(chunk))
+
+                        self._job_download_result(url, spool_chunk)
+                else:
+                    self._job_download_result(url, put)
+                put(_DOWNLOAD_DONE)
+            except Exception as e:
+                put(e)
+
+        Thread(target=download, name=f"{self.http_client.name}-bulk-result", daemon=True).start()
+        spool_reader = None
+        try:
+            while True:
+                item = chunks.get()
+                if item is _DOWNLOAD_DONE:
+                    return
+                elif isinstance(item, Exception):
+                    raise item
+                elif self.job_result_spool:
+                    spool_reader = spool_reader or open(filename, "rb")
+                    yield spool_reader.read(item)
+                else:
+                    yield item
+        finally:
+            stop.set()
+            if spool_reader:
+                spool_reader.close()
+            if self.job_result_spool:
+                try:
+                    remove(filename)
+                except OSError:
+                    pass
+
     def _job_get_checkpointed_result(self, response: Optional[requests.Response]) -> None:
         if self._job_any_lines_collected or self._job_should_checkpoint:
             # set the flag to adjust the next slice from the checkpointed cursor value
@@ -377,7 +489,7 @@ class ShopifyBulkManager:
         if self._job_state and errors:
             self._on_job_with_errors(errors)
 
-    def _job_track_running(self) -> None:
+    def _job_get_status(self) -> requests.Response:
         _, response = self.http_client.send_request(
             http_method="POST",
             url=self.base_url,
@@ -387,6 +499,10 @@ class ShopifyBulkManager:
         )
         self._job_healthcheck(response)
         self._job_update_state(response)
+        return response
+
+    def _job_track_running(self) -> None:
+        response = self._job_get_status()
         self._job_state_to_fn_map.get(self._job_state)(response=response)
 
     def _has_running_concurrent_job(self, errors: Optional[Iterable[Mapping[str, Any]]] = None) -> bool:
@@ -443,8 +559,39 @@ class ShopifyBulkManager:
             else:
                 self._job_track_running()
 
+    @bulk_retry_on_exception()
+    def job_poll(self) -> bool:
+        """
+        Checks the status of the created BULK Job once, without waiting for it, nor canceling it when it runs for too long.
+        Returns True, once the Job is COMPLETED and its result is ready to be processed with `job_get_results`.
+
+        The FAILED Job is never checkpointed: the polled Jobs run next to each other, there is no next slice to continue from.
+        """
+        response = self._job_get_status()
+        if self._job_completed():
+            self._on_completed_job(response=response)
+            return True
+        elif self._job_failed():
+            raise ShopifyBulkExceptions.BulkJobFailed(
+                f"The BULK Job: `{self._job_id}` exited with {self._job_state}, details: {response.text}",
+            )
+        elif self._job_state in [
+            ShopifyBulkJobStatus.CANCELED.value,
+            ShopifyBulkJobStatus.TIMEOUT.value,
+            ShopifyBulkJobStatus.ACCESS_DENIED.value,
+        ]:
+            # raises the corresponding error
+            self._job_state_to_fn_map.get(self._job_state)(response=response)
+        return False
+
     @bulk_retry_on_exception()
     def create_job(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+        self._job_create(stream_slice, filter_field)
+
+    def _job_create(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+        """
+        Creates the BULK Job for the slice, without retries: see `create_job`.
+        """
         if stream_slice:
             query = self.query.get(filter_field, stream_slice["start"], stream_slice["end"])
         else:
@@ -524,7 +671,10 @@ class ShopifyBulkManager:
         LOGGER.info(f"{final_message}")
 
     def _process_bulk_results(self) -> Iterable[Mapping[str, Any]]:
-        if self._job_result_filename:
+        if self._job_result_url:
+            # produce records from the bulk job result, while it's downloaded
+            yield from self.record_producer.read_chunks(self._job_stream_result(self._job_result_url, self._job_result_filename))
+        elif self._job_result_filename:
             # produce records from saved bulk job result
             yield from self.record_producer.read_file(self._job_result_filename)
         else:
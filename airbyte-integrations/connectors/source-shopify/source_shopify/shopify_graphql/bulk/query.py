@@ -6,6 +6,7 @@
 from abc import abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from string import Template
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
@@ -86,7 +87,7 @@ class ShopifyBulkQuery:
     def shop_id(self) -> int:
         return self.config.get("shop_id")
 
-    @property
+    @cached_property
     def tools(self) -> BulkTools:
         return BulkTools()
 
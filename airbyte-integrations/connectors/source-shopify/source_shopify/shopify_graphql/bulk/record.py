@@ -12,7 +12,7 @@ from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optio
 
 from source_shopify.utils import LOGGER
 
-from .exceptions import ShopifyBulkExceptions
+from .exceptions import AirbyteTracedException, ShopifyBulkExceptions
 from .query import ShopifyBulkQuery
 from .tools import END_OF_FILE, BulkTools
 
@@ -51,7 +51,9 @@ class ShopifyBulkRecord:
         process_line(jsonl_file): Processes a JSON Lines (jsonl) file and yields records.
         record_resolve_id(record): Resolves and updates the 'id' field in the given record.
         produce_records(filename): Reads the JSONL content saved from `job.job_retrieve_result()` line-by-line to avoid OOM.
+        produce_records_from_lines(lines): Produces records from JSONL lines.
         read_file(filename, remove_file): Reads a file and produces records from it.
+        read_chunks(chunks): Splits the chunks of JSONL content into lines, while they are downloaded, and produces records from them.
     """
 
     query: ShopifyBulkQuery
@@ -73,7 +75,8 @@ class ShopifyBulkRecord:
 
     @cached_property
     def tools(self) -> BulkTools:
-        return BulkTools()
+        # share the field names translated by the query
+        return self.query.tools
 
     @cached_property
     def has_parent_stream(self) -> bool:
@@ -334,12 +337,47 @@ class ShopifyBulkRecord:
         """
 
         with open(filename, "r") as jsonl_file:
-            # reset the counter
-            self.record_composed = 0
+            yield from self.produce_records_from_lines(jsonl_file)
 
-            for record in self.process_line(jsonl_file):
-                yield self.tools.fields_names_to_snake_case(record)
-                self.record_composed += 1
+    def produce_records_from_lines(self, lines: Iterable[str]) -> Iterable[MutableMapping[str, Any]]:
+        """
+        Produce records from JSON Lines (jsonl) content, converting the field names to snake_case.
+
+        Args:
+            lines (Iterable[str]): The lines of the JSONL content.
+
+        Yields:
+            MutableMapping[str, Any]: A dictionary representing a processed record with field names in snake_case.
+        """
+
+        # reset the counter
+        self.record_composed = 0
+
+        for record in self.process_line(lines):
+            yield self.tools.fields_names_to_snake_case(record)
+            self.record_composed += 1
+
+    @staticmethod
+    def split_lines(chunks: Iterable[bytes]) -> Iterable[str]:
+        """
+        Split the chunks of JSONL content into lines, a line could span several chunks.
+
+        Args:
+            chunks (Iterable[bytes]): The chunks of the JSONL content, in order.
+
+        Yields:
+            str: The lines of the JSONL content, without the line breaks.
+        """
+
+        incomplete_line = b""
+        for chunk in chunks:
+            lines = (incomplete_line + chunk).split(b"\n")
+            # the last line is completed by the next chunk
+            incomplete_line = lines.pop()
+            for line in lines:
+                yield line.decode("utf-8")
+        if incomplete_line:
+            yield incomplete_line.decode("utf-8")
 
     def read_file(self, filename: str, remove_file: Optional[bool] = True) -> Iterable[Mapping[str, Any]]:
         """
@@ -380,3 +418,27 @@ class ShopifyBulkRecord:
                 except Exception as e:
                     LOGGER.info(f"Failed to remove the `tmp job result` file, the file doen't exist. Details: {repr(e)}.")
                     pass
+
+    def read_chunks(self, chunks: Iterable[bytes]) -> Iterable[Mapping[str, Any]]:
+        """
+        Produce records from the chunks of the JSONL content, while they are downloaded from the BULK Job result url.
+
+        Args:
+            chunks (Iterable[bytes]): The chunks of the JSONL content, in order.
+
+        Yields:
+            Iterable[Mapping[str, Any]]: An iterable of records produced from the chunks.
+
+        Raises:
+            ShopifyBulkExceptions.BulkRecordProduceError: If an error occurs while producing records from the chunks.
+        """
+
+        try:
+            yield from self.produce_records_from_lines(self.split_lines(chunks))
+        except AirbyteTracedException:
+            # the download errors are raised as is
+            raise
+        except Exception as e:
+            raise ShopifyBulkExceptions.BulkRecordProduceError(
+                f"An error occured while producing records from BULK Job result. Trace: {repr(e)}.",
+            )
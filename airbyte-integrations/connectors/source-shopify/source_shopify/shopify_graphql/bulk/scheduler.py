@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from dataclasses import dataclass, field, replace
+from time import sleep
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from source_shopify.utils import LOGGER
+
+from .exceptions import ShopifyBulkExceptions
+from .job import ShopifyBulkManager
+from .retry import BULK_RETRY_ERRORS
+
+
+@dataclass
+class ShopifyBulkJobScheduler:
+    """
+    Runs the BULK Jobs of the scheduled slices concurrently: up to `concurrency` Jobs are in flight, all of them are polled on each round
+    and the results are produced in the order of the slices, so the stream state never moves past a slice that is not completed yet.
+
+    Every Job is tracked by its own copy of the `manager`, sharing the `record_producer` of the `manager`, to keep tracking the parent
+    stream state across the slices. The Jobs are neither checkpointed nor canceled when they run for too long, since the next slices
+    are already requested. The FAILED Job is created again for the same slice, up to `_job_max_retries` times.
+    """
+
+    manager: ShopifyBulkManager
+    filter_field: str
+    concurrency: int
+
+    # the scheduled slices, which Jobs are not created yet
+    _slices: List[Mapping[str, str]] = field(init=False, default_factory=list)
+    # the created Jobs, by slice, in the order of the slices
+    _jobs: Dict[Tuple[str, str], ShopifyBulkManager] = field(init=False, default_factory=dict)
+    # how many times the Job of the slice has FAILED
+    _job_failures: Dict[Tuple[str, str], int] = field(init=False, default_factory=dict)
+
+    @staticmethod
+    def _slice_key(stream_slice: Mapping[str, str]) -> Tuple[str, str]:
+        return stream_slice["start"], stream_slice["end"]
+
+    def schedule(self, slices: Iterable[Mapping[str, str]]) -> List[Mapping[str, str]]:
+        """
+        Schedules the slices to create the Jobs for, ahead of reading them, returns the scheduled slices.
+        """
+        self._slices = list(slices)
+        return list(self._slices)
+
+    def _new_job(self) -> ShopifyBulkManager:
+        job = replace(self.manager)
+        job.record_producer = self.manager.record_producer
+        return job
+
+    def _submit(self, stream_slice: Mapping[str, str], wait: bool) -> bool:
+        """
+        Creates the Job for the slice, returns False when the Job couldn't be created without waiting.
+        """
+        job = self._new_job()
+        if wait:
+            job.create_job(stream_slice, self.filter_field)
+        else:
+            try:
+                job._job_create(stream_slice, self.filter_field)
+            except ShopifyBulkExceptions.BulkJobRedirectToOtherShopError:
+                # the next Jobs are created for the shop the request was redirected to
+                self.manager.base_url = job.base_url
+                return False
+            except (ShopifyBulkExceptions.BulkJobCreationFailedConcurrentError, *BULK_RETRY_ERRORS) as e:
+                LOGGER.info(
+                    f"Stream: `{self.manager.http_client.name}`, couldn't create the next BULK Job while other Jobs are running: {e}."
+                )
+                return False
+        self._jobs[self._slice_key(stream_slice)] = job
+        return True
+
+    def _submit_jobs(self) -> None:
+        while self._slices and len(self._jobs) < self.concurrency:
+            # wait for the Job to be created, only when there is no other Job to poll meanwhile
+            if not self._submit(self._slices[0], wait=not self._jobs):
+                return
+            self._slices.pop(0)
+
+    def _poll_jobs(self) -> None:
+        for key, job in self._jobs.items():
+            if job._job_completed():
+                continue
+            try:
+                job.job_poll()
+            except ShopifyBulkExceptions.BulkJobFailed:
+                self._job_failures[key] = self._job_failures.get(key, 0) + 1
+                if self._job_failures[key] > self.manager._job_max_retries:
+                    raise
+                LOGGER.warning(
+                    f"Stream: `{self.manager.http_client.name}`, the BULK Job: `{job._job_id}` for the slice {key} has FAILED, retrying {self._job_failures[key]}/{self.manager._job_max_retries}."
+                )
+                job.create_job({"start": key[0], "end": key[1]}, self.filter_field)
+
+    def _cancel_jobs(self) -> None:
+        for job in self._jobs.values():
+            if job._job_id and not job._job_completed():
+                try:
+                    job._job_cancel()
+                except Exception as e:
+                    LOGGER.info(
+                        f"Stream: `{self.manager.http_client.name}`, failed to cancel the BULK Job: `{job._job_id}`. Details: {repr(e)}."
+                    )
+        self._jobs.clear()
+
+    def get_results(self, stream_slice: Mapping[str, str]) -> Iterable[Mapping[str, Any]]:
+        """
+        Produces the records of the slice, once its Job is COMPLETED, while the Jobs of the next slices are running.
+        The running Jobs are canceled, when the records couldn't be produced.
+        """
+        key = self._slice_key(stream_slice)
+        try:
+            self._submit_jobs()
+            if key not in self._jobs:
+                # the slice was not scheduled
+                self._submit(stream_slice, wait=True)
+            job = self._jobs[key]
+            while True:
+                self._poll_jobs()
+                self._submit_jobs()
+                if job._job_completed():
+                    break
+                sleep(self.manager._job_check_interval)
+            yield from job.job_get_results()
+            self._jobs.pop(key)
+            self._job_failures.pop(key, None)
+        except (Exception, GeneratorExit):
+            self._cancel_jobs()
+            raise
@@ -14,9 +14,26 @@ from .exceptions import ShopifyBulkExceptions
 # default end line tag
 END_OF_FILE: str = "<end_of_file>"
 BULK_PARENT_KEY: str = "__parentId"
+# the numeric part of the `id`, like: `gid://shopify/Order/19435458986123`
+ID_PATTERN: re.Pattern = re.compile(r"\d+")
+ID_PREFIX: str = "gid://shopify/"
+
+
+class _SnakeCaseFieldNames(dict):
+    """
+    The table of the field names translated to snake case, each field name is translated once, on the first lookup.
+    """
+
+    def __missing__(self, field_name: str) -> str:
+        self[field_name] = field_name if field_name == BULK_PARENT_KEY else BulkTools.camel_to_snake(field_name)
+        return self[field_name]
 
 
 class BulkTools:
+    def __init__(self) -> None:
+        # the records of the same query have the same field names, translated once per `BulkTools` instance
+        self._snake_case_field_names: _SnakeCaseFieldNames = _SnakeCaseFieldNames()
+
     @staticmethod
     def camel_to_snake(camel_case: str) -> str:
         snake_case = []
@@ -83,7 +100,8 @@ class BulkTools:
         # transforming record field names from camel to snake case, leaving the `__parent_id` relation in place
         if dict_input:
             # the `None` type check is required, to properly handle nested missing entities (return None)
-            return {self.camel_to_snake(k) if dict_input and k != BULK_PARENT_KEY else k: v for k, v in dict_input.items()}
+            field_names = self._snake_case_field_names
+            return {field_names[k]: v for k, v in dict_input.items()}
 
     @staticmethod
     def resolve_str_id(
@@ -92,6 +110,12 @@ class BulkTools:
         # some fields that expected to be resolved as ids, might not be populated for the particular `RECORD`,
         # we should return `None` to make the field `null` in the output as the result of the transformation.
         if str_input:
-            return output_type(re.search(r"\d+", str_input).group())
+            # `gid://shopify/<Type>/<id>`, optionally followed by the `?<query>`, is split without the regular expression
+            if str_input.startswith(ID_PREFIX):
+                resource_type, _, resource_id = str_input[len(ID_PREFIX) :].partition("/")
+                resource_id = resource_id.partition("?")[0]
+                if resource_type.isalpha() and resource_id.isdecimal():
+                    return output_type(resource_id)
+            return output_type(ID_PATTERN.search(str_input).group())
         else:
             return None
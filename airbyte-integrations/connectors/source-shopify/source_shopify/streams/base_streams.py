@@ -21,6 +21,7 @@ from requests.exceptions import RequestException
 from source_shopify.http_request import ShopifyErrorHandler
 from source_shopify.shopify_graphql.bulk.job import ShopifyBulkManager
 from source_shopify.shopify_graphql.bulk.query import ShopifyBulkQuery
+from source_shopify.shopify_graphql.bulk.scheduler import ShopifyBulkJobScheduler
 from source_shopify.transform import DataTypeEnforcer
 from source_shopify.utils import EagerlyCachedStreamState as stream_state_cache
 from source_shopify.utils import ShopifyNonRetryableErrors
@@ -650,9 +651,17 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
             job_size=config.get("bulk_window_in_days", 30.0),
             # provide the job checkpoint interval value, default value is 200k lines collected
             job_checkpoint_interval=config.get("job_checkpoint_interval", 200_000),
+            # spool the BULK Job results to the disk while they are parsed, if requested
+            job_result_spool=config.get("job_result_spool", False),
             parent_stream_name=self.parent_stream_name,
             parent_stream_cursor=self.parent_stream_cursor,
         )
+        # run the BULK Jobs of the next slices concurrently, if requested
+        self.job_scheduler: ShopifyBulkJobScheduler = ShopifyBulkJobScheduler(
+            manager=self.job_manager,
+            filter_field=self.filter_field,
+            concurrency=config.get("job_concurrency", 1),
+        )
 
     @property
     def filter_by_state_checkpoint(self) -> bool:
@@ -791,7 +800,9 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
         slice_size_message = f"Slice size: `P{round(self.job_manager._job_size, 1)}D`"
         slice_message = f"Stream: `{self.name}` requesting BULK Job for period: {slice_start} -- {slice_end}. {slice_size_message}."
 
-        if self.job_manager._supports_checkpointing:
+        if self.concurrent_jobs:
+            checkpointing_message = f" The concurrent BULK Jobs are not checkpointed."
+        elif self.job_manager._supports_checkpointing:
             checkpointing_message = f" The BULK checkpoint after `{self.job_manager.job_checkpoint_interval}` lines."
         else:
             checkpointing_message = f" The BULK checkpointing is not supported."
@@ -802,9 +813,26 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
         if self.job_manager._job_adjust_slice_from_checkpoint:
             self.logger.info(f"Stream {self.name}, continue from checkpoint: `{self._checkpoint_cursor}`.")
 
+    @property
+    def concurrent_jobs(self) -> bool:
+        return bool(self.filter_field) and self.job_scheduler.concurrency > 1
+
+    def _concurrent_stream_slices(self, start: datetime, end: datetime) -> Iterable[Mapping[str, Any]]:
+        """
+        The slices of the concurrent BULK Jobs have the fixed size, since the Jobs of the next slices are created ahead of time.
+        """
+        while start < end:
+            slice_end = min(start.add(days=self.job_manager.job_size), end)
+            self.emit_slice_message(start, slice_end)
+            yield {"start": start.to_rfc3339_string(), "end": slice_end.to_rfc3339_string()}
+            start = slice_end
+
     @stream_state_cache.cache_stream_state
     def stream_slices(self, stream_state: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
-        if self.filter_field:
+        if self.concurrent_jobs:
+            start = pdm.parse(self._get_state_value(stream_state))
+            yield from self.job_scheduler.schedule(self._concurrent_stream_slices(start, pdm.now()))
+        elif self.filter_field:
             state = self._get_state_value(stream_state)
             start = pdm.parse(state)
             end = pdm.now()
@@ -843,12 +871,17 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
         stream_slice: Optional[Mapping[str, Any]] = None,
         stream_state: Optional[Mapping[str, Any]] = None,
     ) -> Iterable[StreamData]:
-        self.job_manager.create_job(stream_slice, self.filter_field)
+        if self.concurrent_jobs:
+            # the BULK Jobs are created ahead of time by the scheduler
+            results = self.job_scheduler.get_results(stream_slice)
+        else:
+            self.job_manager.create_job(stream_slice, self.filter_field)
+            results = self.job_manager.job_get_results()
         stream_state = stream_state_cache.cached_state.get(self.name, {self.cursor_field: self.default_state_comparison_value})
         # add `shop_url` field to each record produced
         records = self.add_shop_url_field(
             # produce records from saved bulk job result
-            self.job_manager.job_get_results()
+            results
         )
         # emit records in ASC order
         yield from self.filter_records_newer_than_state(stream_state, self.sort_output_asc(records))
@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures producing the records of a recorded BULK Job result of the `fulfillment_orders` stream, with the field names translated
+and the ids resolved as before (`camel_to_snake` for every key of every record and `re.search` for every id) and as now.
+
+From the connector directory run:
+
+    python -m unit_tests.graphql_bulk.benchmark_record --repeat 20000
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+from typing import List, Mapping, Optional, Union
+
+from source_shopify.shopify_graphql.bulk.query import FulfillmentOrder
+from source_shopify.shopify_graphql.bulk.record import ShopifyBulkRecord
+from source_shopify.shopify_graphql.bulk.tools import BULK_PARENT_KEY, BulkTools
+
+FIXTURE = Path(__file__).parent.parent / "resource" / "bulk" / "fulfillment_orders.jsonl"
+
+
+class PreviousBulkTools(BulkTools):
+    def fields_names_to_snake_case(self, dict_input: Optional[Mapping]) -> Optional[Mapping]:
+        if dict_input:
+            return {self.camel_to_snake(k) if dict_input and k != BULK_PARENT_KEY else k: v for k, v in dict_input.items()}
+
+    @staticmethod
+    def resolve_str_id(
+        str_input: Optional[str] = None, output_type: Optional[Union[int, str, float]] = int
+    ) -> Optional[Union[int, str, float]]:
+        if str_input:
+            return output_type(re.search(r"\d+", str_input).group())
+        else:
+            return None
+
+
+def produce_records(lines: List[str], tools: Optional[BulkTools]) -> float:
+    query = FulfillmentOrder({"shop_id": 0})
+    if tools:
+        query.tools = tools
+    record_producer = ShopifyBulkRecord(query)
+    start = time.perf_counter()
+    for _ in record_producer.produce_records_from_lines(lines):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20000, help="how many times the recorded result is repeated")
+    args = parser.parse_args()
+
+    lines = FIXTURE.read_text().splitlines(keepends=True) * args.repeat
+    print(f"{len(lines)} lines")
+    for name, tools in (("previous", PreviousBulkTools()), ("current", None)):
+        print(f"{name}: {produce_records(lines, tools):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -351,6 +351,8 @@ def test_job_running_with_canceled_scenario(mocker, request, requests_mock, runn
     
     stream.job_manager._job_id = job_id
     stream.job_manager._job_checkpoint_interval = 5
+    # save the result to the file, instead of streaming it
+    stream.job_manager.job_result_streaming = False
     # faking self-canceled job
     stream.job_manager._job_self_canceled = True
     # mocking the nested request call to retrieve the data from result URL
@@ -430,6 +432,48 @@ def test_bulk_stream_parse_response(
         assert test_records == expected_result
 
 
+@pytest.mark.parametrize("spool", [False, True], ids=["in memory", "spooled to disk"])
+def test_job_stream_result(tmp_path, requests_mock, auth_config, spool) -> None:
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager.job_result_spool = spool
+    stream.job_manager._retrieve_chunk_size = 4
+    stream.job_manager._retrieve_chunks_ahead = 1
+    result_url = "https://storage.googleapis.com/bulk-result"
+    content = b"".join(b'{"id": %d}\n' % i for i in range(100))
+    requests_mock.get(result_url, content=content)
+    filename = str(tmp_path / "bulk-123.jsonl")
+
+    assert b"".join(stream.job_manager._job_stream_result(result_url, filename)) == content
+    # the spooled result is removed once it's read
+    assert not (tmp_path / "bulk-123.jsonl").exists()
+
+
+@pytest.mark.parametrize(
+    "resumed_response_status, resumed_response_content",
+    [(206, [b"def"]), (200, [b"ab", b"cdef"])],
+    ids=["range supported", "range not supported"],
+)
+def test_job_download_result_resumes_after_connection_error(mocker, auth_config, resumed_response_status, resumed_response_content) -> None:
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager._job_backoff_time = 0
+
+    def dropped_connection(chunk_size):
+        yield b"abc"
+        raise requests.exceptions.ChunkedEncodingError("connection dropped")
+
+    dropped_response = mocker.Mock(status_code=200, iter_content=dropped_connection)
+    resumed_response = mocker.Mock(status_code=resumed_response_status, iter_content=lambda chunk_size: iter(resumed_response_content))
+    send_request = mocker.patch.object(stream.job_manager.http_client, "send_request")
+    send_request.side_effect = [(None, dropped_response), (None, resumed_response)]
+    chunks = []
+
+    stream.job_manager._job_download_result("https://storage.googleapis.com/bulk-result", lambda chunk: chunks.append(chunk) or True)
+
+    assert b"".join(chunks) == b"abcdef"
+    assert send_request.call_args_list[0].kwargs["headers"] is None
+    assert send_request.call_args_list[1].kwargs["headers"] == {"Range": "bytes=3-"}
+
+
 @pytest.mark.parametrize(
     "stream, stream_state, with_start_date, expected_start",
     [
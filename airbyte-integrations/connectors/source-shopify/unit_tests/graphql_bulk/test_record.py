@@ -207,3 +207,16 @@ def test_record_compose(basic_config, records_from_jsonl, record_composition, ex
         list(record_instance.record_compose(record))
 
     assert record_instance.buffer == expected
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b'{"id": 1}\n{"id"', b': 2}\n', b'{"id": 3}'], ['{"id": 1}', '{"id": 2}', '{"id": 3}']),
+        ([b'{"name": "\xc3', b'\xa9"}\n'], ['{"name": "é"}']),
+        ([], []),
+    ],
+    ids=["line across chunks", "character across chunks", "no chunks"],
+)
+def test_split_lines(chunks, expected) -> None:
+    assert list(ShopifyBulkRecord.split_lines(chunks)) == expected
@@ -0,0 +1,105 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+import pytest
+from source_shopify.shopify_graphql.bulk.exceptions import ShopifyBulkExceptions
+from source_shopify.shopify_graphql.bulk.job import ShopifyBulkManager
+from source_shopify.shopify_graphql.bulk.status import ShopifyBulkJobStatus
+from source_shopify.streams.streams import MetafieldOrders
+
+_SLICES = [
+    {"start": "2024-01-01T00:00:00+00:00", "end": "2024-01-02T00:00:00+00:00"},
+    {"start": "2024-01-02T00:00:00+00:00", "end": "2024-01-03T00:00:00+00:00"},
+    {"start": "2024-01-03T00:00:00+00:00", "end": "2024-01-04T00:00:00+00:00"},
+]
+
+
+@pytest.fixture
+def jobs(mocker):
+    """
+    Fakes the BULK Jobs: the Job of the slice is COMPLETED after the number of polls given by `polls_to_complete[slice start]`,
+    and produces a single record with its slice start.
+    """
+    events, polls_to_complete, failures = [], {}, {}
+
+    def create(job, stream_slice, filter_field):
+        job._job_id, job._job_state = stream_slice["start"], ShopifyBulkJobStatus.CREATED.value
+        events.append(("created", job._job_id))
+
+    def poll(job):
+        polls_to_complete[job._job_id] = polls_to_complete.get(job._job_id, 1) - 1
+        if failures.get(job._job_id):
+            failures[job._job_id] -= 1
+            raise ShopifyBulkExceptions.BulkJobFailed(f"The BULK Job: `{job._job_id}` exited with FAILED")
+        if polls_to_complete[job._job_id] <= 0:
+            job._job_state = ShopifyBulkJobStatus.COMPLETED.value
+        return job._job_completed()
+
+    def results(job):
+        events.append(("read", job._job_id))
+        yield {"start": job._job_id}
+
+    mocker.patch.object(ShopifyBulkManager, "_job_create", autospec=True, side_effect=create)
+    mocker.patch.object(ShopifyBulkManager, "job_poll", autospec=True, side_effect=poll)
+    mocker.patch.object(ShopifyBulkManager, "job_get_results", autospec=True, side_effect=results)
+    mocker.patch.object(ShopifyBulkManager, "_job_cancel", autospec=True, side_effect=lambda job: events.append(("canceled", job._job_id)))
+    return events, polls_to_complete, failures
+
+
+@pytest.fixture
+def scheduler(auth_config):
+    auth_config["job_concurrency"] = 2
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager._job_check_interval = 0
+    return stream.job_scheduler
+
+
+def test_scheduler_keeps_concurrent_jobs_in_flight_and_produces_results_in_slices_order(scheduler, jobs) -> None:
+    events, polls_to_complete, _ = jobs
+    # the Job of the first slice completes the last
+    polls_to_complete.update({_SLICES[0]["start"]: 3, _SLICES[1]["start"]: 1, _SLICES[2]["start"]: 1})
+
+    records = [record for stream_slice in scheduler.schedule(_SLICES) for record in scheduler.get_results(stream_slice)]
+
+    assert records == [{"start": stream_slice["start"]} for stream_slice in _SLICES]
+    assert events == [
+        ("created", _SLICES[0]["start"]),
+        ("created", _SLICES[1]["start"]),
+        ("read", _SLICES[0]["start"]),
+        ("created", _SLICES[2]["start"]),
+        ("read", _SLICES[1]["start"]),
+        ("read", _SLICES[2]["start"]),
+    ]
+
+
+def test_scheduler_creates_the_failed_job_again(scheduler, jobs) -> None:
+    events, _, failures = jobs
+    failures[_SLICES[0]["start"]] = 1
+
+    records = [record for stream_slice in scheduler.schedule(_SLICES[:1]) for record in scheduler.get_results(stream_slice)]
+
+    assert records == [{"start": _SLICES[0]["start"]}]
+    assert events.count(("created", _SLICES[0]["start"])) == 2
+
+
+def test_scheduler_cancels_the_running_jobs_on_error(scheduler, jobs) -> None:
+    events, polls_to_complete, failures = jobs
+    polls_to_complete[_SLICES[1]["start"]] = 10
+    failures[_SLICES[0]["start"]] = scheduler.manager._job_max_retries + 1
+
+    with pytest.raises(ShopifyBulkExceptions.BulkJobFailed):
+        list(scheduler.get_results(scheduler.schedule(_SLICES)[0]))
+
+    assert ("canceled", _SLICES[1]["start"]) in events
+
+
+@pytest.mark.parametrize(
+    "job_concurrency, filter_field, expected",
+    [(1, "updated_at", False), (2, "updated_at", True), (2, None, False)],
+    ids=["serial", "concurrent", "no filter field"],
+)
+def test_concurrent_jobs(auth_config, job_concurrency, filter_field, expected) -> None:
+    auth_config["job_concurrency"] = job_concurrency
+    stream = MetafieldOrders(auth_config)
+    stream.filter_field = filter_field
+    assert stream.concurrent_jobs == expected
@@ -52,3 +52,26 @@ def test_resolve_str_id() -> None:
     assert BulkTools.resolve_str_id("123") == 123
     assert BulkTools.resolve_str_id("456", str) == "456"
     assert BulkTools.resolve_str_id(None) is None
+
+
+def test_fields_names_to_snake_case_translates_each_field_name_once(mocker) -> None:
+    tools = BulkTools()
+    camel_to_snake = mocker.spy(BulkTools, "camel_to_snake")
+    for _ in range(3):
+        assert tools.fields_names_to_snake_case({"createdAt": 1, "__parentId": 2}) == {"created_at": 1, "__parentId": 2}
+    assert camel_to_snake.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "str_input, output_type, expected",
+    [
+        ("gid://shopify/Order/19435458986123", int, 19435458986123),
+        ("gid://shopify/Order/19435458986123", str, "19435458986123"),
+        ("gid://shopify/ProductImage/35439210283197?model_name=Product", int, 35439210283197),
+        ("gid://shopify/Metafield2/123", int, 2),
+        ("abc123", int, 123),
+    ],
+    ids=["gid", "gid as str", "gid with query", "type with digits", "not a gid"],
+)
+def test_resolve_str_id_from_gid(str_input, output_type, expected) -> None:
+    assert BulkTools.resolve_str_id(str_input, output_type) == expected
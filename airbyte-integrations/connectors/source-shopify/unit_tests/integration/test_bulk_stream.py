@@ -41,7 +41,7 @@ _INCREMENTAL_JOB_START_DATE_ISO = "2024-05-05T00:00:00+00:00"
 _INCREMENTAL_JOB_START_DATE = datetime.fromisoformat(_INCREMENTAL_JOB_START_DATE_ISO)
 _INCREMENTAL_JOB_END_DATE = _INCREMENTAL_JOB_START_DATE + timedelta(hours=24, minutes=0)
 
-def _get_config(start_date: datetime, bulk_window: int = 1, job_checkpoint_interval=200000) -> Dict[str, Any]:
+def _get_config(start_date: datetime, bulk_window: int = 1, job_checkpoint_interval=200000, job_concurrency=1) -> Dict[str, Any]:
     return {
         "start_date": start_date.strftime("%Y-%m-%d"),
         "shop": _SHOP_NAME,
@@ -50,7 +50,8 @@ def _get_config(start_date: datetime, bulk_window: int = 1, job_checkpoint_inter
             "api_password": "api_password",
         },
         "bulk_window_in_days": bulk_window,
-        "job_checkpoint_interval": job_checkpoint_interval
+        "job_checkpoint_interval": job_checkpoint_interval,
+        "job_concurrency": job_concurrency,
     }
 
 
@@ -187,6 +188,34 @@ class GraphQlBulkStreamTest(TestCase):
         assert output.errors == []
         assert len(output.records) == 2
 
+    def test_given_concurrent_jobs_when_read_then_extract_records_of_every_slice(self) -> None:
+        slice_end = _JOB_START_DATE + timedelta(days=1)
+        sync_date = slice_end + timedelta(hours=2, minutes=24)
+        next_bulk_operation_id = "gid://shopify/BulkOperation/4472588009662"
+        next_job_result_url = _JOB_RESULT_URL.replace("bulk-4476008693949", "bulk-4476008693950")
+        for start, end, bulk_operation_id, job_result_url, records_count in [
+            (_JOB_START_DATE, slice_end, _BULK_OPERATION_ID, _JOB_RESULT_URL, 2),
+            (slice_end, sync_date, next_bulk_operation_id, next_job_result_url, 1),
+        ]:
+            self._http_mocker.post(
+                create_job_creation_request(_SHOP_NAME, start, end),
+                JobCreationResponseBuilder().with_bulk_operation_id(bulk_operation_id).build(),
+            )
+            self._http_mocker.post(
+                create_job_status_request(_SHOP_NAME, bulk_operation_id),
+                JobStatusResponseBuilder().with_completed_status(bulk_operation_id, job_result_url).build(),
+            )
+            response_builder = MetafieldOrdersJobResponseBuilder()
+            for _ in range(records_count):
+                response_builder = response_builder.with_record()
+            self._http_mocker.get(HttpRequest(job_result_url), response_builder.build())
+
+        with freeze_time(sync_date):
+            output = self._read(_get_config(_JOB_START_DATE, job_concurrency=2))
+
+        assert output.errors == []
+        assert len(output.records) == 3
+
     def _read(self, config):
         catalog = CatalogBuilder().with_stream(_BULK_STREAM, SyncMode.full_refresh).build()
         output = read(SourceShopify(), config, catalog)